@@ -21,6 +21,19 @@ class Settings(BaseSettings):
   mongodb_host: str
   mongodb_port: int
   mongodb_db: str
+  news_mongodb_db: str = "news_analysis"  # 뉴스 기사/키워드 분석 DB
+  article_bulk_batch_size: int = 500  # 기사 일괄 저장 시 bulk_write 한 번에 보낼 문서 수
+  article_bloom_capacity: int = 2000000  # 저장 기사 블룸 필터 예상 기사 수
+  article_bloom_error_rate: float = 0.01  # 저장 기사 블룸 필터 오탐률
+  
+  # MongoDB 커넥션 풀 설정 (API/크롤러/저장소가 app.database.mongo_factory로 공유)
+  mongodb_max_pool_size: int = 50  # 클라이언트당 최대 커넥션 수
+  mongodb_min_pool_size: int = 0
+  mongodb_max_idle_time_ms: int = 60000  # 유휴 커넥션 정리 시간
+  mongodb_server_selection_timeout_ms: int = 5000  # 서버 선택 대기 시간 (기본 30초 → 빠르게 실패)
+  mongodb_connect_timeout_ms: int = 5000
+  mongodb_compressors: str = ""  # 예: "zstd,snappy,zlib" (빈 값이면 압축 안 함)
+  mongodb_app_name: str = "tjproject"  # 서버 로그/currentOp에 표시되는 클라이언트 이름
   
   # Redis 설정
   redis_host: str
@@ -37,7 +50,64 @@ class Settings(BaseSettings):
   # 캐시 설정
   cache_expire_time: int
   ranking_cache_expire_time: int
+  ranking_max_limit: int = 100  # 연도별로 이만큼 계산해 캐시하고 요청 limit만큼 잘라서 반환
   review_analysis_cache_expire_time: int
+  cache_scan_batch_size: int = 500  # SCAN 기반 삭제/조회 시 한 번에 처리할 키 수
+  cache_generation_refresh_seconds: float = 1.0  # 네임스페이스 세대 번호 로컬 보관 시간
+  negative_cache_expire_time: int = 300  # 검색 결과가 없는 기업명/카테고리 캐시 시간
+  sync_redis_timeout_seconds: float = 2.0  # 크롤러 등 동기 코드의 Redis 타임아웃
+  
+  # L1 (프로세스 내) 캐시 설정
+  l1_cache_enabled: bool = True
+  l1_cache_max_entries: int = 1000
+  l1_cache_max_bytes: int = 64 * 1024 * 1024
+  l1_cache_ttl_seconds: int = 60
+  l1_cache_namespaces: List[str] = ["company_search", "comprehensive_ranking"]
+  cache_invalidation_channel: str = "cache_invalidation"
+  
+  # 캐시 미스 시 동시 계산 합치기 (single-flight) 설정
+  single_flight_lock_ttl_seconds: int = 300  # 워커 간 락 유지 시간 (계산 최대 시간)
+  single_flight_wait_timeout_seconds: int = 300  # 다른 워커 결과를 기다리는 최대 시간
+  single_flight_poll_interval_seconds: float = 0.5
+  
+  # stale-while-revalidate 설정 (soft 만료 후에도 hard TTL까지는 이전 값 제공)
+  swr_stale_grace_seconds: int = 86400  # soft 만료 이후 이전 값을 유지하는 시간
+  swr_freshness_check_interval_seconds: int = 600  # 최신 뉴스 확인 최소 간격
+  
+  # 캐시 워밍 설정 (시작 시 + TTL 만료 전에 주기적으로 미리 계산)
+  cache_warmup_enabled: bool = True
+  cache_warmup_ranking_years: List[int] = [2024, 2023]
+  cache_warmup_review_top_n: int = 10  # 조회 수 상위 N개 기업의 리뷰 분석을 미리 계산
+  cache_warmup_lead_seconds: int = 600  # TTL 만료보다 이만큼 먼저 갱신
+  cache_warmup_stagger_seconds: float = 2.0  # 항목 사이 간격 (DB/모델 부하 분산)
+  cache_warmup_startup_delay_seconds: float = 5.0
+  cache_warmup_log_size: int = 200
+  popularity_window_days: int = 7  # 인기 기업 집계 기간
+  
+  # 위키피디아 기업 정보 수집 방식 ("selenium": 브라우저, "http": MediaWiki API + lxml)
+  company_crawl_engine: str = "selenium"
+  wikipedia_http_timeout_seconds: float = 10.0
+  wikipedia_user_agent: str = "tjproject-crawler/1.0"  # 위키미디어 정책상 기본 UA 대신 식별 가능한 값 사용
+  
+  # 크롤링 작업 대기열 (워커당 브라우저 1개)
+  crawl_company_workers: int = 1  # 위키피디아 기업 정보 크롤링 동시 브라우저 수
+  crawl_review_workers: int = 1  # TeamBlind 리뷰 크롤링 동시 브라우저 수
+  crawl_job_queue_size: int = 100  # 종류별 최대 대기 작업 수 (초과 시 503)
+  crawl_job_ttl_seconds: int = 3600  # 작업 상태 보관 시간
+  crawl_job_claim_ttl_seconds: int = 60  # 대상 선점 만료 시간 (진행 중에는 1/3 주기로 연장, 워커가 죽으면 만료)
+  crawl_job_wait_seconds: float = 30.0  # 결과를 바로 돌려줘야 하는 호출(챗봇 기업 검색, search_company_with_cache)의 최대 대기 시간
+  
+  # 기업 일괄 조회 (POST /api/companies/batch)
+  company_batch_max_names: int = 50  # 요청당 최대 기업명 수
+  company_batch_max_crawls: int = 5  # 요청당 크롤링 작업을 등록할 수 있는 최대 기업 수 (DB에 없는 기업)
+  
+  # 기업명 자동완성 (워커별 메모리 인덱스)
+  company_suggest_refresh_seconds: int = 3600  # 전체 재생성 주기 (크롤러 저장 이벤트를 놓친 경우 대비)
+  
+  # 캐시 값 코덱 설정 (json: 기존 형식, msgpack_zstd: 컬럼 단위 + 압축)
+  cache_codec: str = "msgpack_zstd"
+  cache_codec_zstd_level: int = 3
+  cache_codec_min_compress_bytes: int = 1024  # 이보다 작은 값은 압축하지 않음
   
   # 지역화 설정
   language_code: str = "ko-kr"
@@ -1,145 +1,287 @@
 # app/database/db/crawling_database.py
-from pymongo import MongoClient, ASCENDING
+"""
+✅ 뉴스 기사 저장소의 동기(pymongo) facade
+- 크롤러(멀티프로세싱/스레드)와 스레드에서 실행되는 분석 코드 전용
+- 비동기 핸들러에서는 app.models.news_article.news_article_model(Motor)을 사용
+- 연결은 app.database.mongo_factory의 프로세스 공용 동기 클라이언트(커넥션 풀)를 사용
+"""
+from pymongo import ASCENDING, ReturnDocument
 from datetime import datetime
-import json
+from app.config import settings
+from app.utils.text_utils import make_article_key
+from app.utils.bloom_filter import article_bloom
+from app.database.sync_redis import get_sync_redis_raw
+from app.database.mongo_factory import get_sync_client
+from app.models.news_article import (
+    ARTICLE_LIST_PROJECTION,
+    RECENT_ARTICLE_PROJECTION,
+    EXISTING_ARTICLE_PROJECTION,
+    ROLLUP_SOURCE_PROJECTION,
+    SENTIMENT_DAILY_COLLECTION,
+    build_bulk_query,
+    index_by_article_key,
+    build_article_record,
+    build_bulk_upsert_operations,
+    upsert_filter,
+    upsert_update,
+    find_rollup_updates,
+    build_rollup_deltas,
+    build_rollup_operations,
+    bloom_offsets,
+    article_key_of,
+    new_bulk_report,
+    add_bulk_result,
+    build_conditions_query,
+    filter_title_matches,
+    build_latest_date_query,
+    build_keyword_analysis_doc,
+)
+
+def get_client():
+    """✅ 동기 MongoClient 반환 (크롤러/분석 코드와 공유하는 프로세스별 1개)"""
+    return get_sync_client()
+
+
+def get_db():
+    return get_client()[settings.news_mongodb_db]
+
+
+def get_collection():
+    return get_db()["news_articles"]
+
+
+def __getattr__(name):
+    """✅ 기존 `from ...crawling_database import db, collection, client` 호환 (지연 생성)"""
+    if name == "client":
+        return get_client()
+    if name == "db":
+        return get_db()
+    if name == "collection":
+        return get_collection()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# ✅ MongoDB 연결 및 기본 컬렉션 참조
-client = MongoClient("mongodb://localhost:27017")
-db = client["news_analysis"]
-collection = db["news_articles"]
 
 def ensure_indexes():
     """
-    ✅ (title, date, model) 기준 유니크 인덱스 생성
-    - 동일 기사(title+date)가 같은 모델로 중복 저장되지 않도록 방지
-    - 최초 1회만 실행되면 됨 (앱 시작 시)
+    ✅ (article_key, model) 기준 유니크 인덱스 생성
+    - 동일 기사(제목+날짜+언론사)가 같은 모델로 중복 저장되지 않도록 방지
+    - 앱 실행 시에는 lifespan에서 app.database.indexes.ensure_indexes()가 전체 인덱스를 생성하므로
+      앱 없이 크롤러만 단독 실행할 때 사용
     """
-    collection.create_index(
-        [("title", ASCENDING), ("date", ASCENDING), ("model", ASCENDING)],
+    get_collection().create_index(
+        [("article_key", ASCENDING), ("model", ASCENDING)],
         unique=True,
-        name="uniq_title_date_model",
+        partialFilterExpression={"article_key": {"$exists": True}},
+        name="uniq_article_key_model",
     )
 
-def find_existing_article(title, date, model):
+def find_existing_article(title, date, model, press=""):
     """
     ✅ 단일 기사 존재 여부 확인용
-    - 주어진 title, date, model로 MongoDB에서 기사 1건 조회
+    - 주어진 title, date, press의 article_key와 model로 MongoDB에서 기사 1건 조회
     """
-    return collection.find_one({"title": title, "date": date, "model": model})
+    return get_collection().find_one(
+        {"article_key": make_article_key(title, date, press), "model": model},
+        EXISTING_ARTICLE_PROJECTION
+    )
 
-def find_existing_bulk(keys, model):
+def find_existing_bulk(keys, model, projection=EXISTING_ARTICLE_PROJECTION):
     """
     ✅ 여러 기사 존재 여부 일괄 확인용
-    - keys: [(title, date), ...] 형식의 키 리스트
-    - 반환: {(title, date): document} 딕셔너리
+    - keys: article_key 리스트 (article_key_of(article)로 생성)
+    - 반환: {article_key: document} 딕셔너리 (projection 필드만)
     - 중복 저장을 피하기 위해 사전 확인 시 사용
     """
+    if not keys:
+        return {}
+    return index_by_article_key(get_collection().find(build_bulk_query(keys, model), projection))
 
-    titles = list({t for t, _ in keys})
-    dates  = list({d for _, d in keys})
-
-    cursor = collection.find({
-        "model": model,
-        "title": {"$in": titles},
-        "date":  {"$in": dates}
-    })
-    docs = list(cursor)
-    return {(doc.get("title",""), doc.get("date","")): doc for doc in docs}
+def upsert_returning_previous(doc, now):
+    """
+    ✅ 기사 1건 저장 후 저장 전 문서 반환 (ROLLUP_SOURCE_PROJECTION, 없어서 삽입했으면 None)
+    - 이전 값을 저장과 같은 연산으로 받으므로 같은 기사를 동시에 저장해도 집계 증감이 겹치지 않음
+    """
+    return get_collection().find_one_and_update(
+        upsert_filter(doc), upsert_update(doc, now),
+        projection=ROLLUP_SOURCE_PROJECTION, upsert=True, return_document=ReturnDocument.BEFORE
+    )
 
 def upsert_article(article, label, confidence, keyword, model):
     """
     ✅ 기사 분석 결과 저장 (upsert)
     - 존재 시 업데이트, 없으면 삽입
-    - 기준: (title, date, model)
+    - 기준: (article_key, model)
     - 감정 분석 결과(label, confidence), 키워드 포함
     """
-
-    summary = article.get("summary")
-    if not isinstance(summary, str) or not summary.strip():
+    now = datetime.utcnow()
+    article_record = build_article_record(article, label, confidence, keyword, model, now)
+    if article_record is None:
         print(f"⚠️ 기사 요약이 비어 있어 저장 생략: {article.get('title')}")
         return  # ✅ 저장 안 하고 종료
 
-    now = datetime.utcnow()
-    article_record = {
-        "title": article.get("title", ""),
-        "summary": summary.strip(),  # ✅ 안전하게 strip()
-        "press": article.get("press", ""),
-        "writer": article.get("writer", ""),
-        "date": article.get("date", ""),
-        "link": article.get("link", ""),
-        "keyword": keyword,
-        "model": model,
-        "label": label,
-        "confidence": confidence,
-        "analyzed_at": now,
-        "updated_at": now,
-    }
-
-    result = collection.update_one(
-        {"title": article["title"], "date": article["date"], "model": model},
-        {"$set": article_record, "$setOnInsert": {"created_at": now}},
-        upsert=True
-    )
+    previous = upsert_returning_previous(article_record, now)
+    existing = {} if previous is None else {article_record["article_key"]: previous}
 
-    if result.matched_count > 0:
+    apply_sentiment_rollup(build_rollup_deltas([article_record], existing, model), now)
+    add_to_article_bloom([article_record["article_key"]])
+
+    if previous is not None:
         print(f"✅ [DB] 기존 기사 업데이트됨: {article['title']} ({model})")
-    elif result.upserted_id:
+    else:
         print(f"🆕 [DB] 새 기사 저장됨: {article['title']} ({model})")
 
 
-def get_existing_keys():
+def upsert_articles_bulk(records, model, batch_size=None):
+    """
+    ✅ 기사 분석 결과 일괄 저장
+    - records: [{"article", "label", "confidence", "keyword"}, ...]
+    - 기준: (article_key, model), batch_size(기본 settings.article_bulk_batch_size)개씩 전송
+    - 배치마다 unordered bulk_write 한 번으로 저장 (삽입 여부는 결과의 upserted_ids로 판단)
+    - 일별 감정 집계(sentiment_daily) 대상 중 이미 있던 기사만 upsert_returning_previous()로
+      갱신하며 저장 전 값으로 집계 갱신 (라벨 없는 키워드 추출 기사 등은 bulk_write만)
+    - 반환: {"inserted", "updated", "skipped", "rejected"} 건수
+    """
+    now = datetime.utcnow()
+    operations, docs, rejected, duplicates = build_bulk_upsert_operations(records, model, now)
+    report = new_bulk_report(rejected, duplicates)
+    batch_size = batch_size or settings.article_bulk_batch_size
+    for i in range(0, len(operations), batch_size):
+        batch = docs[i:i + batch_size]
+        result = get_collection().bulk_write(operations[i:i + batch_size], ordered=False)
+        rollup_updates = find_rollup_updates(batch, result, model)
+        existing = {}
+        for doc in rollup_updates:
+            previous = upsert_returning_previous(doc, now)
+            # 그사이 삭제돼 다시 삽입된 문서(None)는 새 기사로 집계
+            if previous is not None:
+                existing[doc["article_key"]] = previous
+        add_bulk_result(report, result, rollup_updates, existing)
+        apply_sentiment_rollup(build_rollup_deltas(batch, existing, model), now)
+        add_to_article_bloom([doc["article_key"] for doc in batch])
+
+    print(
+        f"✅ [DB] 기사 일괄 저장 ({model}): 신규 {report['inserted']}건 | 갱신 {report['updated']}건"
+        f" | 건너뜀 {report['skipped']}건 | 요약 없음 {report['rejected']}건"
+    )
+    return report
+
+
+def apply_sentiment_rollup(deltas, now):
+    """
+    ✅ 일별 감정 집계(sentiment_daily)에 증감 반영
+    - 실패해도 기사 저장은 유지 (NewsArticleModel.rebuild_sentiment_daily()로 재생성 가능)
+    """
+    if not deltas:
+        return
+    try:
+        get_db()[SENTIMENT_DAILY_COLLECTION].bulk_write(
+            build_rollup_operations(deltas, now), ordered=False
+        )
+    except Exception as e:
+        print(f"⚠️ 일별 감정 집계 갱신 실패: {e}")
+
+
+# ---------------------------
+# 저장 기사 블룸 필터 (Redis 비트맵)
+# - 저장 시 article_key를 추가 (upsert_article / upsert_articles_bulk / NewsArticleModel)
+# - 크롤러는 시작 시 한 번 GET으로 받아 로컬에서 조회하고,
+#   "있을 수도 있음"인 키만 find_existing_keys()로 한 번에 확인
+# ---------------------------
+BLOOM_LOCK_TTL_SECONDS = 600
+
+
+def add_to_article_bloom(keys):
+    """✅ article_key들을 Redis 블룸 필터에 추가 (Redis 오류 시 무시 → 크롤러가 다시 수집할 뿐)"""
+    if not keys:
+        return
+    try:
+        redis_key, offsets = bloom_offsets(keys)
+        pipe = get_sync_redis_raw().pipeline(transaction=False)
+        for offset in offsets:
+            pipe.setbit(redis_key, offset, 1)
+        pipe.execute()
+    except Exception as e:
+        print(f"⚠️ 기사 블룸 필터 갱신 실패: {e}")
+
+
+def rebuild_article_bloom():
+    """
+    ✅ DB의 전체 기사로 블룸 필터 재생성 (필터가 없거나 설정이 바뀌었을 때 1회)
+    - 재생성 중 동시에 저장된 기사가 빠질 수 있으나, 빠진 기사는 다시 크롤링될 뿐 결과는 같음
+    """
+    bloom = article_bloom()
+    cursor = get_collection().find({}, {"_id": 0, "article_key": 1, "title": 1, "date": 1, "press": 1})
+    for doc in cursor:
+        bloom.add(doc.get("article_key") or article_key_of(doc))
+
+    redis = get_sync_redis_raw()
+    pipe = redis.pipeline(transaction=True)
+    pipe.set(bloom.redis_key(), bloom.to_bytes())
+    pipe.set(f"{bloom.redis_key()}:ready", b"1")
+    pipe.execute()
+    print(f"🧮 기사 블룸 필터 생성 완료 ({len(bloom.bits) // 1024}KB, 해시 {bloom.hash_count}개)")
+    return bloom
+
+
+def load_article_bloom():
+    """
+    ✅ 크롤러용 로컬 블룸 필터 로딩 (Redis GET 1회)
+    - 필터가 아직 없으면 한 프로세스만 재생성 (나머지는 None → 중복 확인 없이 크롤링)
+    - Redis를 사용할 수 없으면 None
     """
-    ✅ 내부 디버깅용 함수
-    - 기존 저장된 기사들의 (title, date, press, link) 세트 반환
+    try:
+        bloom = article_bloom()
+        redis = get_sync_redis_raw()
+        data, ready = redis.mget([bloom.redis_key(), f"{bloom.redis_key()}:ready"])
+        if ready:
+            return article_bloom(data)
+        if redis.set(f"{bloom.redis_key()}:lock", b"1", nx=True, ex=BLOOM_LOCK_TTL_SECONDS):
+            return rebuild_article_bloom()
+        return None
+    except Exception as e:
+        print(f"⚠️ 기사 블룸 필터 로딩 실패(스킵): {e}")
+        return None
+
+
+def find_existing_keys(keys):
     """
-    cursor = collection.find({}, {"title": 1, "date": 1, "press": 1, "link": 1, "_id": 0})
-    return set((doc["title"], doc["date"], doc.get("press", ""), doc.get("link", "")) for doc in cursor)
+    ✅ article_key 중 실제로 DB에 저장된 키 집합 (모델 무관, 인덱스 조회 1회)
+    """
+    if not keys:
+        return set()
+    cursor = get_collection().find(
+        {"article_key": {"$in": list(set(keys))}},
+        {"_id": 0, "article_key": 1}
+    )
+    return {doc["article_key"] for doc in cursor}
+
+
+def filter_existing_keys(keys, bloom):
+    """
+    ✅ 저장된 기사 키 집합 반환 (블룸 필터로 후보를 거른 뒤 후보만 DB에서 확인)
+    - bloom이 None이면 빈 집합 (전부 새 기사로 취급)
+    """
+    if bloom is None:
+        return set()
+    candidates = [key for key in keys if key in bloom]
+    return find_existing_keys(candidates)
 
 
 def get_articles_by_conditions(keyword, start_date, end_date, unified_category=None, incident_category=None):
     """
     ✅ 주어진 조건에 따라 DB에서 기존 저장된 기사들을 조회
     """
-    query = {
-        "title": {"$regex": keyword, "$options": "i"},
-        "date": {"$gte": start_date, "$lte": end_date}
-    }
-
-    if unified_category:
-        query["unified_category"] = {"$in": unified_category}
-    if incident_category:
-        query["incident_category"] = {"$in": incident_category}
-
-    return list(collection.find(
-        query,
-        {
-            "_id": 0,
-            "title": 1,
-            "summary": 1,
-            "press": 1,
-            "writer": 1,
-            "date": 1,
-            "link": 1,
-            "keyword": 1,
-            "model": 1
-        }
-    ).sort("_id", 1))
+    query = build_conditions_query(keyword, start_date, end_date, unified_category, incident_category)
+    return filter_title_matches(
+        get_collection().find(query, ARTICLE_LIST_PROJECTION).sort("_id", 1), keyword
+    )
 
 
 # ✅ 최근 키워드 기사 5개 조회용
 def get_articles_by_keyword_recent(keyword: str, limit: int = 5):
-    cursor = collection.find(
+    cursor = get_collection().find(
         {"keyword": keyword, "model": "latest"},
-        {
-            "_id": 0,
-            "title": 1,
-            "summary": 1,   # ✅ 추가
-            "press": 1,
-            "writer": 1,
-            "date": 1,
-            "link": 1,
-            "keyword": 1
-        }
+        RECENT_ARTICLE_PROJECTION
     ).sort("date", -1).limit(limit)
 
     return list(cursor)
@@ -155,77 +297,20 @@ def save_overall_keywords(
     unified_category=None,
     incident_category=None
 ):
-    now = datetime.utcnow()
-    collection = db["keyword_analysis"]
-
-    # ✅ 전체 키워드 비율 계산
-    if overall_keywords and isinstance(overall_keywords[0], (tuple, list)):
-        total_score = sum(score for _, score in overall_keywords if isinstance(score, (int, float)))
-        formatted_overall = [
-            {
-                "keyword": kw,
-                "score": round(score, 4),
-                "ratio": round(score / total_score * 100, 1) if total_score > 0 else 0
-            }
-            for kw, score in overall_keywords
-        ]
-    else:
-        formatted_overall = overall_keywords
-
-    # ✅ 개별 기사별 키워드 구조 정비
-    formatted_individual = []
-    for idx, doc in enumerate(individual_keywords):
-        title = doc.get("title", f"기사 {idx + 1}")
-        raw_keywords = doc.get("keywords", [])
-        count = doc.get("count", len(raw_keywords))
-        ratio = round(doc.get("ratio", 0) * 100, 1)  # 0.23 → 23.0%
-
-        if raw_keywords and isinstance(raw_keywords[0], (tuple, list)):
-            total = sum(score for _, score in raw_keywords if isinstance(score, (int, float)))
-            formatted_keywords = [
-                {
-                    "keyword": kw,
-                    "score": round(score, 4),
-                    "ratio": round(score / total * 100, 1) if total > 0 else 0
-                }
-                for kw, score in raw_keywords
-            ]
-        elif raw_keywords and isinstance(raw_keywords[0], dict):
-            # 이미 정제된 형태일 경우 그대로 사용
-            formatted_keywords = raw_keywords
-        else:
-            formatted_keywords = []
-
-        formatted_individual.append({
-            "title": title,
-            "count": count,
-            "ratio": ratio,
-            "keywords": formatted_keywords
-        })
+    doc = build_keyword_analysis_doc(
+        keyword, method, overall_keywords, individual_keywords, start_date, end_date,
+        unified_category, incident_category, datetime.utcnow()
+    )
 
     # ✅ MongoDB 저장
-    doc = {
-        "keyword": keyword,
-        "method": method,
-        "overall_keywords": formatted_overall,
-        "individual_keywords": formatted_individual,
-        "date_range": {
-            "start": start_date,
-            "end": end_date
-        },
-        "unified_category": unified_category,
-        "incident_category": incident_category,
-        "analyzed_at": now
-    }
-
-    collection.insert_one(doc)
+    get_db()["keyword_analysis"].insert_one(doc)
     print(f"✅ [DB] 키워드 분석 결과 저장 완료: {keyword} ({method})")
 
 
 
 # 모델 상관없이 summary만 찾아주는 함수
 def find_summary_any_model(title, date):
-    doc = collection.find_one(
+    doc = get_collection().find_one(
         {
             "title": title,
             "date": date,
@@ -237,22 +322,12 @@ def find_summary_any_model(title, date):
 
 
 def get_latest_article_date(keyword, start_date, end_date, unified_category, incident_category, model):
-    query = {
-        "keyword": keyword,
-        "model": model,
-    }
-
-    if start_date and end_date:
-        query["date"] = {"$gte": start_date, "$lte": end_date}
-
-    if unified_category:
-        query["unified_category"] = {"$in": unified_category}
-    if incident_category:
-        query["incident_category"] = {"$in": incident_category}
+    query = build_latest_date_query(
+        keyword, start_date, end_date, unified_category, incident_category, model
+    )
 
-    latest = collection.find(query).sort("analyzed_at", -1).limit(1)
+    latest = get_collection().find(query).sort("analyzed_at", -1).limit(1)
     doc = next(latest, None)
     if doc and "analyzed_at" in doc:
         return doc["analyzed_at"]
     return None
-
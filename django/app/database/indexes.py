@@ -0,0 +1,230 @@
+from pymongo import ASCENDING, DESCENDING
+from ..config import settings
+from ..utils.text_utils import build_substring_query
+from ..utils.financial_parser import FINANCIAL_FIELDS, amount_field, year_field
+from .mongodb import mongodb_manager
+
+# 컬렉션별 인덱스 정의 (앱 시작 시 한 번 생성, 이미 있으면 MongoDB가 무시)
+# db: "main" = settings.mongodb_db, "news" = settings.news_mongodb_db
+INDEX_SPECS = [
+  # 기업 정보
+  {"db": "main", "collection": "companies", "name": "name",
+   "keys": [("name", ASCENDING)]},
+  {"db": "main", "collection": "companies", "name": "name_ngrams",
+   "keys": [("name_ngrams", ASCENDING)]},
+  {"db": "main", "collection": "companies", "name": "industry",
+   "keys": [("산업 분야", ASCENDING)]},
+
+  # 연도별 재무 랭킹 ($match year → $sort amount → $limit)
+  *[
+    {"db": "main", "collection": "companies", "name": f"{field}_ranking",
+     "keys": [(year_field(field), ASCENDING), (amount_field(field), DESCENDING)]}
+    for field in FINANCIAL_FIELDS
+  ],
+
+  # 기업 리뷰 (크롤링)
+  {"db": "main", "collection": "company_reviews", "name": "name",
+   "keys": [("name", ASCENDING)]},
+
+  # 사용자 리뷰
+  {"db": "main", "collection": "user_reviews", "name": "company_active_created",
+   "keys": [("companyId", ASCENDING), ("deletedAt", ASCENDING), ("createdAt", DESCENDING)]},
+  {"db": "main", "collection": "user_reviews", "name": "parent_active_created",
+   "keys": [("parentId", ASCENDING), ("deletedAt", ASCENDING), ("createdAt", ASCENDING)]},
+  {"db": "main", "collection": "user_reviews", "name": "user_active_created",
+   "keys": [("userId", ASCENDING), ("deletedAt", ASCENDING), ("createdAt", DESCENDING)]},
+
+  # 뉴스 기사
+  # article_key가 채워지기 전 문서는 유니크 검사에서 제외
+  {"db": "news", "collection": "news_articles", "name": "uniq_article_key_model",
+   "keys": [("article_key", ASCENDING), ("model", ASCENDING)],
+   "unique": True, "partial": {"article_key": {"$exists": True}}},
+  {"db": "news", "collection": "news_articles", "name": "title_date",
+   "keys": [("title", ASCENDING), ("date", ASCENDING)]},
+  {"db": "news", "collection": "news_articles", "name": "keyword_model_date",
+   "keys": [("keyword", ASCENDING), ("model", ASCENDING), ("date", DESCENDING)]},
+  {"db": "news", "collection": "news_articles", "name": "keyword_model_analyzed_at",
+   "keys": [("keyword", ASCENDING), ("model", ASCENDING), ("analyzed_at", DESCENDING)]},
+  {"db": "news", "collection": "news_articles", "name": "title_ngrams_date",
+   "keys": [("title_ngrams", ASCENDING), ("date", ASCENDING)]},
+  {"db": "news", "collection": "news_articles", "name": "date",
+   "keys": [("date", ASCENDING)]},
+
+  # 일별 감정 집계 (추이 조회: keyword, model 일치 + date 범위)
+  {"db": "news", "collection": "sentiment_daily", "name": "uniq_keyword_model_date_label",
+   "keys": [("keyword", ASCENDING), ("model", ASCENDING), ("date", ASCENDING), ("label", ASCENDING)],
+   "unique": True},
+
+  # 뉴스 키워드 분석 결과
+  {"db": "news", "collection": "keyword_analysis", "name": "keyword_method_range",
+   "keys": [("keyword", ASCENDING), ("method", ASCENDING),
+            ("date_range.start", ASCENDING), ("date_range.end", ASCENDING)]},
+]
+
+# 더 이상 사용하지 않는 인덱스 (시작 시 있으면 삭제)
+# uniq_title_date_model: 기사 식별 기준이 (article_key, model)로 바뀌면서 같은 날 같은 제목의
+#   다른 언론사 기사를 막지 않도록 제거
+OBSOLETE_INDEXES = [
+  {"db": "news", "collection": "news_articles", "name": "uniq_title_date_model"},
+]
+
+# 저장소에서 실제로 실행하는 쿼리 (explain 진단용, 값은 대표 예시)
+QUERY_PROBES = [
+  {"name": "company_model.get_company_by_exact_name",
+   "db": "main", "collection": "companies", "filter": {"name": "삼성전자"}},
+  {"name": "company_model.get_companies_by_exact_names",
+   "db": "main", "collection": "companies",
+   "filter": {"name": {"$in": ["삼성전자", "LG전자", "현대자동차"]}}},
+  {"name": "company_model.get_companies_by_name",
+   "db": "main", "collection": "companies",
+   "filter": build_substring_query("name", "삼성전자")},
+  {"name": "company_model.get_companies_by_category",
+   "db": "main", "collection": "companies",
+   "filter": {"산업 분야": {"$regex": "반도체", "$options": "i"}}},
+  {"name": "company_model.get_top_by_financial_field",
+   "db": "main", "collection": "companies",
+   "filter": {year_field("매출액"): 2024}, "sort": [(amount_field("매출액"), -1)],
+   "limit": settings.ranking_max_limit},
+  {"name": "company_review_model.get_reviews_by_company",
+   "db": "main", "collection": "company_reviews", "filter": {"name": "삼성전자"}},
+  {"name": "user_review_service.get_reviews_by_company",
+   "db": "main", "collection": "user_reviews",
+   "filter": {"companyId": "sample", "deletedAt": None}, "sort": [("createdAt", -1)]},
+  {"name": "user_review_service.get_reviews_by_user",
+   "db": "main", "collection": "user_reviews",
+   "filter": {"userId": 1, "deletedAt": None}, "sort": [("createdAt", -1)]},
+  {"name": "user_review_service.get_replies_by_parent",
+   "db": "main", "collection": "user_reviews",
+   "filter": {"parentId": None, "deletedAt": None}, "sort": [("createdAt", 1)]},
+  {"name": "news_article_model.find_existing_bulk",
+   "db": "news", "collection": "news_articles",
+   "filter": {"article_key": {"$in": ["0" * 40]}, "model": "latest"}},
+  {"name": "news_article_model.get_articles_by_conditions",
+   "db": "news", "collection": "news_articles",
+   "filter": {**build_substring_query("title", "삼성전자"),
+              "date": {"$gte": "2025-01-01", "$lte": "2025-12-31"}},
+   "sort": [("_id", 1)]},
+  {"name": "news_article_model.get_articles_by_keyword_recent",
+   "db": "news", "collection": "news_articles",
+   "filter": {"keyword": "삼성", "model": "latest"}, "sort": [("date", -1)], "limit": 5},
+  {"name": "news_article_model.get_latest_article_date",
+   "db": "news", "collection": "news_articles",
+   "filter": {"keyword": "삼성", "model": "vote"}, "sort": [("analyzed_at", -1)], "limit": 1},
+  {"name": "news_article_model.get_sentiment_trend",
+   "db": "news", "collection": "sentiment_daily",
+   "filter": {"keyword": "삼성", "model": "vote", "date": {"$gte": "2025-01-01", "$lte": "2025-12-31"}},
+   "sort": [("date", 1)]},
+  {"name": "news_article_model.get_keyword_analysis",
+   "db": "news", "collection": "keyword_analysis",
+   "filter": {"keyword": "삼성", "method": "keybert",
+              "date_range.start": "2025-01-01", "date_range.end": "2025-12-31"}},
+]
+
+def _database(name):
+  """스펙의 db 이름에 해당하는 Motor 데이터베이스"""
+  if name == "news":
+    return mongodb_manager.client[settings.news_mongodb_db]
+  return mongodb_manager.db
+
+async def ensure_indexes():
+  """INDEX_SPECS의 인덱스를 모두 생성 (하나가 실패해도 나머지는 계속 진행)"""
+  results = []
+  if not mongodb_manager.is_connected:
+    return results
+
+  for spec in OBSOLETE_INDEXES:
+    target = f"{spec['collection']}.{spec['name']}"
+    collection = _database(spec["db"])[spec["collection"]]
+    try:
+      if spec["name"] in await collection.index_information():
+        await collection.drop_index(spec["name"])
+        print(f"🗑️ 사용하지 않는 인덱스 삭제: {target}")
+        results.append({"index": target, "status": "dropped"})
+    except Exception as e:
+      print(f"⚠️ 인덱스 삭제 실패 ({target}): {str(e)}")
+      results.append({"index": target, "status": "failed", "error": str(e)})
+
+  for spec in INDEX_SPECS:
+    options = {"name": spec["name"]}
+    if spec.get("unique"):
+      options["unique"] = True
+    if spec.get("partial"):
+      options["partialFilterExpression"] = spec["partial"]
+    target = f"{spec['collection']}.{spec['name']}"
+    try:
+      await _database(spec["db"])[spec["collection"]].create_index(spec["keys"], **options)
+      results.append({"index": target, "status": "ok"})
+    except Exception as e:
+      print(f"⚠️ 인덱스 생성 실패 ({target}): {str(e)}")
+      results.append({"index": target, "status": "failed", "error": str(e)})
+  return results
+
+async def backfill_derived_fields():
+  """저장 시 계산하는 필드(n-gram 검색 필드, article_key, 재무 숫자 필드)가 없는 기존 문서와
+  일별 감정 집계(비어 있을 때) 채우기
+
+  이미 채워진 문서는 건너뛰므로 시작할 때마다 실행해도 된다.
+  """
+  from ..models.company import company_model
+  from ..models.news_article import news_article_model
+
+  companies = await company_model.backfill_search_fields()
+  financials = await company_model.backfill_financial_fields()
+  articles = await news_article_model.backfill_search_fields()
+  rollups = await news_article_model.backfill_sentiment_daily()
+  if companies or financials or articles or rollups:
+    print(f"✅ 파생 필드 채우기 완료 (기업 검색 {companies}건, 기업 재무 {financials}건, 기사 {articles}건, "
+          f"감정 집계 {rollups}건)")
+
+def _plan_stages(plan):
+  """실행 계획 트리의 stage 이름과 사용 인덱스 수집"""
+  stages, indexes = [], []
+  nodes = [plan]
+  while nodes:
+    node = nodes.pop()
+    if not isinstance(node, dict):
+      continue
+    if "stage" in node:
+      stages.append(node["stage"])
+    if node.get("indexName"):
+      indexes.append(node["indexName"])
+    if "inputStage" in node:
+      nodes.append(node["inputStage"])
+    nodes.extend(node.get("inputStages", []))
+    # SBE 엔진은 queryPlan 아래에 계획을 둠
+    if "queryPlan" in node:
+      nodes.append(node["queryPlan"])
+  return stages, indexes
+
+async def explain_queries():
+  """QUERY_PROBES를 explain해서 컬렉션 전체 스캔(COLLSCAN) 여부 보고"""
+  report = []
+  if not mongodb_manager.is_connected:
+    return report
+
+  for probe in QUERY_PROBES:
+    entry = {"query": probe["name"], "collection": probe["collection"]}
+    try:
+      cursor = _database(probe["db"])[probe["collection"]].find(probe["filter"])
+      if probe.get("sort"):
+        cursor = cursor.sort(probe["sort"])
+      if probe.get("limit"):
+        cursor = cursor.limit(probe["limit"])
+      explain = await cursor.explain()
+
+      stages, indexes = _plan_stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+      stats = explain.get("executionStats", {})
+      entry.update({
+        "collection_scan": "COLLSCAN" in stages,
+        "in_memory_sort": "SORT" in stages,
+        "indexes": indexes,
+        "stages": stages,
+        "docs_examined": stats.get("totalDocsExamined"),
+        "keys_examined": stats.get("totalKeysExamined"),
+        "returned": stats.get("nReturned"),
+        "execution_ms": stats.get("executionTimeMillis")
+      })
+    except Exception as e:
+      entry["error"] = str(e)
+    report.append(entry)
+  return report
@@ -0,0 +1,126 @@
+import json
+import sys
+import time
+from collections import OrderedDict
+
+_MISSING = object()
+
+# JSON 디코딩 결과(dict/list)는 원본 문자열보다 몇 배 크므로 원본 크기 × 배수로 추정
+DECODED_SIZE_FACTOR = 4
+
+class LocalCache:
+  """엔트리 수와 바이트 크기로 제한되는 프로세스 내 LRU + TTL 캐시
+
+  Redis에서 읽은 원본 문자열과 JSON 디코딩 결과를 함께 보관해
+  반복 조회 시 네트워크 왕복과 json.loads 비용을 모두 없앤다.
+  디코딩된 값은 여러 요청이 공유하므로 호출 측에서 수정하면 안 된다.
+  바이트 크기는 원본 값 크기에 디코딩 값 추정 크기(원본 × DECODED_SIZE_FACTOR)를 더해 계산한다.
+  """
+  def __init__(self, max_entries, max_bytes, ttl_seconds):
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.ttl_seconds = ttl_seconds
+    # key -> [원본 값, 디코딩 값, 크기, 만료 시각]
+    self._entries = OrderedDict()
+    self._bytes = 0
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def _lookup(self, key):
+    """만료 여부를 확인하며 엔트리 조회 (최근 사용으로 갱신)"""
+    entry = self._entries.get(key)
+    if entry is None:
+      self.misses += 1
+      return None
+    if entry[3] <= time.monotonic():
+      self._remove(key)
+      self.misses += 1
+      return None
+    self._entries.move_to_end(key)
+    self.hits += 1
+    return entry
+
+  def get(self, key):
+    """원본 문자열 조회 (없으면 None)"""
+    entry = self._lookup(key)
+    return entry[0] if entry else None
+
+  def get_json(self, key):
+    """JSON 디코딩된 값 조회 (최초 1회만 디코딩, 없으면 None)"""
+    entry = self._lookup(key)
+    if entry is None:
+      return None
+    if entry[1] is _MISSING:
+      entry[1] = json.loads(entry[0])
+      decoded_size = self._decoded_size(entry[0])
+      entry[2] += decoded_size
+      self._bytes += decoded_size
+      self._evict()
+    return entry[1]
+
+  def set(self, key, value, ttl_seconds=None, decoded=_MISSING):
+    """값 저장 (크기가 너무 큰 값은 저장하지 않음)"""
+    size = sys.getsizeof(value)
+    if decoded is not _MISSING:
+      size += self._decoded_size(value)
+    if size > self.max_bytes // 4:
+      self._remove(key)
+      return False
+
+    ttl = min(ttl_seconds, self.ttl_seconds) if ttl_seconds else self.ttl_seconds
+    self._remove(key)
+    self._entries[key] = [value, decoded, size, time.monotonic() + ttl]
+    self._bytes += size
+    self._evict()
+    return True
+
+  @staticmethod
+  def _decoded_size(value):
+    """디코딩 값의 추정 크기"""
+    return sys.getsizeof(value) * DECODED_SIZE_FACTOR
+
+  def _evict(self):
+    """엔트리 수/바이트 한도를 넘으면 오래 사용하지 않은 항목부터 제거"""
+    while self._entries and (
+      len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+    ):
+      oldest_key = next(iter(self._entries))
+      self._remove(oldest_key)
+      self.evictions += 1
+
+  def _remove(self, key):
+    """엔트리 제거"""
+    entry = self._entries.pop(key, None)
+    if entry is not None:
+      self._bytes -= entry[2]
+
+  def delete(self, *keys):
+    """키 삭제"""
+    for key in keys:
+      self._remove(key)
+
+  def delete_prefix(self, prefix):
+    """접두사로 시작하는 키 모두 삭제"""
+    for key in [k for k in self._entries if k.startswith(prefix)]:
+      self._remove(key)
+
+  def clear(self):
+    """전체 삭제"""
+    self._entries.clear()
+    self._bytes = 0
+
+  def stats(self):
+    """캐시 통계 반환"""
+    total = self.hits + self.misses
+    return {
+      "entries": len(self._entries),
+      "bytes": self._bytes,
+      "max_entries": self.max_entries,
+      "max_bytes": self.max_bytes,
+      "ttl_seconds": self.ttl_seconds,
+      "hits": self.hits,
+      "misses": self.misses,
+      "evictions": self.evictions,
+      "hit_ratio": round(self.hits / total, 4) if total else 0.0
+    }
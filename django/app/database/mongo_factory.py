@@ -0,0 +1,165 @@
+import os
+import threading
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import MongoClient
+from pymongo.monitoring import ConnectionPoolListener
+from ..config import settings
+from ..utils.cache_metrics import Histogram
+
+# 커넥션 체크아웃 대기 시간 구간 (초)
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+class PoolMetrics(ConnectionPoolListener):
+  """MongoDB 커넥션 풀 지표 (클라이언트 종류별, 프로세스 단위)
+
+  pymongo가 여러 스레드에서 호출하므로 갱신은 락으로 보호한다.
+  """
+  def __init__(self, kind):
+    self.kind = kind
+    self._lock = threading.Lock()
+    self.created = 0
+    self.closed = 0
+    self.checked_out = 0  # 현재 사용 중인 커넥션 수
+    self.checkouts = 0
+    self.checkout_failures = {}  # 실패 사유 -> 횟수
+    self.pool_clears = 0
+    self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+
+  def connection_checked_out(self, event):
+    with self._lock:
+      self.checked_out += 1
+      self.checkouts += 1
+      if event.duration is not None:
+        self.checkout_wait.observe(event.duration)
+
+  def connection_check_out_failed(self, event):
+    with self._lock:
+      self.checkout_failures[event.reason] = self.checkout_failures.get(event.reason, 0) + 1
+      if event.duration is not None:
+        self.checkout_wait.observe(event.duration)
+
+  def connection_checked_in(self, event):
+    with self._lock:
+      self.checked_out -= 1
+
+  def connection_created(self, event):
+    with self._lock:
+      self.created += 1
+
+  def connection_closed(self, event):
+    with self._lock:
+      self.closed += 1
+
+  def pool_cleared(self, event):
+    with self._lock:
+      self.pool_clears += 1
+
+  # 나머지 이벤트는 사용하지 않음
+  def connection_check_out_started(self, event):
+    pass
+
+  def connection_ready(self, event):
+    pass
+
+  def pool_created(self, event):
+    pass
+
+  def pool_ready(self, event):
+    pass
+
+  def pool_closed(self, event):
+    pass
+
+  def stats(self):
+    with self._lock:
+      return {
+        "open_connections": self.created - self.closed,
+        "checked_out": self.checked_out,
+        "checkouts": self.checkouts,
+        "checkout_failures": dict(self.checkout_failures),
+        "pool_clears": self.pool_clears,
+        "checkout_wait_seconds": self.checkout_wait.stats()
+      }
+
+pool_metrics = {"async": PoolMetrics("async"), "sync": PoolMetrics("sync")}
+
+def client_options(kind):
+  """설정(Settings) 기반 공통 클라이언트 옵션"""
+  options = {
+    "maxPoolSize": settings.mongodb_max_pool_size,
+    "minPoolSize": settings.mongodb_min_pool_size,
+    "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+    "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+    "connectTimeoutMS": settings.mongodb_connect_timeout_ms,
+    "appname": f"{settings.mongodb_app_name}-{kind}",
+    "event_listeners": [pool_metrics[kind]]
+  }
+  if settings.mongodb_compressors:
+    options["compressors"] = settings.mongodb_compressors
+  return options
+
+def create_async_client():
+  """API(Motor)용 비동기 클라이언트 생성 (MongoDBManager가 하나만 보관)"""
+  return AsyncIOMotorClient(settings.mongodb_url, **client_options("async"))
+
+_sync_client = None
+_sync_client_pid = None
+_sync_lock = threading.Lock()
+
+def get_sync_client():
+  """크롤러/스레드 코드용 동기 클라이언트 (프로세스당 1개 공유)
+
+  pymongo 클라이언트는 fork 이후 재사용할 수 없으므로 멀티프로세싱 워커는 각자 새로 만든다.
+  """
+  global _sync_client, _sync_client_pid
+  with _sync_lock:
+    if _sync_client is None or _sync_client_pid != os.getpid():
+      _sync_client = MongoClient(settings.mongodb_url, **client_options("sync"))
+      _sync_client_pid = os.getpid()
+    return _sync_client
+
+def close_sync_client():
+  """동기 클라이언트 종료 (애플리케이션 종료 시)"""
+  global _sync_client, _sync_client_pid
+  with _sync_lock:
+    if _sync_client is not None and _sync_client_pid == os.getpid():
+      _sync_client.close()
+    _sync_client = None
+    _sync_client_pid = None
+
+def pool_stats():
+  """클라이언트 종류별 커넥션 풀 지표"""
+  return {kind: metrics.stats() for kind, metrics in pool_metrics.items()}
+
+def render_prometheus(prefix="mongodb_pool"):
+  """커넥션 풀 지표를 Prometheus 텍스트 형식으로 변환"""
+  lines = []
+  stats = pool_stats()
+
+  def metric(name, metric_type, help_text, values):
+    lines.append(f"# HELP {prefix}_{name} {help_text}")
+    lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+    for labels, value in values:
+      lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+  metric("open_connections", "gauge", "Open connections",
+         [(f'client="{kind}"', s["open_connections"]) for kind, s in stats.items()])
+  metric("checked_out_connections", "gauge", "Connections currently checked out",
+         [(f'client="{kind}"', s["checked_out"]) for kind, s in stats.items()])
+  metric("checkouts_total", "counter", "Successful connection checkouts",
+         [(f'client="{kind}"', s["checkouts"]) for kind, s in stats.items()])
+  metric("checkout_failures_total", "counter", "Failed connection checkouts", [
+    (f'client="{kind}",reason="{reason}"', count)
+    for kind, s in stats.items() for reason, count in sorted(s["checkout_failures"].items())
+  ])
+
+  lines.append(f"# HELP {prefix}_checkout_wait_seconds Time spent waiting for a pooled connection")
+  lines.append(f"# TYPE {prefix}_checkout_wait_seconds histogram")
+  for kind, metrics in pool_metrics.items():
+    hist = metrics.checkout_wait
+    for bound, count in hist.cumulative():
+      lines.append(f'{prefix}_checkout_wait_seconds_bucket{{client="{kind}",le="{bound}"}} {count}')
+    lines.append(f'{prefix}_checkout_wait_seconds_bucket{{client="{kind}",le="+Inf"}} {hist.total}')
+    lines.append(f'{prefix}_checkout_wait_seconds_sum{{client="{kind}"}} {hist.sum}')
+    lines.append(f'{prefix}_checkout_wait_seconds_count{{client="{kind}"}} {hist.total}')
+  return "\n".join(lines) + "\n"
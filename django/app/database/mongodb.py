@@ -1,5 +1,5 @@
-from motor.motor_asyncio import AsyncIOMotorClient
 from ..config import settings
+from .mongo_factory import create_async_client
 
 class MongoDBManager:
   """비동기 MongoDB 연결을 관리하는 싱글톤 클래스"""
@@ -16,7 +16,7 @@ class MongoDBManager:
   async def connect(self):
     """MongoDB 연결 초기화"""
     try:
-      self._client = AsyncIOMotorClient(settings.mongodb_url)
+      self._client = create_async_client()
       self._db = self._client[settings.mongodb_db]
       
       # 연결 테스트
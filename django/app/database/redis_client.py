@@ -1,12 +1,68 @@
 import redis.asyncio as redis
+import asyncio
 import json
+import time
+import uuid
 from ..config import settings
+from .local_cache import LocalCache
+from ..utils.cache_metrics import cache_metrics
+
+# 캐시 네임스페이스 (키 접두사) 목록
+CACHE_NAMESPACES = (
+  "company_search",
+  "company_search_negative",
+  "company_detail",
+  "comprehensive_ranking",
+  "review_analysis",
+  "emotion_analysis_result",
+  "keyword_extraction_result",
+  "news_articles",
+  "keyword_analysis",
+)
+
+# 네임스페이스별 키 레지스트리 (sorted set, score = 만료 시각)
+REGISTRY_KEY_PREFIX = "cache_registry"
+
+# 네임스페이스별 세대 번호 (무효화 시 증가시켜 기존 키를 일괄 폐기)
+GENERATION_KEY_PREFIX = "cache_generation"
+
+# 일자별 조회 수 (캐시 워밍 대상 선정용)
+POPULARITY_KEY_PREFIX = "popularity"
+
+# 락 소유자(token)가 일치할 때만 만료 시간을 연장하는 스크립트
+EXTEND_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+  return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 락 소유자(token)가 일치할 때만 삭제하는 스크립트
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+  return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 class RedisClient:
   """비동기 Redis 클라이언트를 관리하는 싱글톤 클래스"""
   _instance = None
   _redis = None
+  _raw_redis = None  # 바이너리 값(코덱 인코딩) 조회용, 응답을 디코딩하지 않음
   _is_connected = False
+  _generations = {}  # 네임스페이스 -> (세대 번호, 조회 시각)
+  _listener_task = None
+  # 메시지 종류 -> 처리 함수 (캐시 무효화 채널로 전달되는 invalidate 외 이벤트)
+  _message_handlers = {}
+  # 프로세스 내 L1 캐시 (워커별), 무효화는 Redis pub/sub으로 전파
+  local_cache = LocalCache(
+    settings.l1_cache_max_entries,
+    settings.l1_cache_max_bytes,
+    settings.l1_cache_ttl_seconds
+  )
+  # 자신이 보낸 무효화 메시지를 구분하기 위한 워커 ID
+  instance_id = uuid.uuid4().hex
 
   def __new__(cls):
     if cls._instance is None:
@@ -22,18 +78,34 @@ class RedisClient:
         encoding="utf-8"
       )
       
+      self._raw_redis = redis.from_url(
+        settings.redis_url,
+        decode_responses=False
+      )
+      
       # 연결 테스트
       await self._redis.ping()
       self._is_connected = True
+      
+      # 다른 워커의 캐시 무효화 메시지와 이벤트(add_message_handler) 구독
+      self._listener_task = asyncio.create_task(self._listen_invalidations())
     except Exception as e:
       self._is_connected = False
       if settings.require_external_services:
         raise e
       else:
         self._redis = None
+        self._raw_redis = None
 
   async def disconnect(self):
     """Redis 연결 종료"""
+    if self._listener_task:
+      self._listener_task.cancel()
+      self._listener_task = None
+    self.local_cache.clear()
+    if self._raw_redis:
+      await self._raw_redis.close()
+      self._raw_redis = None
     if self._redis:
       await self._redis.close()
       self._redis = None
@@ -51,34 +123,338 @@ class RedisClient:
     """연결 상태 반환"""
     return self._is_connected
 
+  def _use_local_cache(self, key):
+    """L1 캐시 대상 키인지 확인"""
+    return (
+      settings.l1_cache_enabled
+      and str(key).split(":", 1)[0] in settings.l1_cache_namespaces
+    )
+
+  def _invalidation_message(self, keys=None, namespaces=None, clear_all=False):
+    """L1 캐시 무효화 메시지 생성"""
+    return json.dumps({
+      "type": "invalidate",
+      "origin": self.instance_id,
+      "keys": list(keys or []),
+      "namespaces": list(namespaces or []),
+      "all": clear_all
+    }, ensure_ascii=False)
+
+  async def _publish_invalidation(self, keys=None, namespaces=None, clear_all=False):
+    """다른 워커에 L1 캐시 무효화 전파"""
+    if not settings.l1_cache_enabled or not self.is_connected:
+      return
+    try:
+      await self.redis.publish(
+        settings.cache_invalidation_channel,
+        self._invalidation_message(keys, namespaces, clear_all)
+      )
+    except Exception as e:
+      print(f"Redis 무효화 메시지 발행 오류: {str(e)}")
+
+  def _apply_invalidation(self, message):
+    """수신한 무효화 메시지를 로컬 L1 캐시에 반영"""
+    if message.get("all"):
+      self.local_cache.clear()
+      self._generations.clear()
+      return
+    self.local_cache.delete(*message.get("keys", []))
+    for namespace in message.get("namespaces", []):
+      self.local_cache.delete_prefix(f"{namespace}:")
+      self._generations.pop(namespace, None)
+
+  def add_message_handler(self, message_type, handler):
+    """캐시 무효화 채널로 받은 message_type 메시지를 handler(message)로 전달 (워커 전체 이벤트용)"""
+    self._message_handlers[message_type] = handler
+
+  async def _listen_invalidations(self):
+    """캐시 무효화 채널 구독 (연결이 끊기면 재시도)"""
+    while self.is_connected:
+      pubsub = None
+      try:
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(settings.cache_invalidation_channel)
+        async for raw in pubsub.listen():
+          try:
+            message = json.loads(raw["data"])
+          except (TypeError, json.JSONDecodeError):
+            continue
+          if message.get("origin") == self.instance_id:
+            continue
+          if message.get("type") == "invalidate":
+            self._apply_invalidation(message)
+          elif message.get("type") in self._message_handlers:
+            try:
+              self._message_handlers[message["type"]](message)
+            except Exception as e:
+              print(f"Redis 메시지 처리 오류 ({message['type']}): {str(e)}")
+      except asyncio.CancelledError:
+        break
+      except Exception as e:
+        print(f"Redis 무효화 구독 오류 (재시도): {str(e)}")
+        # 구독이 끊긴 동안의 변경을 놓쳤을 수 있으므로 L1 비우기
+        self.local_cache.clear()
+        await asyncio.sleep(1)
+      finally:
+        if pubsub is not None:
+          try:
+            await pubsub.close()
+          except Exception:
+            pass
+
   async def get(self, key):
-    """키로 값 조회"""
+    """키로 값 조회 (L1 캐시 우선)"""
     if not self.is_connected:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return None
+    
+    use_local = self._use_local_cache(key)
+    if use_local:
+      value = self.local_cache.get(key)
+      if value is not None:
+        self._record_lookup(key, value, local=True)
+        return value
       
     try:
-      return await self.redis.get(key)
+      value = await self.redis.get(key)
+      self._record_lookup(key, value)
+      if use_local and value is not None:
+        self.local_cache.set(key, value)
+      return value
     except Exception as e:
       print(f"Redis GET 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "get")
       return None
 
-  async def set(self, key, value, expire=None):
-    """키-값 저장"""
+  async def get_bytes(self, key, record=True):
+    """키로 값을 디코딩하지 않은 bytes로 조회 (코덱 인코딩 값용, L1 캐시 우선, record=False면 지표 제외)"""
+    if not self.is_connected or self._raw_redis is None:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return None
+    
+    use_local = self._use_local_cache(key)
+    if use_local:
+      value = self.local_cache.get(key)
+      if value is not None:
+        if record:
+          self._record_lookup(key, value, local=True)
+        return value
+      
+    try:
+      value = await self._raw_redis.get(key)
+      if record:
+        self._record_lookup(key, value)
+      if use_local and value is not None:
+        self.local_cache.set(key, value)
+      return value
+    except Exception as e:
+      print(f"Redis GET_BYTES 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "get")
+      return None
+
+  async def _mget(self, client, keys):
+    """L1 캐시에 없는 키만 MGET 한 번으로 조회 (키 순서대로 반환)"""
+    values = [None] * len(keys)
+    missing = []
+    for i, key in enumerate(keys):
+      if self._use_local_cache(key):
+        value = self.local_cache.get(key)
+        if value is not None:
+          values[i] = value
+          self._record_lookup(key, value, local=True)
+          continue
+      missing.append(i)
+    
+    if missing:
+      fetched = await client.mget([keys[i] for i in missing])
+      for i, value in zip(missing, fetched):
+        values[i] = value
+        self._record_lookup(keys[i], value)
+        if value is not None and self._use_local_cache(keys[i]):
+          self.local_cache.set(keys[i], value)
+    return values
+
+  async def get_many(self, keys):
+    """여러 키를 한 번의 왕복으로 조회 (없는 키는 None, L1 캐시 우선)"""
+    keys = list(keys)
+    if not self.is_connected:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return [None] * len(keys)
+    if not keys:
+      return []
+    
+    try:
+      return await self._mget(self.redis, keys)
+    except Exception as e:
+      print(f"Redis MGET 오류: {str(e)}")
+      self._record_errors(keys, "get")
+      return [None] * len(keys)
+
+  async def get_many_bytes(self, keys):
+    """여러 키를 디코딩하지 않은 bytes로 한 번에 조회 (코덱 인코딩 값용)"""
+    keys = list(keys)
+    if not self.is_connected or self._raw_redis is None:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return [None] * len(keys)
+    if not keys:
+      return []
+    
+    try:
+      return await self._mget(self._raw_redis, keys)
+    except Exception as e:
+      print(f"Redis MGET 오류: {str(e)}")
+      self._record_errors(keys, "get")
+      return [None] * len(keys)
+
+  async def get_many_json(self, keys, record=True):
+    """여러 키를 한 번에 조회하고 JSON 디코딩 (L1 캐시의 디코딩 결과 재사용, record=False면 지표 제외)"""
+    keys = list(keys)
+    if not self.is_connected:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return [None] * len(keys)
+    if not keys:
+      return []
+    
+    values = [None] * len(keys)
+    missing = []
+    for i, key in enumerate(keys):
+      if self._use_local_cache(key):
+        cached = self.local_cache.get_json(key)
+        if cached is not None:
+          values[i] = cached
+          if record:
+            self._record_lookup(key, cached, local=True)
+          continue
+      missing.append(i)
+    if not missing:
+      return values
+    
+    try:
+      fetched = await self.redis.mget([keys[i] for i in missing])
+    except Exception as e:
+      print(f"Redis MGET 오류: {str(e)}")
+      self._record_errors([keys[i] for i in missing], "get")
+      return values
+    
+    for i, raw in zip(missing, fetched):
+      if not raw:
+        if record:
+          self._record_lookup(keys[i], None)
+        continue
+      try:
+        values[i] = json.loads(raw)
+      except json.JSONDecodeError as e:
+        print(f"JSON 디코딩 오류 ({keys[i]}): {str(e)}")
+        cache_metrics.record_error(self._namespace_of(keys[i]), "decode")
+        continue
+      if record:
+        self._record_lookup(keys[i], raw)
+      if self._use_local_cache(keys[i]):
+        self.local_cache.set(keys[i], raw, decoded=values[i])
+    return values
+
+  async def set_many(self, mapping, expire=None):
+    """여러 키-값을 파이프라인 한 번으로 저장 (dict/list 값은 JSON으로 변환)"""
     if not self.is_connected:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return True
-      
+    if not mapping:
+      return True
+    
     try:
-      if isinstance(value, (dict, list)):
-        value = json.dumps(value, ensure_ascii=False)
+      encoded = {key: self._encode_value(value) for key, value in mapping.items()}
+      pipe = self.redis.pipeline(transaction=False)
+      for key, value in encoded.items():
+        self._queue_write(pipe, key, value, expire)
+      
+      # L1 대상 키는 메시지 하나로 다른 워커에 무효화 전파
+      local_keys = [key for key in encoded if self._use_local_cache(key)]
+      if local_keys:
+        pipe.publish(
+          settings.cache_invalidation_channel,
+          self._invalidation_message(keys=local_keys))
       
+      await pipe.execute()
+      for key in local_keys:
+        self.local_cache.set(key, encoded[key], expire)
+      return True
+    except Exception as e:
+      print(f"Redis SET_MANY 오류: {str(e)}")
+      self._record_errors(mapping, "set")
+      return False
+
+  def _record_lookup(self, key, value, local=False):
+    """조회 결과를 네임스페이스별 적중/미스 지표에 기록"""
+    cache_metrics.record_lookup(self._namespace_of(key), value is not None, local)
+
+  def _record_errors(self, keys, operation):
+    """여러 키 작업 실패를 네임스페이스별 오류 지표에 기록"""
+    for namespace in {self._namespace_of(key) for key in keys}:
+      cache_metrics.record_error(namespace, operation)
+
+  def _namespace_of(self, key):
+    """키가 속한 캐시 네임스페이스 반환 (등록되지 않은 키는 None)"""
+    namespace = str(key).split(":", 1)[0]
+    return namespace if namespace in CACHE_NAMESPACES else None
+
+  def _registry_key(self, namespace):
+    """네임스페이스 레지스트리 키 생성"""
+    return f"{REGISTRY_KEY_PREFIX}:{namespace}"
+
+  def _encode_value(self, value):
+    """dict/list 값은 JSON 문자열로 변환"""
+    if isinstance(value, (dict, list)):
+      return json.dumps(value, ensure_ascii=False)
+    return value
+
+  def _queue_write(self, pipe, key, value, expire=None):
+    """파이프라인에 값 저장과 네임스페이스 레지스트리 갱신 추가"""
+    if expire:
+      pipe.setex(key, expire, value)
+    else:
+      pipe.set(key, value)
+    
+    namespace = self._namespace_of(key)
+    cache_metrics.record_set(namespace, value)
+    if namespace is not None:
+      # 만료 시각을 score로 기록해 TTL이 지난 항목은 집계 시 정리
+      expires_at = time.time() + expire if expire else float("inf")
+      pipe.zadd(self._registry_key(namespace), {key: expires_at})
+
+  async def _write(self, key, value, expire=None):
+    """값 저장과 네임스페이스 레지스트리 갱신을 한 번의 왕복으로 처리"""
+    value = self._encode_value(value)
+
+    if self._namespace_of(key) is None:
       if expire:
         return await self.redis.setex(key, expire, value)
-      else:
-        return await self.redis.set(key, value)
+      return await self.redis.set(key, value)
+
+    pipe = self.redis.pipeline(transaction=False)
+    self._queue_write(pipe, key, value, expire)
+    
+    # L1 대상 키는 다른 워커의 이전 값을 무효화
+    use_local = self._use_local_cache(key)
+    if use_local:
+      pipe.publish(
+        settings.cache_invalidation_channel, self._invalidation_message(keys=[key]))
+    
+    results = await pipe.execute()
+    if use_local:
+      self.local_cache.set(key, value, expire)
+    return results[0]
+
+  async def set(self, key, value, expire=None):
+    """키-값 저장"""
+    if not self.is_connected:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return True
+      
+    try:
+      return await self._write(key, value, expire)
     except Exception as e:
       print(f"Redis SET 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "set")
       return False
 
   async def setex(self, key, expire_seconds, value):
@@ -88,37 +464,349 @@ class RedisClient:
       return True
       
     try:
-      if isinstance(value, (dict, list)):
-        value = json.dumps(value, ensure_ascii=False)
-      
-      return await self.redis.setex(key, expire_seconds, value)
+      return await self._write(key, value, expire_seconds)
     except Exception as e:
       print(f"Redis SETEX 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "set")
       return False
 
   async def delete(self, *keys):
     """키 삭제"""
+    return await self.delete_many(keys)
+
+  async def delete_many(self, keys):
+    """여러 키를 파이프라인 한 번으로 삭제 (레지스트리/L1 캐시 함께 정리)"""
     if not self.is_connected:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return 0
+    keys = list(keys)
+    if not keys:
+      return 0
+    
+    local_keys = [key for key in keys if self._use_local_cache(key)]
+    if local_keys:
+      self.local_cache.delete(*local_keys)
+      await self._publish_invalidation(keys=local_keys)
       
     try:
-      return await self.redis.delete(*keys)
+      pipe = self.redis.pipeline(transaction=False)
+      pipe.delete(*keys)
+      # 네임스페이스별로 모아서 ZREM 한 번씩만 실행
+      registry_members = {}
+      for key in keys:
+        namespace = self._namespace_of(key)
+        if namespace:
+          registry_members.setdefault(namespace, []).append(key)
+      for namespace, members in registry_members.items():
+        pipe.zrem(self._registry_key(namespace), *members)
+      results = await pipe.execute()
+      return results[0]
     except Exception as e:
       print(f"Redis DELETE 오류: {str(e)}")
+      self._record_errors(keys, "delete")
       return 0
 
   async def keys(self, pattern):
-    """패턴으로 키 검색"""
+    """패턴으로 키 검색 (KEYS 대신 SCAN으로 점진적으로 조회)"""
     if not self.is_connected:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return []
       
     try:
-      return await self.redis.keys(pattern)
+      found = []
+      async for batch in self.scan_batches(pattern):
+        found.extend(batch)
+      return found
+    except Exception as e:
+      print(f"Redis SCAN 오류 ({pattern}): {str(e)}")
+      return []
+
+  async def scan_batches(self, pattern, batch_size=None):
+    """SCAN으로 패턴에 맞는 키를 batch_size 단위로 나눠서 반환"""
+    batch_size = batch_size or settings.cache_scan_batch_size
+    batch = []
+    async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+      batch.append(key)
+      if len(batch) >= batch_size:
+        yield batch
+        batch = []
+    if batch:
+      yield batch
+
+  async def delete_pattern(self, pattern, batch_size=None):
+    """패턴에 맞는 키를 SCAN + UNLINK로 나눠서 삭제 (다른 요청을 막지 않음)"""
+    if not self.is_connected:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return 0
+
+    try:
+      deleted = 0
+      async for batch in self.scan_batches(pattern, batch_size):
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.unlink(*batch)
+        for key in batch:
+          namespace = self._namespace_of(key)
+          if namespace:
+            pipe.zrem(self._registry_key(namespace), key)
+        results = await pipe.execute()
+        deleted += results[0]
+      return deleted
+    except Exception as e:
+      print(f"Redis 패턴 삭제 오류 ({pattern}): {str(e)}")
+      return 0
+
+  async def clear_namespace(self, namespace, batch_size=None):
+    """네임스페이스의 모든 캐시 키 삭제"""
+    self.local_cache.delete_prefix(f"{namespace}:")
+    await self._publish_invalidation(namespaces=[namespace])
+    deleted = await self.delete_pattern(f"{namespace}:*", batch_size)
+    try:
+      if self.is_connected:
+        await self.redis.unlink(self._registry_key(namespace))
+    except Exception as e:
+      print(f"Redis 레지스트리 삭제 오류 ({namespace}): {str(e)}")
+    return deleted
+
+  def _generation_key(self, namespace):
+    """네임스페이스 세대 번호 키 생성"""
+    return f"{GENERATION_KEY_PREFIX}:{namespace}"
+
+  async def get_generation(self, namespace):
+    """네임스페이스의 현재 세대 번호 조회 (짧은 시간 로컬에 보관)"""
+    cached = self._generations.get(namespace)
+    now = time.monotonic()
+    if cached and now - cached[1] < settings.cache_generation_refresh_seconds:
+      return cached[0]
+
+    if not self.is_connected:
+      return cached[0] if cached else 0
+
+    try:
+      value = await self.redis.get(self._generation_key(namespace))
+      generation = int(value) if value else 0
+      self._generations[namespace] = (generation, now)
+      return generation
+    except Exception as e:
+      print(f"Redis 세대 번호 조회 오류 ({namespace}): {str(e)}")
+      return cached[0] if cached else 0
+
+  async def namespace_key(self, namespace, suffix):
+    """세대 번호가 포함된 캐시 키 생성 (예: review_analysis:v3:<hash>)"""
+    generation = await self.get_generation(namespace)
+    return f"{namespace}:v{generation}:{suffix}"
+
+  async def invalidate_namespace(self, namespace):
+    """세대 번호를 올려 네임스페이스 전체를 O(1)로 무효화
+    
+    기존 키는 더 이상 조회되지 않고 각자의 TTL에 따라 만료된다.
+    반환값은 무효화 시점에 유효했던 키 개수.
+    """
+    if not self.is_connected:
+      print(f"Redis 연결이 초기화되지 않았습니다.")
+      return 0
+
+    try:
+      registry_key = self._registry_key(namespace)
+      pipe = self.redis.pipeline(transaction=True)
+      pipe.zremrangebyscore(registry_key, "-inf", time.time())
+      pipe.zcard(registry_key)
+      pipe.incr(self._generation_key(namespace))
+      pipe.unlink(registry_key)
+      results = await pipe.execute()
+      self._generations[namespace] = (results[2], time.monotonic())
+      
+      # 이전 세대의 L1 항목 정리 및 다른 워커의 세대 번호 갱신
+      self.local_cache.delete_prefix(f"{namespace}:")
+      await self._publish_invalidation(namespaces=[namespace])
+      return results[1]
+    except Exception as e:
+      print(f"Redis 네임스페이스 무효화 오류 ({namespace}): {str(e)}")
+      return 0
+
+  async def invalidate_namespaces(self, namespaces=None):
+    """여러 네임스페이스 무효화 (기본값: 전체 캐시 네임스페이스)"""
+    invalidated = {}
+    for namespace in (namespaces or CACHE_NAMESPACES):
+      invalidated[namespace] = await self.invalidate_namespace(namespace)
+    return invalidated
+
+  async def acquire_lock(self, key, token, ttl_seconds):
+    """짧은 분산 락 획득 (SET NX PX)"""
+    if not self.is_connected:
+      return False
+    try:
+      return bool(await self.redis.set(key, token, nx=True, px=int(ttl_seconds * 1000)))
     except Exception as e:
-      print(f"Redis KEYS 오류 ({pattern}): {str(e)}")
+      print(f"Redis 락 획득 오류 ({key}): {str(e)}")
+      return False
+
+  async def extend_lock(self, key, token, ttl_seconds):
+    """락 만료 시간 연장 (자신이 획득한 락만, 이미 만료됐으면 False)"""
+    if not self.is_connected:
+      return False
+    try:
+      return bool(await self.redis.eval(
+        EXTEND_LOCK_SCRIPT, 1, key, token, int(ttl_seconds * 1000)))
+    except Exception as e:
+      print(f"Redis 락 연장 오류 ({key}): {str(e)}")
+      return False
+
+  async def release_lock(self, key, token):
+    """락 해제 (자신이 획득한 락만 해제)"""
+    if not self.is_connected:
+      return False
+    try:
+      return bool(await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, key, token))
+    except Exception as e:
+      print(f"Redis 락 해제 오류 ({key}): {str(e)}")
+      return False
+
+  async def exists(self, key):
+    """키 존재 여부 확인"""
+    if not self.is_connected:
+      return False
+    try:
+      return bool(await self.redis.exists(key))
+    except Exception as e:
+      print(f"Redis EXISTS 오류 ({key}): {str(e)}")
+      return False
+
+  def _popularity_key(self, category, day):
+    """일자별 조회 수 sorted set 키 (예: popularity:review_analysis:20250101)"""
+    return f"{POPULARITY_KEY_PREFIX}:{category}:{day}"
+
+  async def increment_popularity(self, category, member):
+    """오늘 조회 수 1 증가 (일자별 키는 집계 기간이 지나면 자동 만료)"""
+    if not self.is_connected:
+      return False
+    try:
+      key = self._popularity_key(category, time.strftime("%Y%m%d"))
+      pipe = self.redis.pipeline(transaction=False)
+      pipe.zincrby(key, 1, member)
+      pipe.expire(key, (settings.popularity_window_days + 1) * 86400)
+      await pipe.execute()
+      return True
+    except Exception as e:
+      print(f"Redis 조회 수 기록 오류 ({category}): {str(e)}")
+      return False
+
+  async def top_popular(self, category, limit, days=None):
+    """최근 days일 동안 조회 수가 많은 순으로 member 목록 반환"""
+    if not self.is_connected or limit <= 0:
       return []
+    days = days or settings.popularity_window_days
+    now = time.time()
+    keys = [
+      self._popularity_key(category, time.strftime("%Y%m%d", time.localtime(now - i * 86400)))
+      for i in range(days)
+    ]
+    window_key = f"{POPULARITY_KEY_PREFIX}:{category}:window"
+    try:
+      # 임시 키를 워커끼리 공유하므로 MULTI/EXEC로 묶어 다른 호출의 DELETE가 끼어들지 않게 함
+      pipe = self.redis.pipeline(transaction=True)
+      pipe.zunionstore(window_key, keys)
+      pipe.zrevrange(window_key, 0, limit - 1)
+      pipe.delete(window_key)
+      results = await pipe.execute()
+      return results[1]
+    except Exception as e:
+      print(f"Redis 인기 항목 조회 오류 ({category}): {str(e)}")
+      return []
+
+  async def push_json_log(self, key, entry, max_length):
+    """JSON 항목을 목록 앞에 추가하고 최근 max_length개만 유지"""
+    if not self.is_connected:
+      return False
+    try:
+      pipe = self.redis.pipeline(transaction=False)
+      pipe.lpush(key, json.dumps(entry, ensure_ascii=False))
+      pipe.ltrim(key, 0, max_length - 1)
+      await pipe.execute()
+      return True
+    except Exception as e:
+      print(f"Redis 로그 기록 오류 ({key}): {str(e)}")
+      return False
+
+  async def set_bits(self, key, offsets):
+    """비트맵의 여러 오프셋을 1로 설정 (블룸 필터 갱신용)"""
+    if not self.is_connected or not offsets:
+      return False
+    try:
+      pipe = self.redis.pipeline(transaction=False)
+      for offset in offsets:
+        pipe.setbit(key, offset, 1)
+      await pipe.execute()
+      return True
+    except Exception as e:
+      print(f"Redis 비트맵 갱신 오류 ({key}): {str(e)}")
+      return False
+
+  async def get_json_log(self, key, limit):
+    """최근 항목부터 JSON 로그 조회"""
+    if not self.is_connected:
+      return []
+    try:
+      return [json.loads(item) for item in await self.redis.lrange(key, 0, limit - 1)]
+    except Exception as e:
+      print(f"Redis 로그 조회 오류 ({key}): {str(e)}")
+      return []
+
+  async def count_namespaces(self, namespaces=None):
+    """네임스페이스별 유효 키 개수 조회 (레지스트리 기반, KEYS 미사용)"""
+    namespaces = list(namespaces or CACHE_NAMESPACES)
+    counts = {namespace: 0 for namespace in namespaces}
+    if not self.is_connected:
+      return counts
+
+    try:
+      now = time.time()
+      pipe = self.redis.pipeline(transaction=False)
+      for namespace in namespaces:
+        registry_key = self._registry_key(namespace)
+        # 만료된 항목 정리 후 개수 조회
+        pipe.zremrangebyscore(registry_key, "-inf", now)
+        pipe.zcard(registry_key)
+      results = await pipe.execute()
+      for i, namespace in enumerate(namespaces):
+        counts[namespace] = results[i * 2 + 1]
+      return counts
+    except Exception as e:
+      print(f"Redis 네임스페이스 집계 오류: {str(e)}")
+      return counts
+
+  async def count_namespace(self, namespace):
+    """단일 네임스페이스 유효 키 개수 조회"""
+    counts = await self.count_namespaces([namespace])
+    return counts[namespace]
+
+  async def rebuild_registries(self, batch_size=None):
+    """기존 캐시 키를 SCAN으로 훑어 레지스트리 재구성 (배포 직후 1회)"""
+    if not self.is_connected:
+      return 0
+
+    rebuilt = 0
+    try:
+      for namespace in CACHE_NAMESPACES:
+        registry_key = self._registry_key(namespace)
+        async for batch in self.scan_batches(f"{namespace}:*", batch_size):
+          pipe = self.redis.pipeline(transaction=False)
+          for key in batch:
+            pipe.pttl(key)
+          ttls = await pipe.execute()
+
+          now = time.time()
+          entries = {}
+          for key, ttl_ms in zip(batch, ttls):
+            if ttl_ms == -2:
+              continue  # 그 사이 만료된 키
+            entries[key] = now + ttl_ms / 1000 if ttl_ms > 0 else float("inf")
+          if entries:
+            await self.redis.zadd(registry_key, entries)
+            rebuilt += len(entries)
+      return rebuilt
+    except Exception as e:
+      print(f"Redis 레지스트리 재구성 오류: {str(e)}")
+      return rebuilt
 
   async def flushdb(self):
     """현재 DB의 모든 키 삭제"""
@@ -126,28 +814,48 @@ class RedisClient:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return True
       
+    self.local_cache.clear()
+    self._generations.clear()
+    await self._publish_invalidation(clear_all=True)
+      
     try:
       return await self.redis.flushdb()
     except Exception as e:
       print(f"Redis FLUSHDB 오류: {str(e)}")
       return False
 
-  async def get_json(self, key):
-    """JSON 형태로 저장된 값 조회"""
+  async def get_json(self, key, record=True):
+    """JSON 형태로 저장된 값 조회 (record=False면 적중/미스 지표에 기록하지 않음)"""
     if not self.is_connected:
       print(f"Redis 연결이 초기화되지 않았습니다.")
       return None
       
+    # L1 캐시에 있으면 디코딩된 값을 그대로 반환 (네트워크/디코딩 비용 없음)
+    use_local = self._use_local_cache(key)
+    if use_local:
+      cached = self.local_cache.get_json(key)
+      if cached is not None:
+        if record:
+          self._record_lookup(key, cached, local=True)
+        return cached
+      
     try:
-      value = await self.get(key)
+      value = await self.redis.get(key)
+      if record:
+        self._record_lookup(key, value or None)
       if value:
-        return json.loads(value)
+        decoded = json.loads(value)
+        if use_local:
+          self.local_cache.set(key, value, decoded=decoded)
+        return decoded
       return None
     except json.JSONDecodeError as e:
       print(f"JSON 디코딩 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "decode")
       return None
     except Exception as e:
       print(f"Redis GET_JSON 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "get")
       return None
 
   async def set_json(self, key, value, expire=None):
@@ -161,6 +869,7 @@ class RedisClient:
       return await self.set(key, json_value, expire)
     except Exception as e:
       print(f"Redis SET_JSON 오류 ({key}): {str(e)}")
+      cache_metrics.record_error(self._namespace_of(key), "set")
       return False
 
 # 전역 인스턴스
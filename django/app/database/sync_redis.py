@@ -0,0 +1,73 @@
+import json
+import redis
+from ..config import settings
+from .redis_client import REGISTRY_KEY_PREFIX, GENERATION_KEY_PREFIX
+
+# 크롤러 등 동기 코드에서 캐시를 무효화할 때 사용하는 Redis 연결 (최초 사용 시 생성)
+_client = None
+# 비트맵 등 bytes 값 조회용 연결 (decode_responses=False)
+_raw_client = None
+
+def get_sync_redis():
+  """동기 Redis 클라이언트 반환"""
+  global _client
+  if _client is None:
+    _client = redis.Redis.from_url(
+      settings.redis_url,
+      decode_responses=True,
+      socket_timeout=settings.sync_redis_timeout_seconds,
+      socket_connect_timeout=settings.sync_redis_timeout_seconds
+    )
+  return _client
+
+def get_sync_redis_raw():
+  """값을 디코딩하지 않는 동기 Redis 클라이언트 반환"""
+  global _raw_client
+  if _raw_client is None:
+    _raw_client = redis.Redis.from_url(
+      settings.redis_url,
+      decode_responses=False,
+      socket_timeout=settings.sync_redis_timeout_seconds,
+      socket_connect_timeout=settings.sync_redis_timeout_seconds
+    )
+  return _raw_client
+
+def invalidate_namespace(namespace):
+  """세대 번호를 올려 네임스페이스 전체 무효화 (RedisClient.invalidate_namespace의 동기 버전)
+
+  Redis에 연결할 수 없어도 예외를 올리지 않는다 (캐시 항목은 TTL로 만료됨).
+  """
+  try:
+    client = get_sync_redis()
+    pipe = client.pipeline(transaction=True)
+    pipe.incr(f"{GENERATION_KEY_PREFIX}:{namespace}")
+    pipe.unlink(f"{REGISTRY_KEY_PREFIX}:{namespace}")
+    # 각 워커가 보관 중인 세대 번호/L1 캐시도 바로 버리도록 알림
+    pipe.publish(settings.cache_invalidation_channel, json.dumps({
+      "type": "invalidate",
+      "origin": "sync",
+      "keys": [],
+      "namespaces": [namespace],
+      "all": False
+    }, ensure_ascii=False))
+    pipe.execute()
+    return True
+  except Exception as e:
+    print(f"Redis 캐시 무효화 오류 ({namespace}): {str(e)}")
+    return False
+
+def publish_message(message_type, **payload):
+  """캐시 무효화 채널로 이벤트 발행 (각 워커의 RedisClient.add_message_handler로 전달)
+
+  Redis에 연결할 수 없어도 예외를 올리지 않는다.
+  """
+  try:
+    get_sync_redis().publish(settings.cache_invalidation_channel, json.dumps({
+      "type": message_type,
+      "origin": "sync",
+      **payload
+    }, ensure_ascii=False))
+    return True
+  except Exception as e:
+    print(f"Redis 메시지 발행 오류 ({message_type}): {str(e)}")
+    return False
@@ -1,14 +1,36 @@
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from .config import settings
 from .database.mongodb import mongodb_manager
+from .database.mongo_factory import close_sync_client
 from .database.redis_client import redis_client
 from .database.postgres import tortoise_manager
-from .services.search_service import search_service
-from .services.review_analysis_service import review_analysis_service
+from .database.indexes import ensure_indexes, backfill_derived_fields
+from .services.crawl_job_service import crawl_job_service
+from .services.cache_warmup_service import cache_warmup_service
+from .services.company_suggest_service import company_suggest_service
 from .routers import (
-  company, review, chatbot, emotion, news, analyze, user_review, system, inquiry)
+  company, review, chatbot, emotion, news, analyze, user_review, system, inquiry, crawl_job)
+
+# 시작 시 띄운 백그라운드 작업 (완료 전까지 참조 유지)
+_startup_tasks = set()
+
+def _spawn_startup_task(name, coro):
+  """시작 시 백그라운드 작업 실행 (참조를 유지하고 실패는 로그로 남김)"""
+  async def run():
+    try:
+      await coro
+    except asyncio.CancelledError:
+      raise
+    except Exception as e:
+      print(f"⚠️ {name} 실패: {e}")
+  
+  task = asyncio.create_task(run())
+  _startup_tasks.add(task)
+  task.add_done_callback(_startup_tasks.discard)
+  return task
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -21,6 +43,12 @@ async def lifespan(app: FastAPI):
   mongodb_connected = mongodb_manager.is_connected
   if mongodb_connected:
     print("✅ MongoDB 연결 완료")
+    # 선언된 컬렉션 인덱스 생성 (이미 있으면 변경 없음)
+    index_results = await ensure_indexes()
+    failed = [r["index"] for r in index_results if r["status"] == "failed"]
+    print(f"✅ MongoDB 인덱스 확인 완료 ({len(index_results) - len(failed)}/{len(index_results)})")
+    # 저장 시 계산하는 필드(검색 n-gram, article_key, 재무 숫자)가 없는 기존 문서 채우기 (백그라운드)
+    _spawn_startup_task("파생 필드 채우기", backfill_derived_fields())
   else:
     print("⚠️ MongoDB 연결 실패 (계속 실행)")
   
@@ -29,6 +57,8 @@ async def lifespan(app: FastAPI):
   redis_connected = redis_client.is_connected
   if redis_connected:
     print("✅ Redis 연결 완료")
+    # 기존 캐시 키를 네임스페이스 레지스트리에 반영 (SCAN 기반, 백그라운드)
+    _spawn_startup_task("캐시 네임스페이스 레지스트리 재생성", redis_client.rebuild_registries())
   else:
     print("⚠️ Redis 연결 실패 (계속 실행)")
   
@@ -45,18 +75,38 @@ async def lifespan(app: FastAPI):
   else:
     print("🚀 FastAPI 애플리케이션 시작!")
   
+  # 랭킹/인기 기업 리뷰 분석 캐시 미리 계산 (시작 시 + TTL 만료 전 주기적으로)
+  if mongodb_connected and redis_connected:
+    cache_warmup_service.start()
+  
+  # 기업명 자동완성 인덱스 (워커별 메모리, 크롤러 저장 이벤트로 추가)
+  if mongodb_connected:
+    await company_suggest_service.start()
+  
+  # 요청 경로 밖에서 실행하는 크롤링 작업 워커 (종류별 브라우저 수 제한)
+  crawl_job_service.start()
+  
   yield  # 애플리케이션 실행
   
-  # 종료 시 드라이버 및 연결 정리
-  if search_service and review_analysis_service:
-    search_service.cleanup_crawler()
-    review_analysis_service.cleanup_review_crawler()
-    print("✅ 크롤러 정리 완료")
+  # 아직 끝나지 않은 시작 작업은 연결을 닫기 전에 취소
+  for task in list(_startup_tasks):
+    task.cancel()
+  await asyncio.gather(*_startup_tasks, return_exceptions=True)
+  
+  await cache_warmup_service.stop()
+  await company_suggest_service.stop()
+  
+  # 종료 시 크롤링 워커(드라이버) 및 연결 정리
+  await crawl_job_service.stop()
+  print("✅ 크롤러 정리 완료")
   
   if mongodb_manager.is_connected:
     await mongodb_manager.disconnect()
     print("✅ MongoDB 연결 종료")
   
+  # 크롤러/동기 저장소가 공유하는 pymongo 클라이언트 종료
+  close_sync_client()
+  
   if redis_client.is_connected:
     await redis_client.disconnect()
     print("✅ Redis 연결 종료")
@@ -89,4 +139,5 @@ app.include_router(chatbot.router, prefix="/api")
 app.include_router(inquiry.router, prefix="/api")
 app.include_router(emotion.router, prefix="/api")
 app.include_router(news.router, prefix="/api")
-app.include_router(analyze.router, prefix="/api")
\ No newline at end of file
+app.include_router(analyze.router, prefix="/api")
+app.include_router(crawl_job.router, prefix="/api")
\ No newline at end of file
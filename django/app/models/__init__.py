@@ -1,11 +1,13 @@
 # 비즈니스 모델 및 ORM 모델
 from .company import CompanyModel, CompanyReviewModel
+from .news_article import NewsArticleModel
 from .inquiry import Inquiry
 
 __all__ = [
   # MongoDB 모델
   'CompanyModel',
   'CompanyReviewModel',
+  'NewsArticleModel',
   
   # PostgreSQL 모델 (Tortoise ORM)
   'Inquiry'
@@ -1,4 +1,44 @@
+import asyncio
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
 from ..database.mongodb import mongodb_manager
+from ..utils.text_utils import build_search_fields, build_substring_query, contains_text
+from ..utils.financial_parser import (
+  FINANCIAL_FIELDS, amount_field, year_field, build_financial_fields)
+
+# 검색/랭킹 전용 필드는 응답/캐시에 포함하지 않음
+COMPANY_PROJECTION = {
+  "name_ngrams": 0,
+  **{amount_field(f): 0 for f in FINANCIAL_FIELDS},
+  **{year_field(f): 0 for f in FINANCIAL_FIELDS}
+}
+
+# 검색 목록용 필드 (상세 정보는 get_company_by_exact_name으로 별도 조회)
+COMPANY_LIST_PROJECTION = {"name": 1, "산업 분야": 1, "summary": 1, "로고": 1}
+SUMMARY_SNIPPET_LENGTH = 100
+
+def parse_cursor(cursor):
+  """페이지 커서(마지막 문서 _id 문자열)를 ObjectId로 변환 (잘못된 값이면 ValueError)"""
+  if not cursor:
+    return None
+  try:
+    return ObjectId(cursor)
+  except (InvalidId, TypeError):
+    raise ValueError(f"잘못된 커서입니다: {cursor}")
+
+def to_list_item(company):
+  """목록 응답용 문서 (요약은 앞부분만)"""
+  summary = company.get("summary") or ""
+  if len(summary) > SUMMARY_SNIPPET_LENGTH:
+    summary = summary[:SUMMARY_SNIPPET_LENGTH] + "..."
+  return {
+    "id": str(company["_id"]) if company.get("_id") is not None else company.get("id"),
+    "name": company.get("name"),
+    "산업 분야": company.get("산업 분야"),
+    "summary": summary,
+    "로고": company.get("로고")
+  }
 
 class CompanyModel:
   """기업 정보 모델"""
@@ -13,22 +53,79 @@ class CompanyModel:
     return self.db_manager.db['companies']
   
   async def get_companies_by_name(self, name):
-    """다수 기업 검색"""
+    """다수 기업 검색 (기업명 부분 일치, name_ngrams 인덱스 사용)"""
     try:
-      cursor = self.collection.find({"name": {"$regex": name, "$options": "i"}})
-      return await cursor.to_list(length=None)
+      cursor = self.collection.find(
+        build_substring_query("name", name), COMPANY_PROJECTION)
+      companies = await cursor.to_list(length=None)
+      return [c for c in companies if contains_text(c.get("name"), name)]
     except Exception as e:
       print(f"기업 조회 중 오류 발생: {str(e)}")
       return []
   
+  async def get_company_page(self, search_type, keyword, limit, cursor=None):
+    """검색 결과 한 페이지 조회 (_id 순, 목록용 필드만)
+
+    반환: (목록 문서, 다음 페이지 커서 또는 None, 검색어가 비어 있으면 빈 페이지)
+    """
+    if not keyword:
+      return [], None
+    if search_type == "category":
+      query = {"산업 분야": {"$regex": keyword, "$options": "i"}}
+      matches = lambda doc: True
+    else:
+      query = build_substring_query("name", keyword)
+      matches = lambda doc: contains_text(doc.get("name"), keyword)
+
+    after = parse_cursor(cursor)
+    page = []
+    try:
+      # 이름 검색은 n-gram 후보를 다시 확인하므로 limit + 1개가 찰 때까지 이어서 조회
+      while len(page) <= limit:
+        page_query = {**query, "_id": {"$gt": after}} if after else query
+        docs_cursor = self.collection.find(page_query, COMPANY_LIST_PROJECTION).sort("_id", 1)
+        docs = await docs_cursor.limit(limit + 1).to_list(length=limit + 1)
+        page.extend(doc for doc in docs if matches(doc))
+        if len(docs) <= limit:
+          break
+        after = docs[-1]["_id"]
+    except Exception as e:
+      print(f"기업 페이지 조회 중 오류 발생: {str(e)}")
+      return [], None
+
+    has_more = len(page) > limit
+    page = page[:limit]
+    next_cursor = str(page[-1]["_id"]) if has_more else None
+    return [to_list_item(doc) for doc in page], next_cursor
+
   async def get_company_by_exact_name(self, name):
     """단일 기업 검색"""
     try:
-      return await self.collection.find_one({"name": name})
+      return await self.collection.find_one({"name": name}, COMPANY_PROJECTION)
     except Exception as e:
       print(f"기업 조회 중 오류 발생: {str(e)}")
       return None
   
+  async def get_companies_by_exact_names(self, names):
+    """여러 기업을 이름으로 한 번에 조회 (name 인덱스를 타는 $in 쿼리 한 번)"""
+    if not names:
+      return []
+    try:
+      cursor = self.collection.find({"name": {"$in": list(names)}}, COMPANY_PROJECTION)
+      return await cursor.to_list(length=None)
+    except Exception as e:
+      print(f"기업 일괄 조회 중 오류 발생: {str(e)}")
+      return []
+  
+  async def get_all_names(self):
+    """전체 기업명 목록 (자동완성 인덱스 생성용, 이름 필드만 조회)"""
+    try:
+      cursor = self.collection.find({"name": {"$type": "string"}}, {"_id": 0, "name": 1})
+      return [doc["name"] async for doc in cursor]
+    except Exception as e:
+      print(f"기업명 목록 조회 중 오류 발생: {str(e)}")
+      return []
+
   async def get_total_count(self):
     """전체 기업 수 조회"""
     try:
@@ -37,24 +134,103 @@ class CompanyModel:
       print(f"전체 수 조회 중 오류 발생: {str(e)}")
       return 0
 
-  async def get_companies_by_field(self, field_name):
-    """특정 필드가 있는 모든 기업 조회"""
+  async def get_companies_by_category(self, category):
+    """특정 카테고리의 기업들 조회"""
     try:
-      cursor = self.collection.find({field_name: {"$exists": True, "$ne": None}})
+      cursor = self.collection.find(
+        {"산업 분야": {"$regex": category, "$options": "i"}}, COMPANY_PROJECTION)
       return await cursor.to_list(length=None)
     except Exception as e:
-      print(f"{field_name} 필드 기업 조회 중 오류 발생: {str(e)}")
+      print(f"카테고리 기업 조회 중 오류 발생: {str(e)}")
       return []
 
-  async def get_companies_by_category(self, category):
-    """특정 카테고리의 기업들 조회"""
+  async def get_top_by_financial_field(self, field_name, year, limit):
+    """연도별 재무 필드 상위 기업 (<필드>_year, <필드>_amount 인덱스 사용)"""
     try:
-      cursor = self.collection.find({"산업 분야": {"$regex": category, "$options": "i"}})
-      return await cursor.to_list(length=None)
+      cursor = self.collection.aggregate([
+        {"$match": {year_field(field_name): year}},
+        {"$sort": {amount_field(field_name): -1}},
+        {"$limit": limit},
+        {"$project": {
+          "_id": 0,
+          "name": {"$ifNull": ["$name", ""]},
+          "amount": f"${amount_field(field_name)}",
+          "year": f"${year_field(field_name)}"
+        }}
+      ])
+      return await cursor.to_list(length=limit)
     except Exception as e:
-      print(f"카테고리 기업 조회 중 오류 발생: {str(e)}")
+      print(f"{field_name} 랭킹 조회 중 오류 발생: {str(e)}")
       return []
 
+  async def get_financial_rankings(self, year, limit):
+    """연도별 재무 필드 3종 상위 기업을 한 번에 조회
+
+    필드별 get_top_by_financial_field를 동시에 실행한다 (각각 <필드>_year, <필드>_amount
+    인덱스를 따라 상위 limit개만 읽음).
+    반환: {필드명: [{"name", "amount", "year"}, ...]}
+    """
+    rankings = await asyncio.gather(
+      *(self.get_top_by_financial_field(field, year, limit) for field in FINANCIAL_FIELDS))
+    return dict(zip(FINANCIAL_FIELDS, rankings))
+
+  async def backfill_financial_fields(self, batch_size=500):
+    """재무 숫자 필드(<필드>_amount/_year)가 없는 기존 문서에 파싱 결과 채워 넣기
+
+    파싱할 수 없는 값은 null로 채워 다음 시작 때 다시 읽지 않는다.
+    """
+    updated = 0
+    try:
+      cursor = self.collection.find(
+        {"$or": [
+          {f: {"$exists": True}, amount_field(f): {"$exists": False}} for f in FINANCIAL_FIELDS
+        ]},
+        {f: 1 for f in FINANCIAL_FIELDS}
+      )
+      operations = []
+      async for doc in cursor:
+        fields = build_financial_fields(doc, with_unparsable=True)
+        if not fields:
+          continue
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+        if len(operations) >= batch_size:
+          updated += (await self.collection.bulk_write(operations, ordered=False)).modified_count
+          operations = []
+      if operations:
+        updated += (await self.collection.bulk_write(operations, ordered=False)).modified_count
+    except Exception as e:
+      print(f"기업 재무 필드 채우기 중 오류 발생: {str(e)}")
+    return updated
+
+  async def backfill_search_fields(self, batch_size=500):
+    """검색 필드(name_ngrams)가 없는 기존 문서에 채워 넣기
+
+    예전에 함께 저장하던 name_chosung(조회하지 않는 필드)도 제거한다.
+    """
+    updated = 0
+    try:
+      cursor = self.collection.find(
+        {"$or": [{"name_ngrams": {"$exists": False}}, {"name_chosung": {"$exists": True}}]},
+        {"name": 1}
+      )
+      operations = []
+      async for doc in cursor:
+        operations.append(UpdateOne(
+          {"_id": doc["_id"]},
+          {
+            "$set": build_search_fields("name", doc.get("name", "")),
+            "$unset": {"name_chosung": ""}
+          }
+        ))
+        if len(operations) >= batch_size:
+          updated += (await self.collection.bulk_write(operations, ordered=False)).modified_count
+          operations = []
+      if operations:
+        updated += (await self.collection.bulk_write(operations, ordered=False)).modified_count
+    except Exception as e:
+      print(f"기업 검색 필드 채우기 중 오류 발생: {str(e)}")
+    return updated
+
 class CompanyReviewModel:
   """기업 리뷰 모델"""
   def __init__(self):
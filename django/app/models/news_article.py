@@ -0,0 +1,681 @@
+import re
+import asyncio
+from datetime import datetime, date as date_type, timedelta
+from ..config import settings
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
+from ..database.mongodb import mongodb_manager
+from ..database.redis_client import redis_client
+from ..utils.bloom_filter import article_bloom
+from ..utils.text_utils import (
+  build_search_fields, build_substring_query, contains_text, make_article_key)
+
+# 기사 목록 조회 시 반환하는 필드
+ARTICLE_LIST_PROJECTION = {
+  "_id": 0,
+  "title": 1,
+  "summary": 1,
+  "press": 1,
+  "writer": 1,
+  "date": 1,
+  "link": 1,
+  "keyword": 1,
+  "model": 1
+}
+
+RECENT_ARTICLE_PROJECTION = {
+  "_id": 0,
+  "title": 1,
+  "summary": 1,
+  "press": 1,
+  "writer": 1,
+  "date": 1,
+  "link": 1,
+  "keyword": 1
+}
+
+# 존재 확인/재사용 시 읽는 필드만 조회
+EXISTING_ARTICLE_PROJECTION = {
+  "_id": 0,
+  "article_key": 1,
+  "label": 1,
+  "confidence": 1,
+  "analyzed_at": 1
+}
+
+# 일별 감정 집계 컬렉션 ((keyword, model, date, label)별 기사 수/신뢰도 합)
+SENTIMENT_DAILY_COLLECTION = "sentiment_daily"
+
+# 시작 시 집계 생성은 워커 하나만 실행 (생성 시간보다 넉넉하게)
+SENTIMENT_DAILY_LOCK_KEY = f"{SENTIMENT_DAILY_COLLECTION}:rebuild_lock"
+SENTIMENT_DAILY_LOCK_TTL_SECONDS = 600
+
+# 일괄 저장 중 저장 전 값을 받는 갱신(find_one_and_update)의 동시 실행 수 (커넥션 풀의 일부만 사용)
+ROLLUP_UPDATE_CONCURRENCY = max(1, settings.mongodb_max_pool_size // 5)
+
+# 집계 증감 계산 시 읽는 기존 기사 필드
+ROLLUP_SOURCE_PROJECTION = {
+  "_id": 0,
+  "article_key": 1,
+  "keyword": 1,
+  "date": 1,
+  "label": 1,
+  "confidence": 1
+}
+
+TREND_INTERVALS = ("day", "week", "month")
+
+# 2025/07/01, 2025.07.01, 2025-07-01 10:00 등 언론사/수집처별 날짜 표기
+_DAY_PATTERN = re.compile(r"(\d{4})\D(\d{1,2})\D(\d{1,2})")
+
+# 아래 쿼리/문서 생성 함수는 비동기 모델과 동기 facade(crawling_database.py)가 함께 사용
+
+def article_key_of(article):
+  """기사 dict의 article_key (제목 + 날짜 + 언론사 해시)"""
+  return make_article_key(article.get("title", ""), article.get("date", ""), article.get("press", ""))
+
+def build_bulk_query(keys, model):
+  """[article_key, ...] 일괄 존재 확인 쿼리 ((article_key, model) 유니크 인덱스 사용)"""
+  return {"article_key": {"$in": list(set(keys))}, "model": model}
+
+def index_by_article_key(docs):
+  """{article_key: document} 형태로 변환"""
+  return {doc["article_key"]: doc for doc in docs if doc.get("article_key")}
+
+def build_article_record(article, label, confidence, keyword, model, now):
+  """기사 분석 결과 저장 문서 생성 (요약이 비어 있으면 None)"""
+  summary = article.get("summary")
+  if not isinstance(summary, str) or not summary.strip():
+    return None
+  return {
+    "article_key": article_key_of(article),
+    "title": article.get("title", ""),
+    "summary": summary.strip(),
+    "press": article.get("press", ""),
+    "writer": article.get("writer", ""),
+    "date": article.get("date", ""),
+    "link": article.get("link", ""),
+    "keyword": keyword,
+    "model": model,
+    "label": label,
+    "confidence": confidence,
+    "analyzed_at": now,
+    "updated_at": now,
+    **build_search_fields("title", article.get("title", "")),
+  }
+
+def upsert_filter(doc):
+  """기사 문서의 저장 기준 (article_key, model)"""
+  return {"article_key": doc["article_key"], "model": doc["model"]}
+
+def upsert_update(doc, now):
+  """기사 문서 1건 저장 내용 (없으면 created_at과 함께 삽입)"""
+  return {"$set": doc, "$setOnInsert": {"created_at": now}}
+
+def build_upsert_operation(doc, now):
+  """기사 문서 1건의 upsert 연산 (기준: article_key, model)"""
+  return UpdateOne(upsert_filter(doc), upsert_update(doc, now), upsert=True)
+
+def build_insert_operation(doc, now):
+  """기사 문서가 없을 때만 삽입하는 연산 (이미 있으면 아무것도 바꾸지 않음)"""
+  return UpdateOne(upsert_filter(doc), {"$setOnInsert": {**doc, "created_at": now}}, upsert=True)
+
+def find_rollup_updates(docs, result, model):
+  """삽입되지 않은 일별 감정 집계 대상 문서 (저장 전 값을 받아 따로 갱신해야 하는 문서)
+
+  result.upserted_ids는 {연산 순번: _id}이며 docs는 연산과 같은 순서여야 한다.
+  """
+  inserted = result.upserted_ids or {}
+  return [
+    doc for i, doc in enumerate(docs)
+    if i not in inserted and rollup_key(doc, model) is not None
+  ]
+
+def build_bulk_upsert_operations(records, model, now):
+  """기사 일괄 저장용 UpdateOne 목록 생성
+
+  records: [{"article": ..., "label": ..., "confidence": ..., "keyword": ...}, ...]
+  반환: (operations, docs, rejected, duplicates)
+  - operations: 일별 감정 집계 대상(rollup_key가 있는 문서)은 없을 때만 삽입하는 연산
+    (이미 있던 문서는 find_rollup_updates로 골라 저장 전 값을 받으며 갱신), 그 외는 upsert
+  - docs: operations와 같은 순서의 저장 문서 목록
+  - rejected: 요약이 비어 저장하지 않은 기사 수
+  - duplicates: 같은 요청 안에서 article_key가 겹쳐 마지막 것만 저장한 기사 수
+  """
+  latest = {}
+  rejected = 0
+  for record in records:
+    article = record["article"]
+    doc = build_article_record(
+      article, record.get("label"), record.get("confidence"), record.get("keyword"), model, now)
+    if doc is None:
+      rejected += 1
+      continue
+    latest[doc["article_key"]] = doc
+
+  docs = list(latest.values())
+  operations = [
+    build_insert_operation(doc, now) if rollup_key(doc, model) is not None
+    else build_upsert_operation(doc, now)
+    for doc in docs
+  ]
+  duplicates = len(records) - rejected - len(operations)
+  return operations, docs, rejected, duplicates
+
+def article_day(date):
+  """기사 날짜 문자열을 YYYY-MM-DD로 변환 (날짜를 알 수 없으면 None)"""
+  match = _DAY_PATTERN.search(date or "") if isinstance(date, str) else None
+  if not match:
+    return None
+  try:
+    return date_type(*map(int, match.groups())).isoformat()
+  except ValueError:
+    return None
+
+def _confidence(doc):
+  value = doc.get("confidence")
+  return float(value) if isinstance(value, (int, float)) else 0.0
+
+def rollup_key(doc, model):
+  """기사 문서의 일별 감정 집계 키 (keyword, model, date, label) (집계 대상이 아니면 None)"""
+  day = article_day(doc.get("date"))
+  if day is None or not doc.get("label") or not doc.get("keyword"):
+    return None
+  return (doc["keyword"], model, day, doc["label"])
+
+def build_rollup_deltas(docs, existing, model):
+  """저장할 기사 문서와 저장 전 문서로 일별 감정 집계 증감 계산
+
+  docs: 이번에 저장할 문서 목록, existing: 저장 전 {article_key: 문서} (ROLLUP_SOURCE_PROJECTION)
+  반환: {(keyword, model, date, label): (기사 수 증감, 신뢰도 합 증감)}
+  - 새 기사는 +1, 라벨/키워드/신뢰도가 바뀐 기사는 이전 키 -1 후 새 키 +1, 그대로인 기사는 제외
+  """
+  deltas = {}
+
+  def add(doc, sign):
+    key = rollup_key(doc, model)
+    if key is None:
+      return
+    count, confidence = deltas.get(key, (0, 0.0))
+    deltas[key] = (count + sign, confidence + sign * _confidence(doc))
+
+  for doc in docs:
+    old = existing.get(doc["article_key"])
+    if old is not None:
+      if rollup_key(old, model) == rollup_key(doc, model) and _confidence(old) == _confidence(doc):
+        continue
+      add(old, -1)
+    add(doc, 1)
+  return {key: delta for key, delta in deltas.items() if delta != (0, 0.0)}
+
+def build_rollup_operations(deltas, now):
+  """집계 증감을 sentiment_daily $inc upsert 연산으로 변환"""
+  return [
+    UpdateOne(
+      {"keyword": keyword, "model": model, "date": day, "label": label},
+      {"$inc": {"count": count, "confidence_sum": confidence}, "$set": {"updated_at": now}},
+      upsert=True
+    )
+    for (keyword, model, day, label), (count, confidence) in deltas.items()
+  ]
+
+def build_rollup_rebuild_pipeline():
+  """원본 기사에서 (keyword, model, 원본 날짜, label)별 기사 수/신뢰도 합을 구하는 파이프라인
+
+  날짜 표기는 파이썬에서 article_day()로 맞춘 뒤 합친다 (merge_rollup_rows).
+  """
+  return [
+    {"$match": {"label": {"$nin": [None, ""]}, "keyword": {"$nin": [None, ""]}}},
+    {"$group": {
+      "_id": {"keyword": "$keyword", "model": "$model", "date": "$date", "label": "$label"},
+      "count": {"$sum": 1},
+      "confidence_sum": {"$sum": {"$cond": [{"$isNumber": "$confidence"}, "$confidence", 0]}}
+    }}
+  ]
+
+def merge_rollup_rows(rows, now):
+  """재생성 파이프라인 결과를 날짜 정규화 후 sentiment_daily 문서 목록으로 변환"""
+  merged = {}
+  for row in rows:
+    group = row["_id"]
+    key = rollup_key(group, group.get("model"))
+    if key is None:
+      continue
+    count, confidence = merged.get(key, (0, 0.0))
+    merged[key] = (count + row["count"], confidence + row["confidence_sum"])
+  return [
+    {"keyword": keyword, "model": model, "date": day, "label": label,
+     "count": count, "confidence_sum": confidence, "updated_at": now}
+    for (keyword, model, day, label), (count, confidence) in merged.items()
+  ]
+
+def _period_start(day, interval):
+  """YYYY-MM-DD가 속한 구간의 시작일 (week: 월요일, month: 1일)"""
+  if interval == "day":
+    return day
+  value = date_type.fromisoformat(day)
+  if interval == "week":
+    return (value - timedelta(days=value.weekday())).isoformat()
+  return value.replace(day=1).isoformat()
+
+def summarize_trend(rows, interval="day"):
+  """sentiment_daily 문서를 구간별 라벨 기사 수/비율/평균 신뢰도로 변환 (날짜순)"""
+  periods = {}
+  for row in rows:
+    period = periods.setdefault(_period_start(row["date"], interval), {})
+    count, confidence = period.get(row["label"], (0, 0.0))
+    period[row["label"]] = (count + row["count"], confidence + row["confidence_sum"])
+
+  trend = []
+  for start in sorted(periods):
+    labels = {label: value for label, value in periods[start].items() if value[0] > 0}
+    total = sum(count for count, _ in labels.values())
+    if not total:
+      continue
+    trend.append({
+      "period": start,
+      "total": total,
+      "counts": {label: count for label, (count, _) in labels.items()},
+      "ratios": {label: round(count / total * 100, 1) for label, (count, _) in labels.items()},
+      "avg_confidence": {
+        label: round(confidence / count, 4) for label, (count, confidence) in labels.items()
+      }
+    })
+  return trend
+
+def bloom_offsets(keys):
+  """article_key 목록을 저장 기사 블룸 필터에 추가할 때의 (Redis 키, 비트 오프셋 목록)"""
+  bloom = article_bloom()
+  return bloom.redis_key(), sorted({o for key in keys for o in bloom.positions(key)})
+
+def new_bulk_report(rejected, duplicates):
+  """일괄 저장 결과 집계 초기값"""
+  return {"inserted": 0, "updated": 0, "skipped": duplicates, "rejected": rejected}
+
+def add_bulk_result(report, result, rollup_updates, existing):
+  """배치 저장 결과를 집계에 반영
+
+  rollup_updates: 따로 갱신한 집계 대상 문서, existing: 그중 저장 전 문서가 있던 {article_key: 문서}
+  (그사이 삭제돼 다시 삽입된 문서는 신규, 삽입 전용 연산은 이미 있으면 변경 없이 matched로만 집계됨)
+  """
+  report["inserted"] += result.upserted_count + len(rollup_updates) - len(existing)
+  report["updated"] += result.modified_count + len(existing)
+  report["skipped"] += result.matched_count - result.modified_count - len(rollup_updates)
+
+def build_conditions_query(
+  keyword, start_date, end_date, unified_category=None, incident_category=None):
+  """키워드/기간/카테고리 조건 기사 조회 쿼리 (제목 부분 일치는 title_ngrams 인덱스 사용)"""
+  query = {
+    **build_substring_query("title", keyword),
+    "date": {"$gte": start_date, "$lte": end_date}
+  }
+  if unified_category:
+    query["unified_category"] = {"$in": unified_category}
+  if incident_category:
+    query["incident_category"] = {"$in": incident_category}
+  return query
+
+def filter_title_matches(docs, keyword):
+  """n-gram 후보 중 제목에 keyword가 실제로 포함된 기사만 반환"""
+  return [doc for doc in docs if contains_text(doc.get("title"), keyword)]
+
+def build_latest_date_query(
+  keyword, start_date, end_date, unified_category, incident_category, model):
+  """가장 최근 분석 시각 조회 쿼리"""
+  query = {"keyword": keyword, "model": model}
+  if start_date and end_date:
+    query["date"] = {"$gte": start_date, "$lte": end_date}
+  if unified_category:
+    query["unified_category"] = {"$in": unified_category}
+  if incident_category:
+    query["incident_category"] = {"$in": incident_category}
+  return query
+
+def _format_scored_keywords(raw_keywords):
+  """[(키워드, 점수), ...]를 점수 비율이 포함된 딕셔너리 목록으로 변환"""
+  total = sum(score for _, score in raw_keywords if isinstance(score, (int, float)))
+  return [
+    {
+      "keyword": kw,
+      "score": round(score, 4),
+      "ratio": round(score / total * 100, 1) if total > 0 else 0
+    }
+    for kw, score in raw_keywords
+  ]
+
+def build_keyword_analysis_doc(
+  keyword, method, overall_keywords, individual_keywords, start_date, end_date,
+  unified_category, incident_category, now):
+  """뉴스 키워드 분석 결과(전체 + 기사별) 저장 문서 생성"""
+  # 전체 키워드 비율 계산
+  if overall_keywords and isinstance(overall_keywords[0], (tuple, list)):
+    formatted_overall = _format_scored_keywords(overall_keywords)
+  else:
+    formatted_overall = overall_keywords
+
+  # 개별 기사별 키워드 구조 정비
+  formatted_individual = []
+  for idx, doc in enumerate(individual_keywords):
+    raw_keywords = doc.get("keywords", [])
+    if raw_keywords and isinstance(raw_keywords[0], (tuple, list)):
+      formatted_keywords = _format_scored_keywords(raw_keywords)
+    elif raw_keywords and isinstance(raw_keywords[0], dict):
+      # 이미 정제된 형태일 경우 그대로 사용
+      formatted_keywords = raw_keywords
+    else:
+      formatted_keywords = []
+
+    formatted_individual.append({
+      "title": doc.get("title", f"기사 {idx + 1}"),
+      "count": doc.get("count", len(raw_keywords)),
+      "ratio": round(doc.get("ratio", 0) * 100, 1),  # 0.23 → 23.0%
+      "keywords": formatted_keywords
+    })
+
+  return {
+    "keyword": keyword,
+    "method": method,
+    "overall_keywords": formatted_overall,
+    "individual_keywords": formatted_individual,
+    "date_range": {
+      "start": start_date,
+      "end": end_date
+    },
+    "unified_category": unified_category,
+    "incident_category": incident_category,
+    "analyzed_at": now
+  }
+
+class NewsArticleModel:
+  """뉴스 기사/키워드 분석 모델 (Motor, 앱 MongoDB 연결 재사용)"""
+  def __init__(self):
+    self.db_manager = mongodb_manager
+
+  @property
+  def db(self):
+    """뉴스 데이터베이스 인스턴스 반환"""
+    if not self.db_manager.is_connected:
+      return None
+    return self.db_manager.client[settings.news_mongodb_db]
+
+  @property
+  def collection(self):
+    """기사 컬렉션 인스턴스 반환"""
+    if not self.db_manager.is_connected:
+      return None
+    return self.db['news_articles']
+
+  @property
+  def rollup_collection(self):
+    """일별 감정 집계 컬렉션 인스턴스 반환"""
+    if not self.db_manager.is_connected:
+      return None
+    return self.db[SENTIMENT_DAILY_COLLECTION]
+
+  @property
+  def keyword_collection(self):
+    """키워드 분석 결과 컬렉션 인스턴스 반환"""
+    if not self.db_manager.is_connected:
+      return None
+    return self.db['keyword_analysis']
+
+  async def find_existing_article(self, title, date, model, press=""):
+    """단일 기사 존재 여부 확인"""
+    try:
+      return await self.collection.find_one(
+        {"article_key": make_article_key(title, date, press), "model": model},
+        EXISTING_ARTICLE_PROJECTION
+      )
+    except Exception as e:
+      print(f"기사 조회 중 오류 발생: {str(e)}")
+      return None
+
+  async def find_existing_bulk(self, keys, model, projection=EXISTING_ARTICLE_PROJECTION):
+    """여러 기사 존재 여부 일괄 확인 (keys: article_key 목록, {article_key: document} 반환)"""
+    if not keys:
+      return {}
+    try:
+      cursor = self.collection.find(build_bulk_query(keys, model), projection)
+      return index_by_article_key(await cursor.to_list(length=None))
+    except Exception as e:
+      print(f"기사 일괄 조회 중 오류 발생: {str(e)}")
+      return {}
+
+  async def _upsert_returning_previous(self, doc, now):
+    """기사 1건 저장 후 저장 전 문서 반환 (ROLLUP_SOURCE_PROJECTION, 없어서 삽입했으면 None)
+
+    이전 값을 저장과 같은 연산으로 받으므로 같은 기사를 동시에 저장해도 집계 증감이 겹치지 않는다.
+    """
+    return await self.collection.find_one_and_update(
+      upsert_filter(doc), upsert_update(doc, now),
+      projection=ROLLUP_SOURCE_PROJECTION, upsert=True, return_document=ReturnDocument.BEFORE
+    )
+
+  async def _upsert_limited(self, semaphore, doc, now):
+    """동시 실행 수를 제한해 _upsert_returning_previous 실행"""
+    async with semaphore:
+      return await self._upsert_returning_previous(doc, now)
+
+  async def upsert_article(self, article, label, confidence, keyword, model):
+    """기사 분석 결과 저장 (기준: article_key, model, 저장한 문서 반환)"""
+    now = datetime.utcnow()
+    record = build_article_record(article, label, confidence, keyword, model, now)
+    if record is None:
+      print(f"⚠️ 기사 요약이 비어 있어 저장 생략: {article.get('title')}")
+      return None
+    try:
+      previous = await self._upsert_returning_previous(record, now)
+      existing = {} if previous is None else {record["article_key"]: previous}
+      await self._apply_rollup(build_rollup_deltas([record], existing, model), now)
+      await redis_client.set_bits(*bloom_offsets([record["article_key"]]))
+      return record
+    except Exception as e:
+      print(f"기사 저장 중 오류 발생: {str(e)}")
+      return None
+
+  async def upsert_articles_bulk(self, records, model, batch_size=None):
+    """기사 분석 결과 일괄 저장 (배치 단위)
+
+    배치마다 unordered bulk_write 한 번으로 저장하고, 이미 있던 일별 감정 집계 대상 기사만
+    find_one_and_update로 갱신하며 저장 전 라벨/신뢰도를 받아 집계에 반영한다
+    (동시 실행 수는 커넥션 풀의 일부로 제한).
+    반환: {"inserted", "updated", "skipped", "rejected"} 건수
+    """
+    now = datetime.utcnow()
+    operations, docs, rejected, duplicates = build_bulk_upsert_operations(records, model, now)
+    report = new_bulk_report(rejected, duplicates)
+    batch_size = batch_size or settings.article_bulk_batch_size
+    semaphore = asyncio.Semaphore(ROLLUP_UPDATE_CONCURRENCY)
+    try:
+      for i in range(0, len(operations), batch_size):
+        batch = docs[i:i + batch_size]
+        result = await self.collection.bulk_write(
+          operations[i:i + batch_size], ordered=False)
+        rollup_updates = find_rollup_updates(batch, result, model)
+        previous = await asyncio.gather(
+          *(self._upsert_limited(semaphore, doc, now) for doc in rollup_updates))
+        # 그사이 삭제돼 다시 삽입된 문서(None)는 새 기사로 집계
+        existing = {
+          doc["article_key"]: old for doc, old in zip(rollup_updates, previous) if old is not None
+        }
+        add_bulk_result(report, result, rollup_updates, existing)
+        await self._apply_rollup(build_rollup_deltas(batch, existing, model), now)
+        # 크롤러가 저장된 기사를 건너뛸 수 있도록 블룸 필터에 추가
+        await redis_client.set_bits(*bloom_offsets([doc["article_key"] for doc in batch]))
+    except Exception as e:
+      print(f"기사 일괄 저장 중 오류 발생: {str(e)}")
+    return report
+
+  async def _apply_rollup(self, deltas, now):
+    """일별 감정 집계에 증감 반영 (실패해도 기사 저장은 유지, rebuild_sentiment_daily로 복구)"""
+    if not deltas:
+      return
+    try:
+      await self.rollup_collection.bulk_write(build_rollup_operations(deltas, now), ordered=False)
+    except Exception as e:
+      print(f"⚠️ 일별 감정 집계 갱신 실패: {str(e)}")
+
+  async def get_sentiment_trend(self, keyword, model, start_date, end_date, interval="day"):
+    """일별 감정 집계로 기간 내 감정 추이 조회 (집계 문서 수 = 일수 × 라벨 수)"""
+    try:
+      cursor = self.rollup_collection.find(
+        {"keyword": keyword, "model": model, "date": {"$gte": start_date, "$lte": end_date}},
+        {"_id": 0, "date": 1, "label": 1, "count": 1, "confidence_sum": 1}
+      ).sort("date", 1)
+      return summarize_trend(await cursor.to_list(length=None), interval)
+    except Exception as e:
+      print(f"감정 추이 조회 중 오류 발생: {str(e)}")
+      return []
+
+  async def rebuild_sentiment_daily(self, batch_size=1000):
+    """원본 기사로 일별 감정 집계 전체 재생성 (집계가 없을 때 또는 어긋났을 때 수동 실행)
+
+    재생성 도중 저장된 기사는 누락/중복될 수 있으므로 저장이 적은 시간에 실행한다.
+    """
+    now = datetime.utcnow()
+    cursor = self.collection.aggregate(build_rollup_rebuild_pipeline(), allowDiskUse=True)
+    docs = merge_rollup_rows(await cursor.to_list(length=None), now)
+    await self.rollup_collection.delete_many({})
+    for i in range(0, len(docs), batch_size):
+      await self.rollup_collection.insert_many(docs[i:i + batch_size], ordered=False)
+    return len(docs)
+
+  async def backfill_sentiment_daily(self):
+    """일별 감정 집계가 비어 있고 기사가 있으면 한 번 생성 (시작 시 실행)
+
+    uvicorn 워커마다 시작 시 실행되므로 Redis 락을 얻은 워커 하나만 생성한다.
+    """
+    token = redis_client.instance_id
+    if not await redis_client.acquire_lock(
+      SENTIMENT_DAILY_LOCK_KEY, token, SENTIMENT_DAILY_LOCK_TTL_SECONDS):
+      return 0
+    try:
+      if await self.rollup_collection.estimated_document_count() > 0:
+        return 0
+      if await self.collection.estimated_document_count() == 0:
+        return 0
+      return await self.rebuild_sentiment_daily()
+    except Exception as e:
+      print(f"일별 감정 집계 생성 중 오류 발생: {str(e)}")
+      return 0
+    finally:
+      await redis_client.release_lock(SENTIMENT_DAILY_LOCK_KEY, token)
+
+  async def get_articles_by_conditions(
+    self, keyword, start_date, end_date, unified_category=None, incident_category=None):
+    """조건에 맞는 저장된 기사 조회"""
+    try:
+      cursor = self.collection.find(
+        build_conditions_query(
+          keyword, start_date, end_date, unified_category, incident_category),
+        ARTICLE_LIST_PROJECTION
+      ).sort("_id", 1)
+      return filter_title_matches(await cursor.to_list(length=None), keyword)
+    except Exception as e:
+      print(f"조건별 기사 조회 중 오류 발생: {str(e)}")
+      return []
+
+  async def get_articles_by_keyword_recent(self, keyword, limit=5):
+    """키워드의 최신 기사 조회"""
+    try:
+      cursor = self.collection.find(
+        {"keyword": keyword, "model": "latest"},
+        RECENT_ARTICLE_PROJECTION
+      ).sort("date", -1).limit(limit)
+      return await cursor.to_list(length=limit)
+    except Exception as e:
+      print(f"최신 기사 조회 중 오류 발생: {str(e)}")
+      return []
+
+  async def find_summary_any_model(self, title, date):
+    """모델과 관계없이 저장된 기사 요약 조회"""
+    try:
+      doc = await self.collection.find_one(
+        {"title": title, "date": date, "summary": {"$exists": True, "$ne": ""}},
+        {"summary": 1}
+      )
+      return doc.get("summary") if doc else None
+    except Exception as e:
+      print(f"기사 요약 조회 중 오류 발생: {str(e)}")
+      return None
+
+  async def get_latest_article_date(
+    self, keyword, start_date, end_date, unified_category, incident_category, model):
+    """조건에 맞는 기사 중 가장 최근 분석 시각 조회"""
+    try:
+      cursor = self.collection.find(
+        build_latest_date_query(
+          keyword, start_date, end_date, unified_category, incident_category, model),
+        {"analyzed_at": 1}
+      ).sort("analyzed_at", -1).limit(1)
+      docs = await cursor.to_list(length=1)
+      return docs[0].get("analyzed_at") if docs else None
+    except Exception as e:
+      print(f"최근 분석 시각 조회 중 오류 발생: {str(e)}")
+      return None
+
+  async def save_overall_keywords(
+    self, keyword, method, overall_keywords, individual_keywords, start_date, end_date,
+    unified_category=None, incident_category=None):
+    """뉴스 키워드 분석 결과 저장"""
+    doc = build_keyword_analysis_doc(
+      keyword, method, overall_keywords, individual_keywords, start_date, end_date,
+      unified_category, incident_category, datetime.utcnow())
+    try:
+      await self.keyword_collection.insert_one(doc)
+      print(f"✅ [DB] 키워드 분석 결과 저장 완료: {keyword} ({method})")
+    except Exception as e:
+      print(f"키워드 분석 결과 저장 중 오류 발생: {str(e)}")
+
+  async def get_keyword_analysis(self, keyword, method, start_date, end_date):
+    """저장된 키워드 분석 결과 조회"""
+    try:
+      return await self.keyword_collection.find_one(
+        {
+          "keyword": keyword,
+          "method": method,
+          "date_range.start": start_date,
+          "date_range.end": end_date
+        },
+        {"_id": 0}
+      )
+    except Exception as e:
+      print(f"키워드 분석 결과 조회 중 오류 발생: {str(e)}")
+      return None
+
+  async def backfill_search_fields(self, batch_size=500):
+    """검색 필드(title_ngrams)나 article_key가 없는 기존 기사에 채워 넣기"""
+    updated = 0
+    try:
+      cursor = self.collection.find(
+        {"$or": [{"title_ngrams": {"$exists": False}}, {"article_key": {"$exists": False}}]},
+        {"title": 1, "date": 1, "press": 1}
+      )
+      operations = []
+      async for doc in cursor:
+        operations.append(UpdateOne(
+          {"_id": doc["_id"]},
+          {"$set": {
+            "article_key": article_key_of(doc),
+            **build_search_fields("title", doc.get("title", ""))
+          }}
+        ))
+        if len(operations) >= batch_size:
+          updated += await self._write_backfill(operations)
+          operations = []
+      if operations:
+        updated += await self._write_backfill(operations)
+    except Exception as e:
+      print(f"기사 검색 필드 채우기 중 오류 발생: {str(e)}")
+    return updated
+
+  async def _write_backfill(self, operations):
+    """채우기 배치 저장 (같은 article_key가 이미 있는 중복 기사는 건너뜀)"""
+    try:
+      return (await self.collection.bulk_write(operations, ordered=False)).modified_count
+    except BulkWriteError as e:
+      print(f"⚠️ 기사 키 중복으로 {len(e.details.get('writeErrors', []))}건 건너뜀")
+      return e.details.get("nModified", 0)
+
+# 전역 인스턴스
+news_article_model = NewsArticleModel()
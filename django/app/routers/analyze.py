@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 
 # 📦 요청 바디 스키마 (Pydantic) 정의
 from app.schemas.analyze_schema import (
@@ -14,7 +15,7 @@ from app.services.analyze_service import (
     emotion_batch
 )
 
-from app.services.analyze_service import analyze_news_filtered_with_cache
+from app.services.analyze_service import analyze_news_filtered_with_cache, get_sentiment_trend
 
 
 # 📍 API 라우터 객체 생성
@@ -53,4 +54,21 @@ async def analyze_news_filtered_route(req: FilteredNewsAnalysisRequest):
 # -----------------------------------------------------------------------------
 @router.post("/batch")
 def batch_analysis_route(req: BatchRequest):
-    return emotion_batch(req)
\ No newline at end of file
+    return emotion_batch(req)
+
+
+# -----------------------------------------------------------------------------
+# ✅ 엔드포인트 4: 키워드 감정 추이 조회
+# - 기사 저장 시 함께 갱신되는 일별 감정 집계(sentiment_daily)에서 조회
+# - 기간이 길어도 원본 기사를 다시 읽지 않음 (일수 × 라벨 수만큼만 조회)
+# - 예: /api/analyzeNews/trend?keyword=삼성&model=vote&interval=week
+# -----------------------------------------------------------------------------
+@router.get("/trend")
+async def sentiment_trend_route(
+    keyword: str = Query(..., description="분석 키워드"),
+    model: str = Query("vote", description="감정 분석 모델 (vote, stack, transformer)"),
+    start_date: Optional[str] = Query(None, description="시작일 (YYYY-MM-DD, 기본: 종료일 90일 전)"),
+    end_date: Optional[str] = Query(None, description="종료일 (YYYY-MM-DD, 기본: 오늘)"),
+    interval: str = Query("day", description="집계 단위 (day, week, month)")
+):
+    return await get_sentiment_trend(keyword, model, start_date, end_date, interval)
@@ -1,11 +1,15 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from ..schemas.company_schema import CompanySearchResult, CompanyItem
 from ..schemas.news_schema import CompanyNewsResult
 from ..schemas.common_schema import ErrorResponse
 from ..schemas.chatbot_schema import InquiryRequest, InquiryResponse
+from ..schemas.crawl_job_schema import CrawlJobAccepted, crawl_job_accepted
 from ..services.search_service import search_service
+from ..services.crawl_job_service import CrawlQueueFullError
+from ..config import settings
 from ..models.inquiry import Inquiry
-from ..services.news_service import crawl_latest_articles_db
+from ..services.news_service import get_latest_articles_with_db
 
 router = APIRouter(prefix="/chatbot", tags=["chatbot"])
 
@@ -16,20 +20,28 @@ router = APIRouter(prefix="/chatbot", tags=["chatbot"])
   description="챗봇에서 기업명을 입력받아 검색 결과를 반환합니다.",
   responses={
     200: {"model": CompanySearchResult, "description": "기업 검색 성공"},
+    202: {"model": CrawlJobAccepted, "description": "크롤링 작업 진행 중 (poll_url로 상태 조회)"},
     404: {"model": ErrorResponse, "description": "해당 기업의 정보를 찾을 수 없음"},
-    500: {"model": ErrorResponse, "description": "서버 오류"}
+    500: {"model": ErrorResponse, "description": "서버 오류"},
+    503: {"model": ErrorResponse, "description": "크롤링 대기열 가득 참"}
   }
 )
 async def search_company_for_chatbot(company_name: str):
   """챗봇용 기업 검색 API"""
   try:
-    companies = await search_service.search_company_with_cache(
-      name=company_name.strip())
+    # 챗봇은 3개만 사용하므로 목록용 필드로 한 페이지만 조회
+    # (DB에 없으면 크롤링 완료를 잠시 기다림 - 대화 흐름상 한 번에 답하는 편이 자연스러움)
+    page = await search_service.search_company_page_with_cache(
+      name=company_name.strip(), limit=3, crawl_wait=settings.crawl_job_wait_seconds)
+    
+    if page.get("crawl_job"):
+      return JSONResponse(status_code=202, content=crawl_job_accepted(
+        page["crawl_job"], f"'{company_name.strip()}' 기업 정보를 수집하고 있습니다"))
     
     company_items = []
-    for company in companies[:3]:
+    for company in page["companies"]:
       company_name = company.get('name')
-      summary = company.get('summary')[:30]
+      summary = (company.get('summary') or "")[:30]
       if len(summary) < 30:
         summary = summary + "..."
       
@@ -43,6 +55,8 @@ async def search_company_for_chatbot(company_name: str):
       companies=company_items
     )
     
+  except CrawlQueueFullError as e:
+    raise HTTPException(status_code=503, detail=str(e))
   except Exception as e:
     print(f"챗봇 기업 검색 중 에러 발생: {str(e)}")
     raise HTTPException(
@@ -67,7 +81,7 @@ async def search_company_for_chatbot(company_name: str):
 async def search_company_news_for_chatbot(company_name: str):
   """챗봇용 뉴스 검색 API"""
   try:
-    articles = crawl_latest_articles_db(keyword=company_name.strip(), headless=True)
+    articles = await get_latest_articles_with_db(keyword=company_name.strip(), headless=True)
 
     limited_articles = articles[:3] if len(articles) > 3 else articles
 
@@ -1,13 +1,22 @@
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import JSONResponse
 from typing import Optional
 from ..schemas.company_schema import (
   CompanySearchResponse,
   CompanyRankingResponse,
   Company,
+  CompanyListItem,
+  CompanySuggestResponse,
+  CompanyBatchRequest,
+  CompanyBatchResponse,
+  CompanyBatchItem,
   RankingItem
 )
 from ..schemas.common_schema import ErrorResponse
+from ..schemas.crawl_job_schema import CrawlJobAccepted, crawl_job_accepted
 from ..services.search_service import search_service
+from ..services.crawl_job_service import CrawlQueueFullError
+from ..services.company_suggest_service import company_suggest_service
 from datetime import datetime
 
 router = APIRouter(prefix="/companies", tags=["companies"])
@@ -16,29 +25,36 @@ router = APIRouter(prefix="/companies", tags=["companies"])
   "/search",
   response_model=CompanySearchResponse,
   summary="기업 검색",
-  description="기업명 또는 카테고리로 기업을 검색합니다.",
+  description="기업명 또는 카테고리로 기업을 검색합니다. 목록용 필드(기업명, 산업 분야, 요약, 로고)만 limit개씩 반환하며, 다음 페이지는 next_cursor로 조회합니다. 저장된 기업이 없으면 위키피디아 크롤링 작업을 등록하고 202와 작업 상태를 반환합니다.",
   responses={
     200: {"model": CompanySearchResponse, "description": "검색 성공"},
+    202: {"model": CrawlJobAccepted, "description": "크롤링 작업 진행 중 (poll_url로 상태 조회)"},
     400: {"model": ErrorResponse, "description": "잘못된 요청"},
-    500: {"model": ErrorResponse, "description": "서버 오류"}
+    500: {"model": ErrorResponse, "description": "서버 오류"},
+    503: {"model": ErrorResponse, "description": "크롤링 대기열 가득 참"}
   }
 )
 async def search_companies(
   name: Optional[str] = Query(None, description="검색할 기업명"),
-  category: Optional[str] = Query(None, description="검색할 카테고리")
+  category: Optional[str] = Query(None, description="검색할 카테고리"),
+  limit: int = Query(20, ge=1, le=100, description="한 페이지 기업 수"),
+  cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
   """기업 검색 API"""
   try:
-    companies_data = await search_service.search_company_with_cache(
+    page = await search_service.search_company_page_with_cache(
       name=name,
-      category=category
+      category=category,
+      limit=limit,
+      cursor=cursor
     )
     
-    # MongoDB 문서를 Pydantic 모델로 변환
-    companies = []
-    for company_data in companies_data:
-      company = Company.from_mongo_doc(company_data)
-      companies.append(company)
+    # 크롤링이 아직 끝나지 않음 → 작업 상태 반환 (완료 후 다시 검색)
+    if page.get("crawl_job"):
+      return JSONResponse(status_code=202, content=crawl_job_accepted(
+        page["crawl_job"], f"'{name}' 기업 정보를 수집하고 있습니다"))
+    
+    companies = [CompanyListItem(**company) for company in page["companies"]]
     
     # 검색 타입과 키워드 결정
     search_type = "카테고리" if category else "이름"
@@ -46,14 +62,92 @@ async def search_companies(
     
     return CompanySearchResponse(
       search_type=search_type,
-      search_keyword=search_keyword,
+      search_keyword=search_keyword or "",
       total_count=len(companies),
-      companies=companies
+      companies=companies,
+      next_cursor=page["next_cursor"]
     )
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+  except CrawlQueueFullError as e:
+    raise HTTPException(status_code=503, detail=str(e))
   except Exception as e:
     print(f"검색 중 에러 발생: {str(e)}")
     raise HTTPException(status_code=500, detail=f"검색 중 오류 발생: {str(e)}")
 
+@router.post(
+  "/batch",
+  response_model=CompanyBatchResponse,
+  summary="기업 일괄 조회",
+  description="여러 기업명을 한 번에 조회합니다 (정확히 일치, 최대 50개). 캐시는 한 번에 조회하고 캐시에 없는 기업은 DB 쿼리 한 번으로 찾으며, 결과는 요청 순서로 반환합니다. DB에 없는 기업은 요청당 일부만 크롤링 작업을 등록합니다 (status=crawling, crawl_job으로 상태 조회).",
+  responses={
+    200: {"model": CompanyBatchResponse, "description": "조회 성공"},
+    400: {"model": ErrorResponse, "description": "잘못된 요청"},
+    500: {"model": ErrorResponse, "description": "서버 오류"}
+  }
+)
+async def get_companies_batch(request: CompanyBatchRequest):
+  """기업 일괄 조회 API"""
+  try:
+    results = await search_service.get_companies_batch(request.names)
+  except ValueError as e:
+    raise HTTPException(status_code=400, detail=str(e))
+  except Exception as e:
+    print(f"기업 일괄 조회 중 에러 발생: {str(e)}")
+    raise HTTPException(status_code=500, detail=f"기업 일괄 조회 중 오류 발생: {str(e)}")
+  
+  items = [CompanyBatchItem(**result) for result in results]
+  return CompanyBatchResponse(
+    total_count=len(items),
+    found_count=sum(1 for item in items if item.company is not None),
+    results=items
+  )
+
+@router.get(
+  "/suggest",
+  response_model=CompanySuggestResponse,
+  summary="기업명 자동완성",
+  description="입력 중인 검색어로 시작하는 기업명을 반환합니다. 입력 중인 글자(예: 삼서)와 초성 검색(예: ㅅㅅㅈㅈ)을 지원하며, DB를 조회하지 않고 메모리 인덱스에서 찾습니다.",
+  responses={
+    200: {"model": CompanySuggestResponse, "description": "조회 성공"}
+  }
+)
+async def suggest_companies(
+  q: str = Query(..., min_length=1, max_length=50, description="입력 중인 검색어"),
+  limit: int = Query(10, ge=1, le=50, description="최대 결과 수")
+):
+  """기업명 자동완성 API"""
+  return CompanySuggestResponse(
+    query=q,
+    suggestions=company_suggest_service.suggest(q, limit),
+    index_size=len(company_suggest_service.index)
+  )
+
+@router.get(
+  "/detail",
+  response_model=Company,
+  summary="기업 상세 조회",
+  description="기업명으로 저장된 기업의 전체 정보를 조회합니다.",
+  responses={
+    200: {"model": Company, "description": "조회 성공"},
+    404: {"model": ErrorResponse, "description": "기업 정보 없음"},
+    500: {"model": ErrorResponse, "description": "서버 오류"}
+  }
+)
+async def get_company_detail(
+  name: str = Query(..., min_length=1, description="기업명 (정확히 일치)")
+):
+  """기업 상세 조회 API"""
+  try:
+    company_data = await search_service.get_company_detail_with_cache(name)
+  except Exception as e:
+    print(f"기업 상세 조회 중 에러 발생: {str(e)}")
+    raise HTTPException(status_code=500, detail=f"기업 상세 조회 중 오류 발생: {str(e)}")
+  
+  if not company_data:
+    raise HTTPException(status_code=404, detail=f"'{name}' 기업 정보를 찾을 수 없습니다")
+  return Company.from_mongo_doc(company_data)
+
 @router.get(
   "/ranking",
   response_model=CompanyRankingResponse,
@@ -66,7 +160,7 @@ async def search_companies(
 )
 async def get_company_ranking(
   year: int = Query(2024, description="조회할 연도"),
-  limit: int = Query(10, description="조회할 기업 수")
+  limit: int = Query(10, ge=1, le=100, description="조회할 기업 수")
 ):
   """기업 재무 랭킹 조회 API"""
   try:
@@ -107,14 +201,16 @@ async def get_company_cache_stats():
     
     # Redis 캐시에서 기업 관련 키 수 조회
     company_search_keys = 0
+    negative_keys = 0
     ranking_keys = 0
     
     if redis_client.is_connected and redis_client._redis is not None:
       try:
-        search_keys = await redis_client.keys("company_search:*")
-        rank_keys = await redis_client.keys("comprehensive_ranking:*")
-        company_search_keys = len(search_keys)
-        ranking_keys = len(rank_keys)
+        counts = await redis_client.count_namespaces(
+          ["company_search", "company_search_negative", "comprehensive_ranking"])
+        company_search_keys = counts["company_search"]
+        negative_keys = counts["company_search_negative"]
+        ranking_keys = counts["comprehensive_ranking"]
       except Exception as e:
         print(f"Redis 키 조회 오류: {e}")
     
@@ -122,8 +218,9 @@ async def get_company_cache_stats():
       "timestamp": datetime.now().isoformat(),
       "company_cache": {
         "company_search_keys": company_search_keys,
+        "negative_search_keys": negative_keys,
         "ranking_keys": ranking_keys,
-        "total_keys": company_search_keys + ranking_keys,
+        "total_keys": company_search_keys + negative_keys + ranking_keys,
         "expire_time_hours": {
           "company_search": 2,
           "ranking": 1
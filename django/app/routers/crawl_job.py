@@ -0,0 +1,32 @@
+from fastapi import APIRouter, HTTPException
+from ..schemas.crawl_job_schema import CrawlJob
+from ..schemas.common_schema import ErrorResponse
+from ..services.crawl_job_service import crawl_job_service
+
+router = APIRouter(prefix="/crawl-jobs", tags=["crawl-jobs"])
+
+@router.get(
+  "/status",
+  summary="크롤링 작업 대기열 상태",
+  description="작업 종류별 워커 수, 대기 중인 작업 수, 진행 중인 대상을 조회합니다 (현재 워커 기준)."
+)
+async def get_crawl_queue_status():
+  """크롤링 작업 대기열 상태 API"""
+  return crawl_job_service.status()
+
+@router.get(
+  "/{job_id}",
+  response_model=CrawlJob,
+  summary="크롤링 작업 상태 조회",
+  description="검색/리뷰 분석 요청이 202로 반환한 job_id로 크롤링 진행 상태를 조회합니다. done이 되면 원래 요청을 다시 보내면 됩니다.",
+  responses={
+    200: {"model": CrawlJob, "description": "조회 성공"},
+    404: {"model": ErrorResponse, "description": "작업 없음 (만료 포함)"}
+  }
+)
+async def get_crawl_job(job_id: str):
+  """크롤링 작업 상태 조회 API"""
+  job = await crawl_job_service.get_job(job_id)
+  if job is None:
+    raise HTTPException(status_code=404, detail=f"크롤링 작업을 찾을 수 없습니다: {job_id}")
+  return CrawlJob(**job)
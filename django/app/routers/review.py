@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import JSONResponse
 from typing import Optional
 from datetime import datetime
 from ..schemas.review_analysis_schema import (
@@ -9,7 +10,9 @@ from ..schemas.review_analysis_schema import (
   ReviewSample
 )
 from ..schemas.common_schema import ErrorResponse
+from ..schemas.crawl_job_schema import CrawlJobAccepted, crawl_job_accepted
 from ..services.review_analysis_service import review_analysis_service
+from ..services.crawl_job_service import CrawlQueueFullError
 
 router = APIRouter(prefix="/review", tags=["review"])
 
@@ -17,11 +20,13 @@ router = APIRouter(prefix="/review", tags=["review"])
   "/analyze",
   response_model=ReviewAnalysisResponse,
   summary="리뷰 분석",
-  description="기업명을 기반으로 리뷰 감정 분석을 수행합니다.",
+  description="기업명을 기반으로 리뷰 감정 분석을 수행합니다. 저장된 리뷰가 없으면 리뷰 크롤링 작업을 등록하고 202와 작업 상태를 반환합니다.",
   responses={
     200: {"model": ReviewAnalysisResponse, "description": "분석 성공"},
+    202: {"model": CrawlJobAccepted, "description": "리뷰 크롤링 작업 진행 중 (poll_url로 상태 조회)"},
     400: {"model": ErrorResponse, "description": "잘못된 요청"},
-    500: {"model": ErrorResponse, "description": "서버 오류"}
+    500: {"model": ErrorResponse, "description": "서버 오류"},
+    503: {"model": ErrorResponse, "description": "크롤링 대기열 가득 참"}
   }
 )
 async def analyze_review(request: ReviewAnalysisRequest):
@@ -30,6 +35,11 @@ async def analyze_review(request: ReviewAnalysisRequest):
     # 리뷰 분석 실행
     analysis_result = await review_analysis_service.analysis_review(request.name)
     
+    # 리뷰 크롤링이 아직 끝나지 않음 → 작업 상태 반환 (완료 후 다시 요청)
+    if analysis_result.get('crawl_job'):
+      return JSONResponse(status_code=202, content=crawl_job_accepted(
+        analysis_result['crawl_job'], f"'{request.name}' 기업 리뷰를 수집하고 있습니다"))
+    
     # 분석 결과에서 데이터 추출
     scored_df = analysis_result.get('scored_df')
     pros_data = analysis_result.get('pros')
@@ -82,6 +92,8 @@ async def analyze_review(request: ReviewAnalysisRequest):
       cons=cons_analysis
     )
     
+  except CrawlQueueFullError as e:
+    raise HTTPException(status_code=503, detail=str(e))
   except Exception as e:
     print(f"리뷰 분석 중 에러 발생: {str(e)}")
     raise HTTPException(
@@ -103,8 +115,7 @@ async def get_review_cache_stats():
     redis_review_keys = 0
     if redis_client.is_connected and redis_client._redis is not None:
       try:
-        keys = await redis_client.keys("review_analysis:*")
-        redis_review_keys = len(keys)
+        redis_review_keys = await redis_client.count_namespace("review_analysis")
       except Exception as e:
         print(f"Redis 키 조회 오류: {e}")
     
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+from fastapi.responses import PlainTextResponse
 from datetime import datetime
 from ..config import settings
 from ..database.mongodb import mongodb_manager
 from ..database.redis_client import redis_client
 from ..database.postgres import tortoise_manager
+from ..database.indexes import INDEX_SPECS, explain_queries
+from ..database import mongo_factory
+from ..utils.cache_metrics import cache_metrics
+from ..services.cache_warmup_service import cache_warmup_service, WARMUP_JOBS
 
 router = APIRouter(tags=["system"])
 
@@ -26,15 +32,27 @@ async def root():
     "endpoints": {
       "system": {
         "cache_overview": "GET /cache",
+        "metrics": "GET /metrics",
+        "cache_warmup_status": "GET /cache/warmup",
+        "cache_warmup_run": "POST /cache/warmup",
         "cache_backup_status": "GET /cache/backup/status",
-        "cache_clear_all": "DELETE /cache/clear"
+        "cache_clear_all": "DELETE /cache/clear",
+        "index_report": "GET /db/indexes/report",
+        "mongodb_pool": "GET /db/pool"
       },
       "company": {
         "search": "GET /api/companies/search",
+        "suggest": "GET /api/companies/suggest",
+        "batch": "POST /api/companies/batch",
+        "detail": "GET /api/companies/detail",
         "ranking": "GET /api/companies/ranking",
         "cache_stats": "GET /api/companies/cache/stats",
         "cache_clear": "DELETE /api/companies/cache/clear"
       },
+      "crawl_job": {
+        "status": "GET /api/crawl-jobs/status",
+        "detail": "GET /api/crawl-jobs/{job_id}"
+      },
       "review": {
         "analyze": "POST /api/review/analyze",
         "cache_stats": "GET /api/review/cache/stats", 
@@ -66,7 +84,8 @@ async def root():
       "analyze": {
         "latest_news": "POST /api/analyze/",
         "filtered_news": "POST /api/analyze/filter",
-        "batch_collect": "POST /api/analyze/batch"
+        "batch_collect": "POST /api/analyze/batch",
+        "sentiment_trend": "GET /api/analyzeNews/trend"
       }
     },
     "api_documentation": {
@@ -88,16 +107,20 @@ async def get_all_cache_stats():
     redis_stats = {"connected": redis_client.is_connected, "keys": {}}
     
     if redis_client.is_connected and redis_client._redis is not None:
-      # Redis에서 각 캐시 유형별 키 수 조회
-      company_keys = await redis_client.keys("company_search:*")
-      ranking_keys = await redis_client.keys("comprehensive_ranking:*")  
-      review_keys = await redis_client.keys("review_analysis:*")
+      # 네임스페이스 레지스트리에서 각 캐시 유형별 키 수 조회 (KEYS 미사용)
+      counts = await redis_client.count_namespaces()
       
       redis_stats["keys"] = {
-        "company_search": len(company_keys),
-        "ranking": len(ranking_keys),
-        "review_analysis": len(review_keys),
-        "total": len(company_keys) + len(ranking_keys) + len(review_keys)
+        "company_search": counts["company_search"],
+        "company_search_negative": counts["company_search_negative"],
+        "company_detail": counts["company_detail"],
+        "ranking": counts["comprehensive_ranking"],
+        "review_analysis": counts["review_analysis"],
+        "emotion_analysis_result": counts["emotion_analysis_result"],
+        "keyword_extraction_result": counts["keyword_extraction_result"],
+        "news_articles": counts["news_articles"],
+        "keyword_analysis": counts["keyword_analysis"],
+        "total": sum(counts.values())
       }
     
     return {
@@ -111,8 +134,13 @@ async def get_all_cache_stats():
         "review_analysis": f"{settings.review_analysis_cache_expire_time}초"
       },
       "redis_cache": redis_stats,
+      "local_cache": redis_client.local_cache.stats(),
+      "metrics": cache_metrics.stats(),
       "endpoints": {
         "system_cache": {
+          "metrics": "GET /metrics",
+          "warmup_status": "GET /cache/warmup",
+          "warmup_run": "POST /cache/warmup",
           "backup_status": "GET /cache/backup/status", 
           "clear_all": "DELETE /cache/clear"
         },
@@ -132,6 +160,64 @@ async def get_all_cache_stats():
       detail=f"전체 캐시 통계 조회 중 오류 발생: {str(e)}"
     )
 
+@router.get(
+  "/metrics",
+  response_class=PlainTextResponse,
+  summary="캐시/DB 커넥션 풀 지표 (Prometheus)",
+  description="네임스페이스별 캐시 적중/미스/오류 수와 채우기 시간, 값 크기 히스토그램, MongoDB 커넥션 풀 체크아웃 대기 시간을 Prometheus 텍스트 형식으로 반환합니다.",
+)
+async def get_cache_metrics():
+  """Prometheus 수집용 캐시/커넥션 풀 지표 API (워커별 값)"""
+  return PlainTextResponse(
+    cache_metrics.render_prometheus() + mongo_factory.render_prometheus(),
+    media_type="text/plain; version=0.0.4"
+  )
+
+@router.get(
+  "/cache/warmup",
+  summary="캐시 워밍 상태 조회",
+  description="캐시 워밍 설정, 인기 기업 목록과 최근 갱신 기록(대상, 소요 시간, 결과)을 반환합니다.",
+)
+async def get_cache_warmup_status(
+  limit: int = Query(50, ge=1, le=500, description="조회할 최근 기록 수")
+):
+  """캐시 워밍 상태 조회 API"""
+  try:
+    return {
+      "timestamp": datetime.now().isoformat(),
+      **await cache_warmup_service.status(limit)
+    }
+    
+  except Exception as e:
+    print(f"캐시 워밍 상태 조회 중 에러 발생: {str(e)}")
+    raise HTTPException(
+      status_code=500,
+      detail=f"캐시 워밍 상태 조회 중 오류 발생: {str(e)}"
+    )
+
+@router.post(
+  "/cache/warmup",
+  summary="캐시 워밍 즉시 실행",
+  description="랭킹/인기 기업 리뷰 분석 캐시를 백그라운드에서 즉시 다시 계산합니다.",
+)
+async def run_cache_warmup(
+  job: Optional[str] = Query(
+    None, description=f"실행할 작업 ({', '.join(WARMUP_JOBS)}, 기본값: 전체)")
+):
+  """캐시 워밍 즉시 실행 API"""
+  if job is not None and job not in WARMUP_JOBS:
+    raise HTTPException(
+      status_code=400,
+      detail=f"알 수 없는 캐시 워밍 작업입니다: {job}"
+    )
+  
+  started = cache_warmup_service.trigger(job)
+  return {
+    "message": "캐시 워밍을 시작했습니다" if started else "이미 실행 중입니다",
+    "started_jobs": started,
+    "timestamp": datetime.now().isoformat()
+  }
+
 @router.get(
   "/cache/backup/status",
   summary="캐시 백업 상태 확인",
@@ -162,19 +248,20 @@ async def get_backup_status():
 @router.delete(
   "/cache/clear",
   summary="전체 캐시 초기화",
-  description="모든 캐시 데이터를 삭제합니다 (기업 검색, 랭킹, 리뷰 분석).",
+  description="모든 캐시 네임스페이스를 무효화합니다 (기업 검색, 랭킹, 리뷰 분석, 뉴스 분석).",
 )
 async def clear_all_cache():
   """전체 캐시 초기화 API"""
   try:
-    # Redis flushdb 명령어로 전체 캐시 초기화
-    result = await redis_client.flushdb()
+    # flushdb 대신 네임스페이스별 세대 번호를 올려 O(1)로 무효화
+    invalidated = await redis_client.invalidate_namespaces()
     
     return {
       "message": "전체 캐시가 초기화되었습니다",
-      "success": result,
+      "success": redis_client.is_connected,
       "timestamp": datetime.now().isoformat(),
-      "cleared_cache_types": ["company_search", "ranking", "review_analysis"]
+      "invalidated_count": sum(invalidated.values()),
+      "cleared_cache_types": list(invalidated.keys())
     }
     
   except Exception as e:
@@ -182,4 +269,59 @@ async def clear_all_cache():
     raise HTTPException(
       status_code=500,
       detail=f"전체 캐시 초기화 중 오류 발생: {str(e)}"
-    )
\ No newline at end of file
+    )
+
+@router.get(
+  "/db/indexes/report",
+  summary="쿼리별 인덱스 사용 진단",
+  description="저장소의 주요 조회 쿼리를 explain으로 실행해 사용 인덱스와 컬렉션 전체 스캔(COLLSCAN) 여부를 반환합니다.",
+)
+async def get_index_report():
+  """쿼리별 인덱스 사용 진단 API"""
+  if not mongodb_manager.is_connected:
+    raise HTTPException(
+      status_code=503,
+      detail="MongoDB에 연결되어 있지 않습니다"
+    )
+  
+  try:
+    queries = await explain_queries()
+    collection_scans = [q["query"] for q in queries if q.get("collection_scan")]
+    
+    return {
+      "timestamp": datetime.now().isoformat(),
+      "declared_indexes": [
+        {"collection": spec["collection"], "name": spec["name"], "keys": [k for k, _ in spec["keys"]]}
+        for spec in INDEX_SPECS
+      ],
+      "collection_scan_count": len(collection_scans),
+      "collection_scans": collection_scans,
+      "queries": queries
+    }
+    
+  except Exception as e:
+    print(f"인덱스 진단 중 에러 발생: {str(e)}")
+    raise HTTPException(
+      status_code=500,
+      detail=f"인덱스 진단 중 오류 발생: {str(e)}"
+    )
+
+@router.get(
+  "/db/pool",
+  summary="MongoDB 커넥션 풀 상태",
+  description="API(Motor)/크롤러(pymongo) 공용 클라이언트의 풀 설정과 열린 커넥션 수, 체크아웃 대기 시간을 반환합니다.",
+)
+async def get_mongodb_pool():
+  """MongoDB 커넥션 풀 상태 조회 API (워커별 값)"""
+  return {
+    "timestamp": datetime.now().isoformat(),
+    "settings": {
+      "max_pool_size": settings.mongodb_max_pool_size,
+      "min_pool_size": settings.mongodb_min_pool_size,
+      "max_idle_time_ms": settings.mongodb_max_idle_time_ms,
+      "server_selection_timeout_ms": settings.mongodb_server_selection_timeout_ms,
+      "connect_timeout_ms": settings.mongodb_connect_timeout_ms,
+      "compressors": settings.mongodb_compressors or None
+    },
+    "pools": mongo_factory.pool_stats()
+  }
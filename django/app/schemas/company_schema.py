@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
+from .crawl_job_schema import CrawlJob
 
 
 class Company(BaseModel):
@@ -63,6 +64,17 @@ class Company(BaseModel):
     return cls(**normalized_doc)
 
 
+class CompanyListItem(BaseModel):
+  """검색 목록용 기업 정보 (상세 정보는 /companies/detail)"""
+  id: Optional[str] = Field(None, description="기업 ID")
+  name: str = Field(..., description="기업명")
+  산업_분야: Optional[str] = Field(None, alias="산업 분야", description="산업 분야")
+  summary: Optional[str] = Field(None, description="기업 요약 (앞부분)")
+  로고: Optional[str] = Field(None, description="로고 이미지 URL")
+
+  model_config = {"populate_by_name": True}
+
+
 class CompanySearchRequest(BaseModel):
   """기업 검색 요청 스키마"""
   name: Optional[str] = Field(None, description="기업명")
@@ -70,11 +82,39 @@ class CompanySearchRequest(BaseModel):
 
 
 class CompanySearchResponse(BaseModel):
-  """기업 검색 응답 스키마"""
+  """기업 검색 응답 스키마 (커서 기반 페이지)"""
   search_type: str = Field(..., description="검색 유형")
   search_keyword: str = Field(..., description="검색 키워드")
-  total_count: int = Field(..., description="총 검색 결과 수")
-  companies: List[Company] = Field(..., description="기업 목록")
+  total_count: int = Field(..., description="이번 페이지 결과 수")
+  companies: List[CompanyListItem] = Field(..., description="기업 목록")
+  next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
+
+class CompanyBatchRequest(BaseModel):
+  """기업 일괄 조회 요청 스키마"""
+  names: List[str] = Field(..., min_length=1, description="조회할 기업명 목록 (정확히 일치, 최대 50개)")
+
+
+class CompanyBatchItem(BaseModel):
+  """기업 일괄 조회 결과 항목"""
+  name: str = Field(..., description="요청한 기업명")
+  status: str = Field(..., description="조회 결과 (cached, db, crawling, not_found, skipped)")
+  company: Optional[CompanyListItem] = Field(None, description="기업 정보 (목록용 필드)")
+  crawl_job: Optional[CrawlJob] = Field(None, description="크롤링 작업 상태 (crawling일 때 poll 대상)")
+
+
+class CompanyBatchResponse(BaseModel):
+  """기업 일괄 조회 응답 스키마 (요청 순서)"""
+  total_count: int = Field(..., description="조회한 기업 수 (중복 제외)")
+  found_count: int = Field(..., description="기업 정보를 찾은 수")
+  results: List[CompanyBatchItem] = Field(..., description="기업별 결과")
+
+
+class CompanySuggestResponse(BaseModel):
+  """기업명 자동완성 응답 스키마"""
+  query: str = Field(..., description="입력 중인 검색어")
+  suggestions: List[str] = Field(..., description="검색어로 시작하는 기업명 (초성 검색 포함)")
+  index_size: int = Field(..., description="자동완성 인덱스의 기업 수")
 
 
 class RankingItem(BaseModel):
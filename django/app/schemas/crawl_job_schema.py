@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class CrawlJob(BaseModel):
+  """크롤링 작업 상태 스키마"""
+  job_id: str = Field(..., description="작업 ID")
+  kind: str = Field(..., description="작업 종류 (company, reviews)")
+  target: str = Field(..., description="크롤링 대상 (기업명)")
+  status: str = Field(..., description="상태 (queued, running, done, not_found, failed)")
+  result_count: Optional[int] = Field(None, description="수집한 결과 수")
+  error: Optional[str] = Field(None, description="실패 사유")
+  created_at: str = Field(..., description="등록 시간")
+  started_at: Optional[str] = Field(None, description="시작 시간")
+  finished_at: Optional[str] = Field(None, description="완료 시간")
+
+
+class CrawlJobAccepted(BaseModel):
+  """크롤링 작업 접수 응답 스키마 (202)"""
+  message: str = Field(..., description="안내 메시지")
+  job: CrawlJob = Field(..., description="작업 상태")
+  poll_url: str = Field(..., description="작업 상태 조회 URL")
+
+
+def crawl_job_accepted(job, message: str) -> dict:
+  """202 응답 본문 생성"""
+  return CrawlJobAccepted(
+    message=message,
+    job=CrawlJob(**job),
+    poll_url=f"/api/crawl-jobs/{job['job_id']}"
+  ).model_dump()
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import joblib
 import time
 import torch
@@ -18,12 +19,16 @@ from datetime import datetime
 from ..database.db.crawling_database import (
     find_existing_article,
     find_existing_bulk,  # ✅ 이거 꼭 추가!
-    upsert_article,
-    ensure_indexes,
+    upsert_articles_bulk,
 )
 from app.utils.news_keywords_cache_utils import get_or_cache, make_redis_key
 from app.database.redis_client import redis_client
 from app.database.db.crawling_database import get_latest_article_date
+from app.utils.single_flight import single_flight
+from app.utils.stale_cache import stale_cache
+from app.utils.cache_metrics import cache_metrics
+from app.models.news_article import news_article_model, article_key_of, TREND_INTERVALS
+from app.services.news_service import has_new_articles
 
 
 
@@ -89,7 +94,7 @@ def analyze_news_filtered(req):
 
 
 async def analyze_news_filtered_with_cache(req):
-    redis_key = make_redis_key(
+    redis_key = await make_redis_key(
         prefix="emotion_analysis_result",
         keyword=req.keyword,
         start_date=req.start_date,
@@ -100,69 +105,117 @@ async def analyze_news_filtered_with_cache(req):
         max_articles=req.max_articles
     )
 
-    # ✅ [1] 최신 뉴스 일부만 크롤링해서 Redis 캐시 무효화 판단
-    try:
-        latest_articles = get_latest_articles(req.keyword, max_articles=5)
-        latest_keys = [(a.get("title", ""), a.get("date", "")) for a in latest_articles if a.get("title") and a.get("date")]
-
-        existing_map = find_existing_bulk(latest_keys, req.model)
-        if len(existing_map) < len(latest_keys):
-            print("🚨 새 뉴스 발견 → Redis 캐시 무효화")
-            await redis_client.delete(redis_key)
-    except Exception as e:
-        print(f"⚠️ 최신 뉴스 확인 실패 (무시하고 계속 진행): {e}")
+    async def refresh():
+        return await _refresh_filtered_analysis(req, redis_key)
 
-    # ✅ [2] Redis 캐시 조회
-    cached_result = await redis_client.get_json(redis_key)
-    if cached_result:
-        print(f"📦 [Redis] 감정 분석 결과 캐시 HIT → {redis_key}")
+    # ✅ [1] Redis 캐시 조회 (soft 만료가 지났으면 이전 결과를 바로 반환하고 백그라운드 갱신)
+    cached_entry = await redis_client.get_json(redis_key)
+    if cached_entry:
+        cached_result, is_stale = stale_cache.unwrap(cached_entry)
+        if is_stale:
+            print(f"♻️ [Redis] 만료된 감정 분석 결과 반환 → 백그라운드 갱신 {redis_key}")
+            stale_cache.schedule_refresh(redis_key, refresh)
+        else:
+            # ✅ 새 뉴스 확인(크롤링)은 응답 이후 백그라운드에서 → 새 기사가 있으면 갱신
+            stale_cache.schedule_freshness_check(
+                redis_key,
+                lambda: has_new_articles(req.keyword, req.model),
+                refresh
+            )
         return cached_result
 
-    # ✅ [3] MongoDB에 기존 기사 있는지 확인
-    existing_articles = get_articles_by_conditions(
+    # ✅ [2] 캐시 MISS → 동시 요청은 하나의 분석 결과를 공유 (대기 중 확인은 적중/미스 지표에서 제외)
+    async def check_cache():
+        cached = await redis_client.get_json(redis_key, record=False)
+        return stale_cache.unwrap(cached)[0] if cached else None
+
+    return await single_flight.run(redis_key, refresh, check_cache=check_cache)
+
+
+def _compute_filtered_analysis(req, existing_articles):
+    """✅ DB 기사(없으면 크롤링)로 감정 분석 수행 (블로킹 작업 → 스레드에서 실행)"""
+    if existing_articles:
+        print(f"🔄 [MongoDB] 기존 기사 {len(existing_articles)}건 분석 수행")
+        return _analyze_articles(existing_articles, req.model, req.keyword)
+
+    print(f"🌐 [크롤링 시작] 조건에 맞는 기사 없음 → 크롤링 진행")
+    crawled_articles = search_bigkinds(
         keyword=req.keyword,
+        unified_category=req.unified_category,
+        incident_category=req.incident_category,
         start_date=req.start_date,
         end_date=req.end_date,
-        unified_category=req.unified_category,
-        incident_category=req.incident_category
+        date_method=req.date_method,
+        period_label=req.period_label,
+        max_articles=req.max_articles
     )
 
-    if existing_articles:
-        print(f"🔄 [MongoDB] 기존 기사 {len(existing_articles)}건 분석 수행")
-        result = _analyze_articles(existing_articles, req.model, req.keyword)
-    else:
-        print(f"🌐 [크롤링 시작] 조건에 맞는 기사 없음 → 크롤링 진행")
-        crawled_articles = search_bigkinds(
+    if not crawled_articles:
+        raise HTTPException(status_code=204, detail="수집된 뉴스가 없습니다.")
+
+    return _analyze_articles(crawled_articles, req.model, req.keyword)
+
+
+async def _refresh_filtered_analysis(req, redis_key):
+    """✅ 감정 분석 재계산 후 soft 만료 시각과 함께 Redis 저장"""
+    with cache_metrics.fill_timer("emotion_analysis_result"):
+        # MongoDB에 기존 기사 있는지 확인 (Motor, 이벤트 루프를 막지 않음)
+        existing_articles = await news_article_model.get_articles_by_conditions(
             keyword=req.keyword,
-            unified_category=req.unified_category,
-            incident_category=req.incident_category,
             start_date=req.start_date,
             end_date=req.end_date,
-            date_method=req.date_method,
-            period_label=req.period_label,
-            max_articles=req.max_articles
+            unified_category=req.unified_category,
+            incident_category=req.incident_category
         )
+        result = await asyncio.to_thread(_compute_filtered_analysis, req, existing_articles)
 
-        if not crawled_articles:
-            raise HTTPException(status_code=204, detail="수집된 뉴스가 없습니다.")
-
-        result = _analyze_articles(crawled_articles, req.model, req.keyword)
-
-    # ✅ [4] 분석 결과 Redis 저장
     if result:
         result["cached_at"] = datetime.utcnow().isoformat()
+        soft_ttl = settings.review_analysis_cache_expire_time
         await redis_client.set_json(
             redis_key,
-            result,
-            expire=settings.review_analysis_cache_expire_time
+            stale_cache.wrap(result, soft_ttl),
+            expire=stale_cache.hard_ttl(soft_ttl)
         )
-        print(f"🧠 Redis에 분석 결과 저장 완료 → {redis_key}")
 
     return result
 
 
 
 
+async def get_sentiment_trend(keyword, model="vote", start_date=None, end_date=None, interval="day"):
+    """
+    ✅ 키워드 감정 추이 조회 (일별 집계 sentiment_daily 사용)
+    - 원본 기사를 다시 세지 않고 (keyword, model, date, label) 집계 문서만 읽음
+    - 기본 기간: 종료일 기준 최근 90일
+    """
+    if interval not in TREND_INTERVALS:
+        raise HTTPException(status_code=400, detail=f"interval은 {', '.join(TREND_INTERVALS)} 중 하나여야 합니다.")
+    if not news_article_model.db_manager.is_connected:
+        raise HTTPException(status_code=503, detail="MongoDB에 연결되어 있지 않습니다.")
+
+    try:
+        end = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else datetime.utcnow().date()
+        start = datetime.strptime(start_date, "%Y-%m-%d").date() if start_date else end - timedelta(days=90)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="날짜는 YYYY-MM-DD 형식이어야 합니다.")
+    if start > end:
+        raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
+
+    trend = await news_article_model.get_sentiment_trend(
+        keyword, model, start.isoformat(), end.isoformat(), interval
+    )
+    return {
+        "keyword": keyword,
+        "model": model,
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "interval": interval,
+        "total": sum(point["total"] for point in trend),
+        "trend": trend
+    }
+
+
 def emotion_batch(req):
     start_date = req.start_date or "2025-01-01"
     end_date = req.end_date or time.strftime("%Y-%m-%d")
@@ -211,12 +264,6 @@ def _analyze_articles(articles, model_key, keyword):
     if model_key not in ALLOWED_MODELS:
         raise HTTPException(status_code=400, detail=f"지원하지 않는 모델입니다: {model_key}")
 
-    # ✅ 앱 기동 시 1회만 호출되도록 옮겨도 됨
-    try:
-        ensure_indexes()
-    except Exception:
-        pass
-
     # 1) 전처리: 텍스트 없는 기사 제외 + 키 생성
     cleaned = []
     keys = []
@@ -227,7 +274,7 @@ def _analyze_articles(articles, model_key, keyword):
         if not text:
             continue
         cleaned.append(a)
-        keys.append((title, date))
+        keys.append(article_key_of(a))
 
     if not cleaned:
         raise HTTPException(status_code=204, detail="분석 가능한 텍스트가 없습니다.")
@@ -239,6 +286,7 @@ def _analyze_articles(articles, model_key, keyword):
     existing_map = find_existing_bulk(keys, model_key)
 
     results = []
+    pending_records = []  # 새로 분석한 기사 (루프 후 한 번에 저장)
     reuse_count = 0
     new_count = 0
     now = datetime.utcnow()
@@ -249,7 +297,7 @@ def _analyze_articles(articles, model_key, keyword):
         date  = article.get("date", "")
         text  = (article.get("summary") or title).strip()
 
-        existing = existing_map.get((title, date))
+        existing = existing_map.get(article_key_of(article))
         use_cached = False
         if existing:
             print(f"✅ DB 재사용: {title} ({existing['label']})")
@@ -295,8 +343,13 @@ def _analyze_articles(articles, model_key, keyword):
                 confidence = float(model.predict_proba(embedding)[0].max())
                 label = id2label[prediction]
 
-            # 5) ✅ DB 저장/갱신 (upsert)
-            upsert_article(article, label, confidence, keyword, model_key)
+            # 5) ✅ DB 저장 대상에 추가 (루프 후 일괄 upsert)
+            pending_records.append({
+                "article": article,
+                "label": label,
+                "confidence": confidence,
+                "keyword": keyword,
+            })
             results.append({
                 "title": title,
                 "summary": article.get("summary", ""),
@@ -310,6 +363,13 @@ def _analyze_articles(articles, model_key, keyword):
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"감정 분석 중 오류 발생: {str(e)}")
 
+    # 6) ✅ 신규/재분석 결과 일괄 저장 (DB 왕복: 배치 수만큼)
+    if pending_records:
+        try:
+            upsert_articles_bulk(pending_records, model_key)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"분석 결과 저장 중 오류 발생: {str(e)}")
+
     if not results:
         raise HTTPException(status_code=204, detail="분석 가능한 텍스트가 없습니다.")
 
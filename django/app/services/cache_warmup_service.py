@@ -0,0 +1,156 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ..config import settings
+from ..database.redis_client import redis_client
+from .search_service import search_service
+from .review_analysis_service import review_analysis_service
+
+# 워커 간에 한 번만 실행하기 위한 작업별 락 키 접두사
+WARMUP_LOCK_PREFIX = "cache_warmup_lock"
+# 갱신 기록 (Redis list, 최근 항목부터)
+WARMUP_LOG_KEY = "cache_warmup_log"
+
+WARMUP_JOBS = ("ranking", "review_analysis")
+
+class CacheWarmupService:
+  """TTL 만료 전에 무거운 캐시를 미리 계산하는 서비스
+
+  - ranking: 설정된 연도의 종합 랭킹 (연도별 상위 ranking_max_limit개)
+  - review_analysis: 최근 조회 수 상위 N개 기업의 리뷰 분석
+  시작 시 한 번, 이후 각 캐시 TTL보다 cache_warmup_lead_seconds 만큼 앞서 주기적으로 실행한다.
+  여러 워커가 떠 있어도 작업별 Redis 락을 잡은 워커 하나만 실행한다.
+  """
+  def __init__(self):
+    self._tasks: List[asyncio.Task] = []
+    self._running: Dict[str, asyncio.Task] = {}
+
+  def _interval(self, job: str) -> int:
+    """작업별 실행 주기 (초)"""
+    if job == "ranking":
+      ttl = settings.ranking_cache_expire_time
+    else:
+      ttl = settings.review_analysis_cache_expire_time
+    return max(ttl - settings.cache_warmup_lead_seconds, 60)
+
+  def start(self):
+    """스케줄 시작 (애플리케이션 시작 시 호출)"""
+    if not settings.cache_warmup_enabled or self._tasks:
+      return
+    for job in WARMUP_JOBS:
+      self._tasks.append(asyncio.create_task(self._schedule(job)))
+    print("🔥 캐시 워밍 스케줄 시작")
+
+  async def stop(self):
+    """스케줄 및 실행 중인 워밍 작업 종료"""
+    tasks = self._tasks + list(self._running.values())
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    self._tasks = []
+    self._running.clear()
+
+  async def _schedule(self, job: str):
+    """시작 지연 후 작업을 주기적으로 실행"""
+    await asyncio.sleep(settings.cache_warmup_startup_delay_seconds)
+    while True:
+      interval = self._interval(job)
+      try:
+        # 이번 주기에 다른 워커가 이미 실행했으면 건너뜀 (락은 주기 동안 유지)
+        if await redis_client.acquire_lock(
+          f"{WARMUP_LOCK_PREFIX}:{job}", redis_client.instance_id, interval):
+          await self.run_job(job)
+      except asyncio.CancelledError:
+        raise
+      except Exception as e:
+        print(f"⚠️ 캐시 워밍 실패 ({job}): {e}")
+      await asyncio.sleep(interval)
+
+  def trigger(self, job: Optional[str] = None) -> List[str]:
+    """즉시 워밍 실행을 백그라운드로 예약 (이미 실행 중인 작업은 제외)"""
+    jobs = [job] if job else list(WARMUP_JOBS)
+    started = []
+    for name in jobs:
+      if name in self._running:
+        continue
+      task = asyncio.create_task(self.run_job(name))
+      task.add_done_callback(lambda _, name=name: self._running.pop(name, None))
+      self._running[name] = task
+      started.append(name)
+    return started
+
+  async def run_job(self, job: str) -> List[Dict[str, Any]]:
+    """작업 하나 실행 후 항목별 결과 반환"""
+    if job not in WARMUP_JOBS:
+      raise ValueError(f"알 수 없는 캐시 워밍 작업: {job}")
+
+    if job == "ranking":
+      targets = [
+        (str(year), lambda year=year: search_service.refresh_comprehensive_ranking(year))
+        for year in settings.cache_warmup_ranking_years
+      ]
+    else:
+      names = await redis_client.top_popular(
+        "review_analysis", settings.cache_warmup_review_top_n)
+      targets = [
+        (name, lambda name=name: review_analysis_service.refresh_analysis(name))
+        for name in names
+      ]
+
+    print(f"🔥 캐시 워밍 시작 ({job}): {len(targets)}개")
+    results = []
+    for i, (target, refresh) in enumerate(targets):
+      if i > 0:
+        # DB/모델 부하가 한꺼번에 몰리지 않도록 간격을 둠
+        await asyncio.sleep(settings.cache_warmup_stagger_seconds)
+      results.append(await self._warm(job, target, refresh))
+    return results
+
+  async def _warm(self, job: str, target: str, refresh: Callable[[], Awaitable[Any]]):
+    """항목 하나를 갱신하고 소요 시간 기록"""
+    start = time.perf_counter()
+    try:
+      result = await refresh()
+      status = "refreshed" if result is not None else "skipped"
+      error = None
+    except Exception as e:
+      status, error = "failed", str(e)
+
+    entry = {
+      "job": job,
+      "target": target,
+      "status": status,
+      "duration_seconds": round(time.perf_counter() - start, 3),
+      "finished_at": datetime.now().isoformat()
+    }
+    if error:
+      entry["error"] = error
+    print(f"🔥 캐시 워밍 {status}: {job}/{target} ({entry['duration_seconds']}초)")
+    await redis_client.push_json_log(WARMUP_LOG_KEY, entry, settings.cache_warmup_log_size)
+    return entry
+
+  async def status(self, limit: int = 50) -> Dict[str, Any]:
+    """워밍 설정과 최근 갱신 기록 반환"""
+    return {
+      "enabled": settings.cache_warmup_enabled,
+      "scheduled": bool(self._tasks),
+      "running": list(self._running),
+      "jobs": {
+        "ranking": {
+          "interval_seconds": self._interval("ranking"),
+          "years": settings.cache_warmup_ranking_years,
+          "max_limit": settings.ranking_max_limit
+        },
+        "review_analysis": {
+          "interval_seconds": self._interval("review_analysis"),
+          "top_n": settings.cache_warmup_review_top_n,
+          "popular_companies": await redis_client.top_popular(
+            "review_analysis", settings.cache_warmup_review_top_n)
+        }
+      },
+      "recent": await redis_client.get_json_log(WARMUP_LOG_KEY, limit)
+    }
+
+# 싱글톤 인스턴스
+cache_warmup_service = CacheWarmupService()
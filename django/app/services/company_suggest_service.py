@@ -0,0 +1,66 @@
+import asyncio
+from typing import List, Optional
+from ..config import settings
+from ..database.redis_client import redis_client
+from ..models.company import company_model
+from ..utils.name_index import NameIndex
+
+# 크롤러가 기업을 저장했을 때 발행하는 이벤트 (sync_redis.publish_message)
+COMPANY_SAVED_MESSAGE = "company_saved"
+
+class CompanySuggestService:
+  """기업명 자동완성 서비스 (워커별 메모리 인덱스)
+
+  시작 시 전체 기업명으로 인덱스를 만들고, 크롤러의 저장 이벤트로 이름을 추가한다.
+  이벤트를 놓칠 수 있으므로 company_suggest_refresh_seconds마다 전체를 다시 만든다.
+  """
+  def __init__(self):
+    self.index = NameIndex()
+    self._task: Optional[asyncio.Task] = None
+
+  async def rebuild(self) -> int:
+    """DB의 전체 기업명으로 인덱스 재생성"""
+    names = await company_model.get_all_names()
+    self.index.replace(names)
+    return len(self.index)
+
+  async def start(self):
+    """인덱스 생성 및 저장 이벤트 구독, 주기적 재생성 시작 (애플리케이션 시작 시 호출)"""
+    redis_client.add_message_handler(COMPANY_SAVED_MESSAGE, self._on_company_saved)
+    count = await self.rebuild()
+    print(f"🔤 기업명 자동완성 인덱스 생성 완료 ({count}개)")
+    if self._task is None:
+      self._task = asyncio.create_task(self._refresh_loop())
+
+  async def stop(self):
+    """주기적 재생성 종료"""
+    if self._task:
+      self._task.cancel()
+      await asyncio.gather(self._task, return_exceptions=True)
+      self._task = None
+
+  async def _refresh_loop(self):
+    while True:
+      await asyncio.sleep(settings.company_suggest_refresh_seconds)
+      try:
+        await self.rebuild()
+      except asyncio.CancelledError:
+        raise
+      except Exception as e:
+        print(f"⚠️ 기업명 자동완성 인덱스 재생성 실패: {e}")
+
+  def _on_company_saved(self, message):
+    """크롤러 저장 이벤트 → 인덱스에 이름 추가"""
+    for name in message.get("names", []):
+      self.add(name)
+
+  def add(self, name: str) -> bool:
+    """기업명 하나를 인덱스에 추가"""
+    return self.index.add(name)
+
+  def suggest(self, query: str, limit: int = 10) -> List[str]:
+    """query로 시작하는 기업명 (자모 단위 접두어 + 초성 검색)"""
+    return self.index.search(query, limit)
+
+# 전역 인스턴스
+company_suggest_service = CompanySuggestService()
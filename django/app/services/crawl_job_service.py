@@ -0,0 +1,271 @@
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from ..config import settings
+from ..database.redis_client import redis_client
+
+# 작업 상태 (crawl_job:{job_id}, JSON) / 대상별 진행 중 작업 (crawl_job_target:{kind}:{target} → job_id)
+CRAWL_JOB_KEY_PREFIX = "crawl_job"
+CRAWL_TARGET_KEY_PREFIX = "crawl_job_target"
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+NOT_FOUND = "not_found"
+FAILED = "failed"
+FINISHED_STATUSES = (DONE, NOT_FOUND, FAILED)
+
+class CrawlQueueFullError(Exception):
+  """크롤링 대기열이 가득 차 작업을 받을 수 없음"""
+
+class CrawlJobKind:
+  """크롤링 작업 종류 (브라우저 생성/크롤링/종료 함수와 워커 수)
+
+  create_crawler, crawl, close는 동기 함수이며 워커 전용 스레드에서 실행된다.
+  on_finish(target, result)는 상태를 완료로 바꾸기 전에 이벤트 루프에서 실행된다.
+  """
+  def __init__(
+    self,
+    create_crawler: Callable[[], Any],
+    crawl: Callable[[Any, str], Any],
+    workers: int,
+    close: Optional[Callable[[Any], None]] = None,
+    on_finish: Optional[Callable[[str, Any], Awaitable[None]]] = None
+  ):
+    self.create_crawler = create_crawler
+    self.crawl = crawl
+    self.workers = workers
+    self.close = close
+    self.on_finish = on_finish
+
+class CrawlJobService:
+  """요청 경로 밖에서 실행하는 크롤링 작업 대기열
+
+  - 종류별 asyncio 대기열과 고정 수의 워커 (워커마다 브라우저 1개, 전용 스레드 1개)
+  - 같은 대상은 진행 중인 작업 하나로 합침 (워커 내부: 메모리, 워커 간: Redis SET NX)
+  - 대상 선점은 짧은 TTL로 잡고 진행 중에는 주기적으로 연장 (워커가 죽으면 곧 만료되어 다시 등록 가능)
+  - 작업 상태는 Redis에 저장해 어느 워커에서든 job_id로 조회
+  """
+  def __init__(self):
+    self._kinds: Dict[str, CrawlJobKind] = {}
+    self._queues: Dict[str, asyncio.Queue] = {}
+    self._tasks: List[asyncio.Task] = []
+    self._jobs: Dict[str, Dict[str, Any]] = {}  # 이 워커가 받은 작업
+    self._events: Dict[str, asyncio.Event] = {}  # 작업 완료 대기용
+    self._active: Dict[tuple, str] = {}  # (kind, target) -> 진행 중 job_id
+    self._claim_lock = asyncio.Lock()
+
+  def register(self, kind: str, job_kind: CrawlJobKind):
+    """작업 종류 등록 (서비스 모듈 로딩 시)"""
+    self._kinds[kind] = job_kind
+
+  def start(self):
+    """종류별 워커 시작 (애플리케이션 시작 시 호출)"""
+    if self._tasks:
+      return
+    for kind, job_kind in self._kinds.items():
+      self._queues[kind] = asyncio.Queue(maxsize=settings.crawl_job_queue_size)
+      for index in range(job_kind.workers):
+        self._tasks.append(asyncio.create_task(self._worker(kind, index)))
+    print(f"🕷️ 크롤링 작업 워커 시작 ({len(self._tasks)}개)")
+    self._tasks.append(asyncio.create_task(self._renew_claims()))
+
+  async def stop(self):
+    """워커 종료 (브라우저는 진행 중인 크롤링이 끝난 뒤 워커 스레드에서 닫힘)"""
+    for task in self._tasks:
+      task.cancel()
+    await asyncio.gather(*self._tasks, return_exceptions=True)
+    self._tasks = []
+
+  def _target_key(self, kind: str, target: str) -> str:
+    return f"{CRAWL_TARGET_KEY_PREFIX}:{kind}:{target}"
+
+  async def submit(self, kind: str, target: str, wait: float = 0) -> Dict[str, Any]:
+    """크롤링 작업 등록 후 작업 상태 반환 (같은 대상이 진행 중이면 그 작업)
+
+    wait > 0이면 최대 wait초 동안 완료를 기다린다 (이벤트 루프는 막지 않음).
+    """
+    if kind not in self._queues:
+      raise ValueError(f"알 수 없는 크롤링 작업 종류입니다: {kind}")
+    target = target.strip()
+
+    # 선점 확인~등록 사이에 같은 대상 요청이 끼어들지 않도록 워커 내부에서는 순서대로 처리
+    async with self._claim_lock:
+      job_id = self._active.get((kind, target))
+      if job_id is None:
+        job_id = await self._claim(kind, target)
+    if wait > 0:
+      await self.wait(job_id, wait)
+    return await self.get_job(job_id)
+
+  async def _claim(self, kind: str, target: str) -> str:
+    """다른 워커가 같은 대상을 진행 중이면 그 job_id, 아니면 새 작업을 대기열에 추가"""
+    queue = self._queues[kind]
+    if queue.full():
+      raise CrawlQueueFullError(f"크롤링 대기열이 가득 찼습니다 ({kind})")
+
+    job_id = uuid.uuid4().hex
+    job = {
+      "job_id": job_id,
+      "kind": kind,
+      "target": target,
+      "status": QUEUED,
+      "result_count": None,
+      "error": None,
+      "created_at": datetime.now().isoformat(),
+      "started_at": None,
+      "finished_at": None
+    }
+    # 선점 전에 상태를 먼저 저장 (선점한 job_id는 항상 조회 가능)
+    await self._save(job)
+    target_key = self._target_key(kind, target)
+    if redis_client.is_connected and not await redis_client.acquire_lock(
+      target_key, job_id, settings.crawl_job_claim_ttl_seconds):
+      other_id = await redis_client.get(target_key)
+      if other_id:
+        await redis_client.delete(f"{CRAWL_JOB_KEY_PREFIX}:{job_id}")
+        return other_id
+
+    self._jobs[job_id] = job
+    self._events[job_id] = asyncio.Event()
+    self._active[(kind, target)] = job_id
+    queue.put_nowait(job_id)
+    return job_id
+
+  async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+    """작업 상태 조회 (이 워커의 작업은 메모리, 다른 워커의 작업은 Redis)
+
+    끝나지 않은 작업의 대상 선점이 풀렸으면 작업을 맡은 워커가 중단된 것이므로 실패로 반환한다.
+    """
+    if job_id in self._jobs:
+      return dict(self._jobs[job_id])
+    if not redis_client.is_connected:
+      return None
+    job = await redis_client.get_json(f"{CRAWL_JOB_KEY_PREFIX}:{job_id}")
+    if job and job["status"] not in FINISHED_STATUSES:
+      claimed_by = await redis_client.get(self._target_key(job["kind"], job["target"]))
+      if claimed_by != job_id:
+        job.update(status=FAILED, error="작업을 맡은 워커가 중단되었습니다")
+    return job
+
+  async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+    """작업이 끝날 때까지 최대 timeout초 대기 후 상태 반환"""
+    event = self._events.get(job_id)
+    if event is not None:
+      try:
+        await asyncio.wait_for(event.wait(), timeout)
+      except asyncio.TimeoutError:
+        pass
+      return await self.get_job(job_id)
+
+    # 다른 워커의 작업 → Redis 상태를 주기적으로 확인
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+      job = await self.get_job(job_id)
+      if job is None or job["status"] in FINISHED_STATUSES:
+        return job
+      if asyncio.get_running_loop().time() >= deadline:
+        return job
+      await asyncio.sleep(settings.single_flight_poll_interval_seconds)
+
+  async def _save(self, job: Dict[str, Any]):
+    if not redis_client.is_connected:
+      return
+    await redis_client.set_json(
+      f"{CRAWL_JOB_KEY_PREFIX}:{job['job_id']}", job, expire=settings.crawl_job_ttl_seconds)
+
+  async def _renew_claims(self):
+    """진행 중인 작업의 대상 선점을 주기적으로 연장"""
+    interval = settings.crawl_job_claim_ttl_seconds / 3
+    while True:
+      await asyncio.sleep(interval)
+      if not redis_client.is_connected:
+        continue
+      for (kind, target), job_id in list(self._active.items()):
+        await redis_client.extend_lock(
+          self._target_key(kind, target), job_id, settings.crawl_job_claim_ttl_seconds)
+
+  async def _worker(self, kind: str, index: int):
+    """대기열의 작업을 하나씩 실행 (브라우저는 첫 작업 때 생성해 계속 재사용)"""
+    job_kind = self._kinds[kind]
+    queue = self._queues[kind]
+    loop = asyncio.get_running_loop()
+    # Selenium 드라이버는 생성한 스레드에서만 사용
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"crawl-{kind}-{index}")
+    crawler = None
+    try:
+      while True:
+        job = self._jobs[await queue.get()]
+        try:
+          job.update(status=RUNNING, started_at=datetime.now().isoformat())
+          await self._save(job)
+          if crawler is None:
+            crawler = await loop.run_in_executor(executor, job_kind.create_crawler)
+          # 크롤러는 대상이 없을 때만 빈 결과를 반환하고 브라우저/네트워크/DB 오류는 예외를 올림
+          result = await loop.run_in_executor(executor, job_kind.crawl, crawler, job["target"])
+        except asyncio.CancelledError:
+          raise
+        except Exception as e:
+          print(f"❌ 크롤링 작업 실패 ({kind}:{job['target']}): {e}")
+          await self._finish(job, FAILED, error=str(e))
+          # 브라우저 오류일 수 있으므로 다음 작업에서 새로 생성
+          if crawler is not None and job_kind.close:
+            executor.submit(job_kind.close, crawler)
+          crawler = None
+          continue
+        finally:
+          queue.task_done()
+
+        if job_kind.on_finish:
+          try:
+            await job_kind.on_finish(job["target"], result)
+          except Exception as e:
+            print(f"⚠️ 크롤링 작업 완료 처리 오류 ({kind}:{job['target']}): {e}")
+        await self._finish(job, DONE if result else NOT_FOUND, result_count=(
+          len(result) if isinstance(result, (list, tuple)) else int(bool(result))))
+    finally:
+      if crawler is not None and job_kind.close:
+        executor.submit(job_kind.close, crawler)
+      executor.shutdown(wait=False)
+
+  async def _finish(self, job: Dict[str, Any], status: str, result_count=None, error=None):
+    """작업 완료 처리 (상태 저장, 대기 중인 요청 깨우기, 대상 선점 해제)"""
+    job.update(
+      status=status, result_count=result_count, error=error,
+      finished_at=datetime.now().isoformat())
+    await self._save(job)
+
+    job_id, kind, target = job["job_id"], job["kind"], job["target"]
+    self._active.pop((kind, target), None)
+    event = self._events.pop(job_id, None)
+    if event is not None:
+      event.set()
+    # 메모리 상태는 TTL 후 정리 (이후에는 Redis에서 조회)
+    asyncio.get_running_loop().call_later(
+      settings.crawl_job_ttl_seconds, self._jobs.pop, job_id, None)
+
+    target_key = self._target_key(kind, target)
+    if status == NOT_FOUND and redis_client.is_connected:
+      # 없는 대상은 잠시 같은 작업을 돌려줘 브라우저를 다시 띄우지 않음
+      try:
+        await redis_client.redis.expire(target_key, settings.negative_cache_expire_time)
+      except Exception as e:
+        print(f"Redis 만료 시간 설정 오류 ({target_key}): {str(e)}")
+    else:
+      await redis_client.release_lock(target_key, job_id)
+
+  def status(self) -> Dict[str, Any]:
+    """종류별 대기열 길이와 워커 수"""
+    return {
+      kind: {
+        "workers": job_kind.workers,
+        "queued": self._queues[kind].qsize() if kind in self._queues else 0,
+        "active_targets": sorted(t for k, t in self._active if k == kind)
+      }
+      for kind, job_kind in self._kinds.items()
+    }
+
+# 전역 인스턴스
+crawl_job_service = CrawlJobService()
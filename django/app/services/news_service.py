@@ -1,5 +1,6 @@
 import os
 import json
+import asyncio
 from crawling.latest_news_crawling import get_latest_articles
 from fastapi import HTTPException
 from keybert import KeyBERT
@@ -7,8 +8,7 @@ from crawling.bigKinds_crawling_speed import search_bigkinds
 from app.database.db.crawling_database import (
     get_articles_by_conditions,
     find_existing_bulk,
-    upsert_article,
-    ensure_indexes,
+    upsert_articles_bulk,
     get_articles_by_keyword_recent
 )
 from app.utils.stopwords import DEFAULT_STOPWORDS
@@ -19,10 +19,13 @@ from app.utils.keyword_extractors import (
 from app.database.db.crawling_database import save_overall_keywords
 from app.utils.news_keywords_cache_utils import get_or_cache, make_redis_key
 from app.database.redis_client import redis_client
+from app.utils.single_flight import single_flight
+from app.utils.stale_cache import stale_cache
+from app.utils.cache_metrics import cache_metrics
 
 from app.config import settings
 from app.utils.news_keywords_cache_utils import get_or_cache
-from app.database.db.crawling_database import db
+from app.models.news_article import news_article_model, article_key_of
 
 
 
@@ -56,30 +59,24 @@ def crawl_latest_articles_db(keyword: str, headless: bool = True):
     if not raw_articles:
         raise HTTPException(status_code=404, detail="해당 키워드에 대한 최신 기사가 없습니다.")
 
-    # ✅ 인덱스 보장
-    try:
-        ensure_indexes()
-    except Exception:
-        pass
-
     # ✅ 기존 존재 여부 확인
-    keys = [(a.get("title", ""), a.get("date", "")) for a in raw_articles]
-    existing_map = find_existing_bulk(keys, model="latest")
+    keys = [article_key_of(a) for a in raw_articles]
+    existing_map = find_existing_bulk(keys, model="latest", projection={"_id": 0, "article_key": 1})
 
-    new_count = 0
+    new_records = []
     reuse_count = 0
     for article in raw_articles:
         title = article.get("title", "")
-        date = article.get("date", "")
-        key = (title, date)
 
-        if key in existing_map:
+        if article_key_of(article) in existing_map:
             print(f"✅ 이미 존재 (중복 저장 안함): {title}")
             reuse_count += 1
         else:
-            print(f"🆕 DB 저장됨 (신규): {title}")
-            upsert_article(article, label=None, confidence=None, keyword=keyword, model="latest")
-            new_count += 1
+            new_records.append({"article": article, "keyword": keyword})
+
+    # ✅ 신규 기사 일괄 저장
+    report = upsert_articles_bulk(new_records, model="latest") if new_records else None
+    new_count = report["inserted"] + report["updated"] if report else 0
 
     print(f"\n📊 저장 요약: 신규 {new_count}건 | 중복 {reuse_count}건\n")
 
@@ -87,6 +84,24 @@ def crawl_latest_articles_db(keyword: str, headless: bool = True):
 
 
 
+async def get_latest_articles_with_db(keyword: str, headless: bool = True):
+    """
+    ✅ crawl_latest_articles_db의 비동기 버전 (비동기 핸들러용)
+    - DB 조회는 Motor로, 크롤링이 필요할 때만 스레드에서 실행
+    """
+    keyword = keyword.strip()
+    if not keyword:
+        raise HTTPException(status_code=400, detail="키워드를 입력해주세요.")
+
+    articles = await news_article_model.get_articles_by_keyword_recent(keyword=keyword, limit=5)
+    if articles and len(articles) == 5:
+        print(f"✅ [DB 재사용] '{keyword}' 키워드의 최신 기사 5건 반환 (DB에서)")
+        return articles
+
+    return await asyncio.to_thread(crawl_latest_articles_db, keyword, headless)
+
+
+
 def read_latest_file():
     """
     ✅ 가장 최근 저장된 JSON 파일에서 상위 5개의 기사 반환
@@ -133,12 +148,11 @@ def crawl_and_extract_keywords(req):
         if not articles:
             raise HTTPException(status_code=404, detail="뉴스 없음")
 
-        ensure_indexes()
-
         # ✅ 개별 키워드 추출 + DB 저장
         all_texts = []
         individual_results = []
         total_keyword_sum = 0
+        keyword_records = []
 
         for article in articles:
             summary = article.get("summary", "").strip()
@@ -168,14 +182,14 @@ def crawl_and_extract_keywords(req):
 
             all_texts.append(summary)
 
-            # ✅ 분석된 키워드를 포함해 DB 저장
-            upsert_article(
-                article=article,
-                label=None,
-                confidence=None,
-                keyword=keyword_items,  # 실제 추출된 키워드
-                model="keyword_" + method
-            )
+            # ✅ 분석된 키워드를 포함해 저장 대상에 추가 (루프 후 일괄 저장)
+            keyword_records.append({
+                "article": article,
+                "keyword": keyword_items,  # 실제 추출된 키워드
+            })
+
+        if keyword_records:
+            upsert_articles_bulk(keyword_records, model="keyword_" + method)
 
         # ✅ 기사별 비중 추가
         for doc in individual_results:
@@ -254,7 +268,7 @@ async def get_news_articles_with_cache(
 ):
     """📦 뉴스 기사 목록 캐시 조회"""
     async def fetch_from_mongo(**kwargs):
-        return get_articles_by_conditions(**kwargs)
+        return await news_article_model.get_articles_by_conditions(**kwargs)
 
     return await get_or_cache(
         prefix="news_articles",
@@ -276,13 +290,7 @@ async def get_keyword_analysis_with_cache(
 ):
     """📦 키워드 분석 결과 캐시 조회"""
     async def fetch_from_mongo(**kwargs):
-        query = {
-            "keyword": kwargs["keyword"],
-            "method": kwargs["method"],
-            "date_range.start": kwargs["start_date"],
-            "date_range.end": kwargs["end_date"]
-        }
-        return db["keyword_analysis"].find_one(query, {"_id": 0})
+        return await news_article_model.get_keyword_analysis(**kwargs)
 
     return await get_or_cache(
         prefix="keyword_analysis",
@@ -296,7 +304,7 @@ async def get_keyword_analysis_with_cache(
 
 
 async def crawl_and_extract_keywords_with_cache(req):
-    redis_key = make_redis_key(
+    redis_key = await make_redis_key(
         prefix="keyword_extraction_result",
         keyword=req.keyword,
         start_date=req.start_date,
@@ -309,36 +317,58 @@ async def crawl_and_extract_keywords_with_cache(req):
         aggregate_mode="individual" if req.aggregate_from_individual else "summary"
     )
 
-    # ✅ [1] 최신 뉴스 중 새 기사 확인 → Redis 무효화
-    try:
-        latest_articles = get_latest_articles(req.keyword, max_articles=5)
-        latest_keys = [(a.get("title", ""), a.get("date", "")) for a in latest_articles if a.get("title") and a.get("date")]
-
-        existing_map = find_existing_bulk(latest_keys, model="keyword_" + req.method)
-        if len(existing_map) < len(latest_keys):
-            print("🚨 새 뉴스 발견 → 키워드 Redis 캐시 무효화")
-            await redis_client.delete(redis_key)
-    except Exception as e:
-        print(f"⚠️ 최신 뉴스 확인 실패 (무시하고 계속 진행): {e}")
+    async def refresh():
+        return await _refresh_keyword_extraction(req, redis_key)
 
-    # ✅ [2] Redis HIT 시 바로 반환
-    cached_result = await redis_client.get_json(redis_key)
-    if cached_result:
-        print(f"📦 [Redis] 키워드 추출 결과 캐시 HIT → {redis_key}")
+    # ✅ [1] Redis HIT 시 바로 반환 (soft 만료가 지났으면 백그라운드 갱신)
+    cached_entry = await redis_client.get_json(redis_key)
+    if cached_entry:
+        cached_result, is_stale = stale_cache.unwrap(cached_entry)
+        if is_stale:
+            print(f"♻️ [Redis] 만료된 키워드 추출 결과 반환 → 백그라운드 갱신 {redis_key}")
+            stale_cache.schedule_refresh(redis_key, refresh)
+        else:
+            # ✅ 최신 뉴스 중 새 기사 확인은 응답 이후 백그라운드에서
+            stale_cache.schedule_freshness_check(
+                redis_key,
+                lambda: has_new_articles(req.keyword, "keyword_" + req.method),
+                refresh
+            )
         return cached_result
 
-    # ✅ [3] 캐시 MISS → 추출 실행
-    result = crawl_and_extract_keywords(req)  # 기존 동기 함수 그대로 사용 가능
+    # ✅ [2] 캐시 MISS → 동시 요청은 하나의 추출 결과를 공유 (대기 중 확인은 적중/미스 지표에서 제외)
+    async def check_cache():
+        cached = await redis_client.get_json(redis_key, record=False)
+        return stale_cache.unwrap(cached)[0] if cached else None
+
+    return await single_flight.run(redis_key, refresh, check_cache=check_cache)
+
+
+async def has_new_articles(keyword, model):
+    """
+    ✅ 최신 뉴스 일부만 크롤링(스레드)해서 DB에 없는 기사가 있는지 확인
+    - 감정 분석/키워드 추출 캐시의 새 기사 확인(stale_cache.schedule_freshness_check)에 공용으로 사용
+    """
+    latest_articles = await asyncio.to_thread(get_latest_articles, keyword, max_articles=5)
+    latest_keys = {article_key_of(a) for a in latest_articles if a.get("title") and a.get("date")}
+
+    existing_map = await news_article_model.find_existing_bulk(
+        list(latest_keys), model=model, projection={"_id": 0, "article_key": 1}
+    )
+    return len(existing_map) < len(latest_keys)
+
+
+async def _refresh_keyword_extraction(req, redis_key):
+    """✅ 키워드 추출 재실행 후 soft 만료 시각과 함께 Redis 저장 (블로킹 작업 → 스레드)"""
+    with cache_metrics.fill_timer("keyword_extraction_result"):
+        result = await asyncio.to_thread(crawl_and_extract_keywords, req)
 
     if result:
+        soft_ttl = settings.review_analysis_cache_expire_time
         await redis_client.set_json(
             redis_key,
-            result,
-            expire=settings.review_analysis_cache_expire_time
+            stale_cache.wrap(result, soft_ttl),
+            expire=stale_cache.hard_ttl(soft_ttl)
         )
-        print(f"🧠 키워드 추출 결과 Redis 저장 완료 → {redis_key}")
 
     return result
-
-
-
@@ -1,11 +1,17 @@
 import asyncio
 import hashlib
-import json
 from typing import Any, Optional, Dict, List
 import pandas as pd
 from ..models.company import company_review_model
 from ..database.redis_client import redis_client
 from ..config import settings
+from ..utils.single_flight import single_flight
+from ..utils.stale_cache import stale_cache
+from ..utils import cache_codec
+from ..utils.cache_metrics import cache_metrics
+from .crawl_job_service import (
+  crawl_job_service, CrawlJobKind, CrawlQueueFullError, FINISHED_STATUSES)
+from crawling.com_review_crawling import CompanyReviewCrawler
 from machine_model.company_review.review_dataset import ReviewDataset
 from machine_model.company_review.review_analyzer import ReviewSentimentAnalyzer
 
@@ -14,120 +20,127 @@ class ReviewAnalysisService:
   def __init__(self) -> None:
     self.review_dataset = ReviewDataset()
     self.review_analyzer = ReviewSentimentAnalyzer()
-    self._review_crawler = None
   
-  def _get_cache_key(self, company_name: str) -> str:
-    """리뷰 분석 캐시 키 생성"""
+  async def _get_cache_key(self, company_name: str) -> str:
+    """리뷰 분석 캐시 키 생성 (네임스페이스 세대 번호 포함)"""
     # 기업명을 해시화하여 안전한 키 생성
     company_hash = hashlib.md5(company_name.encode()).hexdigest()
-    return f"review_analysis:{company_hash}"
+    return await redis_client.namespace_key("review_analysis", company_hash)
   
-  def _serialize_for_cache(self, data: Any) -> Any:
-    """캐시 저장을 위한 데이터 직렬화"""
-    if isinstance(data, pd.DataFrame):
-      # DataFrame을 딕셔너리로 변환 (records 형태)
-      return {
-        '_type': 'dataframe',
-        'data': data.to_dict('records'),
-        'columns': data.columns.tolist(),
-        'shape': data.shape
-      }
-    elif isinstance(data, dict):
-      # 딕셔너리의 각 값에 대해 재귀적으로 직렬화
-      return {key: self._serialize_for_cache(value) for key, value in data.items()}
-    elif isinstance(data, list):
-      # 리스트의 각 항목에 대해 재귀적으로 직렬화
-      return [self._serialize_for_cache(item) for item in data]
-    elif isinstance(data, tuple):
-      # 튜플을 리스트로 변환
-      return [self._serialize_for_cache(item) for item in data]
-    else:
-      # 기본 타입은 그대로 반환
-      return data
-  
-  def _deserialize_from_cache(self, data: Any) -> Any:
-    """캐시에서 읽은 데이터 역직렬화"""
-    if isinstance(data, dict) and data.get('_type') == 'dataframe':
-      # DataFrame 복원
-      return pd.DataFrame(data['data'], columns=data['columns'])
-    elif isinstance(data, dict):
-      # 딕셔너리의 각 값에 대해 재귀적으로 역직렬화
-      return {key: self._deserialize_from_cache(value) for key, value in data.items()}
-    elif isinstance(data, list):
-      # 리스트의 각 항목에 대해 재귀적으로 역직렬화
-      return [self._deserialize_from_cache(item) for item in data]
-    else:
-      # 기본 타입은 그대로 반환
-      return data
-  
-  async def _get_from_cache(self, key: str) -> Any:
-    """Redis 캐시에서 값 조회"""
+  async def _get_from_cache(self, key: str, record: bool = True) -> Any:
+    """Redis 캐시에서 값 조회 (코덱 헤더로 형식 판별, 기존 JSON 값도 디코딩)"""
     try:
       if redis_client.is_connected and redis_client._redis is not None:
-        value = await redis_client.get(key)
+        value = await redis_client.get_bytes(key, record=record)
         if value is not None:
-          # JSON 파싱 시도
           try:
-            json_data = json.loads(value)
-            # 역직렬화 수행
-            return self._deserialize_from_cache(json_data)
-          except json.JSONDecodeError:
-            return value
+            return cache_codec.decode(value)
+          except (ValueError, UnicodeDecodeError) as e:
+            print(f"리뷰 분석 캐시 디코딩 오류 ({key}): {str(e)}")
+            cache_metrics.record_error("review_analysis", "decode")
+            return None
       return None
       
     except Exception as e:
       print(f"리뷰 분석 캐시 조회 오류: {str(e)}")
+      cache_metrics.record_error("review_analysis", "get")
       return None
   
   async def _set_to_cache(self, key: str, value: Any, expire_seconds: int) -> bool:
-    """Redis 캐시에 값 저장"""
+    """Redis 캐시에 값 저장 (settings.cache_codec 형식)"""
     try:
       if redis_client.is_connected and redis_client._redis is not None:
-        # 직렬화 수행
-        serialized_value = self._serialize_for_cache(value)
+        redis_value = cache_codec.encode(value)
         
-        # JSON으로 변환
-        redis_value = json.dumps(serialized_value, ensure_ascii=False)
-        
-        success = await redis_client.setex(key, expire_seconds, redis_value)
-        if success:
-          print(f"💾 Redis 리뷰 분석 캐시 저장 성공: {key}")
-        return success
+        return await redis_client.setex(key, expire_seconds, redis_value)
       return False
       
     except Exception as e:
       print(f"Redis 리뷰 분석 캐시 저장 오류: {str(e)}")
+      cache_metrics.record_error("review_analysis", "set")
       return False
 
   async def analysis_review(self, name: str) -> Dict[str, Any]:
-    """리뷰 분석 실행 (캐시 지원)"""
+    """리뷰 분석 실행 (캐시 지원)
+
+    저장된 리뷰가 없으면 리뷰 크롤링 작업을 등록하고 {"crawl_job": 작업 상태}를 반환한다.
+    """
+    
+    # 캐시 워밍 대상 선정을 위한 조회 수 기록
+    await redis_client.increment_popularity("review_analysis", name)
     
     # 1. 캐시에서 먼저 확인
-    cache_key = self._get_cache_key(name)
-    cached_result = await self._get_from_cache(cache_key)
-    if cached_result:
-      print(f"📦 캐시에서 리뷰 분석 결과 반환: {name}")
+    cache_key = await self._get_cache_key(name)
+    cached_entry = await self._get_from_cache(cache_key)
+    if cached_entry:
+      cached_result, is_stale = stale_cache.unwrap(cached_entry)
+      if is_stale:
+        # soft 만료된 결과는 바로 반환하고 백그라운드에서 한 번만 재분석
+        print(f"♻️ 만료된 리뷰 분석 결과 반환 후 백그라운드 갱신: {name}")
+        stale_cache.schedule_refresh(
+          cache_key, lambda: self._analyze_and_cache(cache_key, name))
       return cached_result
     
-    print(f"🔍 리뷰 분석 새로 실행: {name}")
-    
     try:
-      # 2. 실제 분석 수행
-      analysis_result = await self._perform_analysis(name)
-      
-      # 3. 결과를 캐시에 저장
-      cache_expire_time = settings.review_analysis_cache_expire_time
-      await self._set_to_cache(cache_key, analysis_result, cache_expire_time)
+      # 2. 동시에 들어온 같은 기업 요청은 하나의 분석 결과를 공유
+      analysis_result = await single_flight.run(
+        cache_key,
+        lambda: self._analyze_and_cache(cache_key, name),
+        check_cache=lambda: self._get_cached_analysis(cache_key)
+      )
+      if analysis_result is not None:
+        return analysis_result
       
-      return analysis_result
+      # 3. 저장된 리뷰가 없음 → 요청 경로 밖에서 크롤링 (완료 후 다시 요청하면 분석)
+      job = await crawl_job_service.submit("reviews", name)
+      if not job or job["status"] in FINISHED_STATUSES:
+        return self._get_default_response()
+      return {"crawl_job": job}
       
+    except CrawlQueueFullError:
+      raise
     except Exception as e:
       print(f"리뷰 분석 중 오류 발생: {str(e)}")
       # 기본 응답 반환
       return self._get_default_response()
 
+  async def _analyze_and_cache(self, cache_key: str, name: str) -> Optional[Dict[str, Any]]:
+    """리뷰 분석 수행 후 결과를 캐시에 저장 (저장된 리뷰가 없으면 None, 캐시하지 않음)"""
+    reviews = await self.get_reviews(name)
+    if not reviews:
+      return None
+    
+    print(f"🔍 리뷰 분석 새로 실행: {name}")
+    
+    # 실제 분석 수행 (채우기 시간 기록)
+    with cache_metrics.fill_timer("review_analysis"):
+      analysis_result = await self._perform_analysis(name, reviews)
+    
+    # 결과를 soft 만료 시각과 함께 캐시에 저장
+    soft_ttl = settings.review_analysis_cache_expire_time
+    await self._set_to_cache(
+      cache_key,
+      stale_cache.wrap(analysis_result, soft_ttl),
+      stale_cache.hard_ttl(soft_ttl)
+    )
+    
+    return analysis_result
+
+  async def refresh_analysis(self, name: str) -> Optional[Dict[str, Any]]:
+    """리뷰 분석을 다시 수행해 캐시에 저장 (다른 곳에서 분석 중이면 건너뛰고 None 반환)"""
+    cache_key = await self._get_cache_key(name)
+    return await single_flight.try_run(
+      cache_key, lambda: self._analyze_and_cache(cache_key, name))
+
+  async def _get_cached_analysis(self, cache_key: str) -> Any:
+    """캐시된 분석 결과만 꺼내서 반환 (없으면 None, single-flight 대기 중 확인용이라 지표에 기록하지 않음)"""
+    cached_entry = await self._get_from_cache(cache_key, record=False)
+    if not cached_entry:
+      return None
+    return stale_cache.unwrap(cached_entry)[0]
+
   async def get_reviews(self, name: str) -> List[Dict]:
-    """기업 이름으로 리뷰 데이터 조회"""
+    """기업 이름으로 저장된 리뷰 데이터 조회 (없으면 빈 목록)"""
     try:
       reviews = await company_review_model.get_reviews_by_company(name)
       
@@ -145,20 +158,14 @@ class ReviewAnalysisService:
               clean_review[key] = value
           cleaned_reviews.append(clean_review)
         return cleaned_reviews
-      # DB에 없으면 크롤링 후 재귀적으로 다시 조회
-      else:
-        await self._crawl_company_reviews(name)
-        return await self.get_reviews(name)
+      return []
         
     except Exception as e:
       print(f"❌ 리뷰 데이터 조회 중 오류 발생: {str(e)}")
       return []
   
-  async def _perform_analysis(self, name: str) -> Dict[str, Any]:
+  async def _perform_analysis(self, name: str, reviews: List[Dict]) -> Dict[str, Any]:
     """실제 리뷰 분석 수행"""
-    # 리뷰 데이터 조회
-    reviews = await self.get_reviews(name)
-    
     print(f"📊 '{name}' 리뷰 {len(reviews)}개 분석 시작")
     
     # 현재 실행 중인 이벤트 루프 가져오기
@@ -210,7 +217,7 @@ class ReviewAnalysisService:
     try:
       if company_name:
         # 특정 기업의 캐시만 삭제
-        cache_key = self._get_cache_key(company_name)
+        cache_key = await self._get_cache_key(company_name)
         
         redis_deleted = 0
         
@@ -221,15 +228,11 @@ class ReviewAnalysisService:
         return redis_deleted
       else:
         # 모든 리뷰 분석 캐시 삭제
-        pattern = "review_analysis:*"
-        
         redis_deleted = 0
         
-        # Redis에서 패턴 매칭하여 삭제  
+        # 세대 번호를 올려 네임스페이스 전체 무효화 (기존 키는 TTL로 만료)
         if redis_client.is_connected and redis_client._redis is not None:
-          keys = await redis_client.keys(pattern)
-          if keys:
-            redis_deleted = await redis_client.delete(*keys)
+          redis_deleted = await redis_client.invalidate_namespace("review_analysis")
         
         return redis_deleted
         
@@ -237,45 +240,20 @@ class ReviewAnalysisService:
       print(f"리뷰 분석 캐시 삭제 중 오류: {str(e)}")
       return 0
 
-  async def _crawl_company_reviews(self, company_name: str) -> List[Dict]:
-    """TeamBlind에서 기업 리뷰 크롤링"""
-    try:
-      import sys
-      import os
-      django_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-      if django_root not in sys.path:
-        sys.path.insert(0, django_root)
-      
-      from crawling.com_review_crawling import CompanyReviewCrawler
-      
-      if self._review_crawler is None:
-        print("새 리뷰 크롤러 인스턴스 생성")
-        self._review_crawler = CompanyReviewCrawler()
-      else:
-        print("기존 리뷰 크롤러 인스턴스 재사용")
-      
-      # 현재 실행 중인 이벤트 루프 가져오기
-      loop = asyncio.get_event_loop()
-      
-      # 크롤링 실행 (동기 함수를 비동기로 실행)
-      crawled_reviews = await loop.run_in_executor(
-        None, self._review_crawler.crawl_single_company_reviews, company_name
-      )
-      
-      if crawled_reviews:
-        print(f"✅ 크롤링 완료: {len(crawled_reviews)}개 리뷰")
-        return await company_review_model.get_reviews_by_company(company_name)
-        
-    except Exception as e:
-      print(f"❌ 리뷰 크롤링 중 오류 발생: {str(e)}")
-      return []
-
-  def cleanup_review_crawler(self):
-    """리뷰 크롤러 리소스 정리"""
-    if self._review_crawler:
-      print("리뷰 크롤러 리소스 정리 중...")
-      self._review_crawler.close_connection()
-      self._review_crawler = None
+  async def _on_reviews_crawled(self, company_name: str, reviews) -> None:
+    """리뷰 크롤링 작업 완료 처리 (이전 분석 결과가 남아 있으면 삭제)"""
+    if reviews:
+      print(f"✅ 크롤링 완료: {len(reviews)}개 리뷰")
+      await self.clear_analysis_cache(company_name)
 
 # 싱글톤 인스턴스
-review_analysis_service = ReviewAnalysisService() 
\ No newline at end of file
+review_analysis_service = ReviewAnalysisService()
+
+# TeamBlind 리뷰 크롤링 작업 (워커당 브라우저 1개)
+crawl_job_service.register("reviews", CrawlJobKind(
+  create_crawler=CompanyReviewCrawler,
+  crawl=lambda crawler, name: crawler.crawl_single_company_reviews(name),
+  workers=settings.crawl_review_workers,
+  close=lambda crawler: crawler.close_connection(),
+  on_finish=review_analysis_service._on_reviews_crawled
+))
@@ -1,81 +1,38 @@
 import hashlib
 import json
-import re
+from datetime import datetime
 from typing import Any
-from ..models.company import company_model
-from ..database.redis_client import redis_client
+from ..models.company import company_model, to_list_item
+from ..database.redis_client import redis_client, CACHE_NAMESPACES
 from ..config import settings
+from ..utils.single_flight import single_flight
+from ..utils.cache_metrics import cache_metrics
+from ..utils.financial_parser import FINANCIAL_FIELDS
+from .crawl_job_service import (
+  crawl_job_service, CrawlJobKind, CrawlQueueFullError, DONE, FINISHED_STATUSES)
 from crawling.com_crawling import CompanyCrawler
 
-class FinancialDataParser:
-  @staticmethod
-  def parse_financial_amount(amount_str):
-    """재무 금액 문자열을 파싱하여 원 단위 금액과 연도를 반환"""
-    try:
-      # 연도 추출
-      year_match = re.search(r'\((\d{4})년?\)', amount_str)
-      year = int(year_match.group(1)) if year_match else None
-      
-      # 금액 부분 추출 (괄호 앞부분)
-      amount_part = amount_str.split('(')[0].strip()
-      
-      # 숫자와 단위 추출
-      amount = 0.0
-      
-      # 조 단위 처리
-      trillion_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*조', amount_part)
-      if trillion_match:
-        amount += float(trillion_match.group(1).replace(',', '')) * 1000000000000
-      
-      # 억 단위 처리
-      billion_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*억', amount_part)
-      if billion_match:
-        amount += float(billion_match.group(1).replace(',', '')) * 100000000
-      
-      # 만 단위 처리
-      million_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*만', amount_part)
-      if million_match:
-        amount += float(million_match.group(1).replace(',', '')) * 10000
-      
-      # 원 단위 처리 (단위가 없는 숫자)
-      if amount == 0.0:
-        # 단위가 없는 경우 원 단위로 처리
-        number_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)', amount_part)
-        if number_match:
-          amount = float(number_match.group(1).replace(',', ''))
-      
-      return amount, year
-      
-    except (ValueError, AttributeError) as e:
-      print(f"재무 데이터 파싱 중 오류 발생: {str(e)}")
-      return 0.0, None
-
 class SearchService:
   """Redis 전용 비동기 검색 서비스"""
-  def __init__(self):
-    self.parser = FinancialDataParser()
-    self._crawler = None  # 재사용 가능한 크롤러 인스턴스
   
-  def _get_cache_key(self, prefix, keyword):
-    """캐시 키 생성"""
+  async def _get_cache_key(self, prefix, keyword):
+    """캐시 키 생성 (네임스페이스 세대 번호 포함)"""
     keyword_hash = hashlib.md5(keyword.encode()).hexdigest()
-    return f"{prefix}:{keyword_hash}"
+    return await redis_client.namespace_key(prefix, keyword_hash)
   
-  async def _get_from_cache(self, key: str) -> Any:
-    """Redis 캐시에서 값 조회"""
+  async def _get_from_cache(self, key: str, record: bool = True) -> Any:
+    """Redis 캐시에서 값 조회 (L1 캐시에 있으면 디코딩 없이 반환)
+
+    record=False는 single-flight 대기 중 확인처럼 적중/미스 지표에 넣지 않을 조회에 사용한다.
+    """
     try:
       if redis_client.is_connected and redis_client._redis is not None:
-        value = await redis_client.get(key)
-        if value is not None:
-          # JSON 파싱 시도
-          try:
-            return json.loads(value)
-          except json.JSONDecodeError:
-            return value
+        return await redis_client.get_json(key, record=record)
       return None
       
     except Exception as e:
       print(f"캐시 조회 오류: {e}")
+      cache_metrics.record_error(redis_client._namespace_of(key), "get")
       return None
   
   async def _set_to_cache(self, key: str, value: Any, expire_seconds: int) -> bool:
@@ -87,16 +44,38 @@ class SearchService:
         else:
           redis_value = value
         
-        success = await redis_client.setex(key, expire_seconds, redis_value)
-        if success:
-          print(f"💾 Redis 캐시 저장 성공: {key}")
-        return success
+        return await redis_client.setex(key, expire_seconds, redis_value)
       return False
       
     except Exception as e:
       print(f"Redis 캐시 저장 오류: {str(e)}")
+      cache_metrics.record_error(redis_client._namespace_of(key), "set")
       return False
   
+  async def _set_many_to_cache(self, mapping, expire_seconds):
+    """여러 캐시 값을 파이프라인 한 번으로 저장"""
+    try:
+      if mapping and redis_client.is_connected and redis_client._redis is not None:
+        return await redis_client.set_many(mapping, expire=expire_seconds)
+      return False
+      
+    except Exception as e:
+      print(f"Redis 캐시 일괄 저장 오류: {str(e)}")
+      cache_metrics.record_error("company_detail", "set")
+      return False
+  
+  async def _get_many_from_cache(self, keys, record=True):
+    """여러 캐시 키를 MGET 한 번으로 조회 (키 순서대로, 없으면 None)"""
+    try:
+      if redis_client.is_connected and redis_client._redis is not None:
+        return await redis_client.get_many_json(keys, record=record)
+      return [None] * len(keys)
+      
+    except Exception as e:
+      print(f"캐시 일괄 조회 오류: {e}")
+      cache_metrics.record_error("company_search", "get")
+      return [None] * len(keys)
+  
   async def search_company_with_cache(self, name=None, category=None, cache_time=None):
     """Redis 캐시를 활용한 기업 검색 (DB에 없으면 자동 크롤링)"""
     cache_time = settings.cache_expire_time
@@ -106,19 +85,239 @@ class SearchService:
       search_keyword = f"category:{category}"
       search_type = "category"
     else:
-      search_keyword = f"name:{name if name else ''}"
+      # 결과 없음 캐시는 앞뒤 공백을 제거한 기업명으로 저장하므로 같은 형태로 키 생성
+      name = (name or "").strip()
+      search_keyword = f"name:{name}"
       search_type = "name"
     
-    # 캐시 키 생성
-    cache_key = self._get_cache_key("company_search", search_keyword)
+    # 캐시 키 생성 (검색 결과가 없었던 키워드는 별도 네임스페이스에 짧게 보관)
+    cache_key = await self._get_cache_key("company_search", search_keyword)
+    negative_key = await self._get_cache_key("company_search_negative", search_keyword)
     
-    # 1. 먼저 캐시에서 조회
-    cached_result = await self._get_from_cache(cache_key)
-    if cached_result:
-      print(f"🎯 Redis 캐시에서 기업 검색 결과 조회 성공: {cache_key}")
+    # 1. 먼저 캐시에서 조회 (결과 없음 캐시 포함)
+    cached_result = await self._get_cached_search(cache_key, negative_key)
+    if cached_result is not None:
       return cached_result
     
-    # 2. 캐시에 없으면 MongoDB에서 검색
+    # 2. 캐시 미스 → 동시 요청은 하나의 조회/크롤링 결과를 공유
+    return await single_flight.run(
+      cache_key,
+      lambda: self._timed_fill(
+        "company_search",
+        self._search_and_cache(
+          cache_key, negative_key, search_type, name, category, cache_time)),
+      check_cache=lambda: self._get_cached_search(cache_key, negative_key, record=False)
+    )
+  
+  async def search_company_page_with_cache(
+    self, name=None, category=None, limit=20, cursor=None, crawl_wait=0):
+    """기업 검색 결과 한 페이지 조회 (목록용 필드만, 페이지별로 캐시)
+
+    DB에 없는 기업명은 크롤링 작업을 등록하고 최대 crawl_wait초 기다린다.
+    반환: {"companies": [...], "next_cursor": str | None}
+      (크롤링이 아직 진행 중이면 "crawl_job": 작업 상태 추가, 캐시하지 않음)
+    """
+    if category:
+      search_type, keyword = "category", category
+    else:
+      search_type, keyword = "name", (name or "").strip()
+    
+    # 검색어가 비어 있으면 조회하지 않음 (빈 부분 일치 조건은 전체 기업과 일치)
+    if not keyword:
+      return {"companies": [], "next_cursor": None}
+    
+    # 페이지마다 별도 키 (큰 카테고리도 전체 결과를 한 값으로 직렬화하지 않음)
+    cache_key = await self._get_cache_key(
+      "company_search", f"page:{search_type}:{keyword}:{limit}:{cursor or ''}")
+    negative_key = await self._get_cache_key(
+      "company_search_negative", f"{search_type}:{keyword}")
+    
+    cached_page = await self._get_cached_page(cache_key, negative_key)
+    if cached_page is not None:
+      return cached_page
+    
+    return await single_flight.run(
+      cache_key,
+      lambda: self._timed_fill(
+        "company_search",
+        self._search_page_and_cache(cache_key, search_type, keyword, limit, cursor, crawl_wait)),
+      check_cache=lambda: self._get_cached_page(cache_key, negative_key, record=False)
+    )
+  
+  async def _get_cached_page(self, cache_key, negative_key, record=True):
+    """페이지 캐시와 결과 없음 캐시를 MGET 한 번으로 조회 (둘 다 없으면 None)"""
+    cached_page, negative = await self._get_many_from_cache([cache_key, negative_key], record)
+    if cached_page:
+      return cached_page
+    if negative:
+      return {"companies": [], "next_cursor": None}
+    return None
+  
+  async def _search_page_and_cache(self, cache_key, search_type, keyword, limit, cursor, crawl_wait):
+    """MongoDB에서 한 페이지 조회 후 캐시 (첫 페이지 이름 검색 결과가 없으면 크롤링 작업 등록)"""
+    companies, next_cursor = await company_model.get_company_page(
+      search_type, keyword, limit, cursor)
+    
+    if not companies and not cursor and search_type == "name" and keyword:
+      # 위키피디아 크롤링 (결과 없음 캐시는 크롤링 작업 완료 시 저장)
+      crawled, job = await self._crawl_company(keyword, crawl_wait)
+      if not crawled:
+        page = {"companies": [], "next_cursor": None}
+        if job and job["status"] not in FINISHED_STATUSES:
+          page["crawl_job"] = job
+        return page
+      companies = [to_list_item(company) for company in crawled]
+    elif not companies and not cursor:
+      await self._set_negative_cache(
+        await self._get_cache_key("company_search_negative", f"{search_type}:{keyword}"),
+        "not_in_db")
+      return {"companies": [], "next_cursor": None}
+    
+    page = {
+      "companies": [self._serialize_company(company) for company in companies],
+      "next_cursor": next_cursor
+    }
+    if companies:
+      await self._set_to_cache(cache_key, page, settings.cache_expire_time)
+    return page
+  
+  async def get_company_detail_with_cache(self, name):
+    """기업 상세 정보 조회 (전체 필드, company_detail 네임스페이스에 캐시)"""
+    name = name.strip()
+    cache_key = await self._get_cache_key("company_detail", name)
+    
+    cached = await self._get_from_cache(cache_key)
+    if cached:
+      return cached
+    
+    async def fill():
+      company = await company_model.get_company_by_exact_name(name)
+      if not company:
+        return None
+      detail = self._serialize_company(company)
+      await self._set_to_cache(cache_key, detail, settings.cache_expire_time)
+      return detail
+    
+    return await single_flight.run(
+      cache_key,
+      lambda: self._timed_fill("company_detail", fill()),
+      check_cache=lambda: self._get_from_cache(cache_key, record=False)
+    )
+  
+  async def get_companies_batch(self, names):
+    """여러 기업을 이름(정확히 일치)으로 한 번에 조회 (요청 순서 유지, 중복 이름은 한 번만)
+
+    1. 상세 캐시와 결과 없음 캐시를 MGET 한 번으로 조회
+    2. 캐시 미스는 name $in 쿼리 한 번으로 조회하고 파이프라인 한 번으로 상세 캐시 저장
+    3. DB에도 없는 기업은 앞에서부터 company_batch_max_crawls개까지만 크롤링 작업 등록 (기다리지 않음)
+    반환: [{"name", "status", "company"(목록용 필드), "crawl_job"}]
+      status: cached, db, crawling, not_found, skipped(크롤링 제한 초과 또는 대기열 가득 참)
+    """
+    names = list(dict.fromkeys(name.strip() for name in names if name and name.strip()))
+    if len(names) > settings.company_batch_max_names:
+      raise ValueError(f"한 번에 최대 {settings.company_batch_max_names}개 기업까지 조회할 수 있습니다")
+    
+    detail_keys = [await self._get_cache_key("company_detail", name) for name in names]
+    negative_keys = [
+      await self._get_cache_key("company_search_negative", f"name:{name}") for name in names
+    ]
+    cached_results = await self._get_many_from_cache(detail_keys + negative_keys)
+    
+    results = {}
+    missing = []
+    for i, name in enumerate(names):
+      detail, negative = cached_results[i], cached_results[len(names) + i]
+      if detail:
+        results[name] = ("cached", detail, None)
+      elif negative:
+        results[name] = ("not_found", None, None)
+      else:
+        missing.append(i)
+    
+    if missing:
+      with cache_metrics.fill_timer("company_detail"):
+        companies = await company_model.get_companies_by_exact_names(
+          [names[i] for i in missing])
+        found = {}
+        for company in companies:
+          found.setdefault(company["name"], self._serialize_company(company))
+        await self._set_many_to_cache(
+          {detail_keys[i]: found[names[i]] for i in missing if names[i] in found},
+          settings.cache_expire_time)
+      
+      crawl_count = 0
+      for i in missing:
+        name = names[i]
+        if name in found:
+          results[name] = ("db", found[name], None)
+        elif crawl_count < settings.company_batch_max_crawls:
+          crawl_count += 1
+          results[name] = await self._batch_crawl(name)
+        else:
+          results[name] = ("skipped", None, None)
+    
+    batch = []
+    for name in names:
+      status, company, job = results[name]
+      batch.append({
+        "name": name,
+        "status": status,
+        "company": to_list_item(company) if company else None,
+        "crawl_job": job
+      })
+    return batch
+  
+  async def _batch_crawl(self, name):
+    """일괄 조회에서 DB에 없는 기업의 크롤링 작업 등록 (status, company, crawl_job)"""
+    try:
+      stored, job = await self._crawl_company(name, 0)
+    except (CrawlQueueFullError, ValueError) as e:
+      print(f"⚠️ '{name}' 크롤링 작업 등록 생략: {e}")
+      return "skipped", None, None
+    if stored:
+      return "db", stored[0], job
+    if job and job["status"] not in FINISHED_STATUSES:
+      return "crawling", None, job
+    return "not_found", None, job
+  
+  async def _get_cached_search(self, cache_key, negative_key, record=True):
+    """검색 결과 캐시와 결과 없음 캐시를 MGET 한 번으로 조회
+    
+    결과가 캐시돼 있으면 목록, 결과 없음으로 캐시돼 있으면 빈 목록,
+    둘 다 없으면 None을 반환한다.
+    """
+    cached_result, negative = await self._get_many_from_cache([cache_key, negative_key], record)
+    if cached_result:
+      return cached_result
+    if negative:
+      return []
+    return None
+  
+  async def _timed_fill(self, namespace, fill):
+    """캐시 미스 후 채우기 작업 실행 시간을 지표에 기록"""
+    with cache_metrics.fill_timer(namespace):
+      return await fill
+  
+  def _serialize_company(self, company):
+    """MongoDB 문서를 JSON 직렬화 가능한 형태로 변환"""
+    serializable_company = {}
+    for key, value in company.items():
+      if key == '_id':
+        serializable_company['id'] = str(value)
+      else:
+        # 모든 값을 안전하게 처리
+        try:
+          # JSON 직렬화 테스트
+          json.dumps(value)
+          serializable_company[key] = value
+        except:
+          # 직렬화 불가능한 값은 문자열로 변환
+          serializable_company[key] = str(value)
+    return serializable_company
+  
+  async def _search_and_cache(
+    self, cache_key, negative_key, search_type, name, category, cache_time):
+    """MongoDB 검색 (없으면 크롤링) 후 결과를 캐시에 저장 (결과가 없으면 짧게 결과 없음 캐시)"""
     try:
       if search_type == "category":
         companies = await company_model.get_companies_by_category(category)
@@ -128,22 +327,9 @@ class SearchService:
       # 결과가 있으면 기존 방식으로 처리
       if companies:
         # 결과를 JSON 직렬화 가능한 형태로 변환
-        serializable_companies = []
-        for company in companies:
-          serializable_company = {}
-          for key, value in company.items():
-            if key == '_id':
-              serializable_company['id'] = str(value)
-            else:
-              # 모든 값을 안전하게 처리
-              try:
-                # JSON 직렬화 테스트
-                json.dumps(value)
-                serializable_company[key] = value
-              except:
-                # 직렬화 불가능한 값은 문자열로 변환
-                serializable_company[key] = str(value)
-          serializable_companies.append(serializable_company)
+        serializable_companies = [
+          self._serialize_company(company) for company in companies
+        ]
         
         # Redis 캐시에 저장
         await self._set_to_cache(cache_key, serializable_companies, cache_time)
@@ -152,17 +338,20 @@ class SearchService:
       
       # 이름으로 검색한 결과가 없는 경우
       elif search_type == "name" and name and name.strip():
-        # 크롤링 진행
-        crawled_company = await self._crawl_company_from_wikipedia(name.strip())
+        # 크롤링 작업 등록 후 잠시 대기 (같은 기업명 크롤링은 워커 전체에서 한 번만 실행)
+        serializable_companies, _ = await self._crawl_company(
+          name.strip(), settings.crawl_job_wait_seconds)
         
-        if crawled_company:
-          serializable_companies = [crawled_company]
-          
+        if serializable_companies:
           # Redis 캐시에 저장
           await self._set_to_cache(cache_key, serializable_companies, cache_time)
           
           return serializable_companies
       
+      # 카테고리 검색 결과가 없는 경우
+      elif search_type == "category":
+        await self._set_negative_cache(negative_key, "not_in_db")
+      
       # 크롤링 실패한 경우
       return []
       
@@ -170,88 +359,64 @@ class SearchService:
       print(f"검색 중 오류 발생: {str(e)}")
       return []
   
-  async def _crawl_company_from_wikipedia(self, company_name: str):
-    """Wikipedia에서 기업 정보 크롤링"""
-    try:
-      import sys
-      import os
-      
-      # Django 프로젝트 루트 경로를 sys.path에 추가
-      django_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-      if django_root not in sys.path:
-        sys.path.insert(0, django_root)
-      
-      # 크롤러 인스턴스 재사용
-      if self._crawler is None:
-        print("새 크롤러 인스턴스 생성")
-        self._crawler = CompanyCrawler()
-      else:
-        print("기존 크롤러 인스턴스 재사용")
-      
-      # 단일 기업 크롤링 실행
-      company_info = self._crawler.crawl_single_company_by_name(company_name)
-      
-      return company_info
-      
-    except Exception as e:
-      print(f"크롤링 중 오류 발생: {str(e)}")
-      return None
+  async def _set_negative_cache(self, negative_key, reason):
+    """결과 없음 캐시 저장 (크롤러가 기업을 저장하면 네임스페이스째 무효화됨)"""
+    await self._set_to_cache(
+      negative_key,
+      {"reason": reason, "cached_at": datetime.now().isoformat()},
+      settings.negative_cache_expire_time
+    )
   
-  async def get_top_companies_by_field(self, field_name, year=None, limit=10):
-    """특정 필드 기준 상위 기업 조회"""
-    try:
-      # MongoDB에서 해당 필드가 있는 모든 기업 조회
-      companies = await company_model.get_companies_by_field(field_name)
-      
-      # 재무 데이터 파싱 및 필터링
-      parsed_companies = []
-      for company in companies:
-        financial_data = company.get(field_name, "")
-        amount, data_year = self.parser.parse_financial_amount(financial_data)
-        
-        # 연도 필터링
-        if data_year == year:
-          company_data = {
-            'name': company.get('name', ''),
-            'amount': amount,
-            'year': data_year
-          }
-          parsed_companies.append(company_data)
-      
-      # 금액 기준 정렬 (내림차순)
-      parsed_companies.sort(key=lambda x: x['amount'], reverse=True)
-      
-      # 상위 기업 반환
-      return parsed_companies[:limit]
-      
-    except Exception as e:
-      print(f"{field_name} 기준 상위 기업 조회 중 오류 발생: {str(e)}")
-      return []
+  async def _find_stored_company(self, company_name: str):
+    """다른 워커가 크롤링해 저장한 기업 정보 조회"""
+    company = await company_model.get_company_by_exact_name(company_name)
+    return self._serialize_company(company) if company else None
+  
+  async def _crawl_company(self, company_name: str, wait: float):
+    """위키피디아 크롤링 작업 등록 후 최대 wait초 대기
 
+    반환: (저장된 기업 목록 또는 빈 목록, 작업 상태)
+    """
+    job = await crawl_job_service.submit("company", company_name, wait=wait)
+    if job and job["status"] == DONE:
+      stored = await self._find_stored_company(company_name)
+      if stored:
+        return [stored], job
+    return [], job
+  
+  async def _on_company_crawled(self, company_name: str, company_info):
+    """크롤링 작업 완료 처리 (위키피디아에도 없는 기업명은 결과 없음 캐시)"""
+    if not company_info:
+      # 같은 검색어로 브라우저를 다시 띄우지 않도록 기록
+      await self._set_negative_cache(
+        await self._get_cache_key("company_search_negative", f"name:{company_name}"),
+        "crawl_not_found")
+  
   async def get_comprehensive_ranking(self, year=2024, limit=10, cache_time=None):
-    """연도별 종합 재무 랭킹 조회 (매출액, 영업이익, 순이익)"""
+    """연도별 종합 재무 랭킹 조회 (매출액, 영업이익, 순이익)
+
+    연도별로 상위 ranking_max_limit개를 한 번 계산해 캐시하고, 요청한 limit만큼 잘라서 반환한다.
+    """
     cache_time = settings.ranking_cache_expire_time
+    limit = min(limit, settings.ranking_max_limit)
     
-    cache_key = self._get_cache_key("comprehensive_ranking", f"{year}_{limit}")
+    cache_key = await self._get_cache_key("comprehensive_ranking", str(year))
     
     try:
       # 1. 먼저 캐시에서 조회
       cached_rankings = await self._get_from_cache(cache_key)
       if cached_rankings:
-        print(f"🎯 Redis 캐시에서 랭킹 조회 성공: {cache_key}")
-        return cached_rankings
-      
-      # 2. 캐시에 없으면 DB에서 조회
-      rankings = {
-        '매출액': await self.get_top_companies_by_field('매출액', year, limit),
-        '영업이익': await self.get_top_companies_by_field('영업이익', year, limit),
-        '순이익': await self.get_top_companies_by_field('순이익', year, limit)
-      }
-      
-      # 3. 조회 결과를 캐시에 저장
-      await self._set_to_cache(cache_key, rankings, cache_time)
+        return self._slice_ranking(cached_rankings, limit)
       
-      return rankings
+      # 2. 캐시에 없으면 DB에서 조회 (동시 요청은 한 번만 계산)
+      rankings = await single_flight.run(
+        cache_key,
+        lambda: self._timed_fill(
+          "comprehensive_ranking",
+          self._compute_ranking(cache_key, year, cache_time)),
+        check_cache=lambda: self._get_from_cache(cache_key, record=False)
+      )
+      return self._slice_ranking(rankings, limit)
       
     except Exception as e:
       print(f"랭킹 조회 중 오류 발생: {str(e)}")
@@ -261,20 +426,52 @@ class SearchService:
         '순이익': []
       }
 
+  async def refresh_comprehensive_ranking(self, year):
+    """연도 랭킹을 다시 계산해 캐시에 저장 (다른 곳에서 계산 중이면 건너뛰고 None 반환)"""
+    cache_key = await self._get_cache_key("comprehensive_ranking", str(year))
+    return await single_flight.try_run(
+      cache_key,
+      lambda: self._timed_fill(
+        "comprehensive_ranking",
+        self._compute_ranking(cache_key, year, settings.ranking_cache_expire_time))
+    )
+
+  async def _compute_ranking(self, cache_key, year, cache_time):
+    """연도 랭킹(필드별 상위 ranking_max_limit개) 계산 후 캐시에 저장"""
+    rankings = await company_model.get_financial_rankings(year, settings.ranking_max_limit)
+    
+    # 조회 결과를 캐시에 저장
+    await self._set_to_cache(cache_key, rankings, cache_time)
+    
+    return rankings
+
+  @staticmethod
+  def _slice_ranking(rankings, limit):
+    """캐시된 연도 랭킹에서 필드별 상위 limit개"""
+    return {field: (rankings.get(field) or [])[:limit] for field in FINANCIAL_FIELDS}
+
   async def clear_cache(self, pattern=None):
-    """Redis 캐시 초기화"""
+    """Redis 캐시 초기화
+    
+    pattern이 없거나 '<네임스페이스>:*' 형태면 세대 번호를 올려 O(1)로 무효화하고,
+    그 외 패턴은 SCAN 기반으로 나눠서 삭제한다.
+    """
     cleared = 0
     
     try:
-      # Redis 캐시 삭제
       if redis_client.is_connected and redis_client._redis is not None:
-        if pattern:
-          keys = await redis_client.keys(pattern)
-          if keys:
-            cleared = await redis_client.delete(*keys)
+        namespace = pattern[:-2] if pattern and pattern.endswith(":*") else None
+        
+        if not pattern:
+          # 기업 관련 네임스페이스만 무효화 (다른 캐시는 유지)
+          invalidated = await redis_client.invalidate_namespaces(
+            ["company_search", "company_search_negative", "company_detail", "comprehensive_ranking"])
+          cleared = sum(invalidated.values())
+        elif namespace in CACHE_NAMESPACES:
+          cleared = await redis_client.invalidate_namespace(namespace)
         else:
-          result = await redis_client.flushdb()
-          cleared = 1 if result else 0
+          # SCAN 기반으로 나눠서 삭제 (KEYS로 Redis 전체를 막지 않음)
+          cleared = await redis_client.delete_pattern(pattern)
         
         if cleared > 0:
           print(f"🗑️ Redis 캐시 삭제: {cleared}개")
@@ -285,12 +482,14 @@ class SearchService:
       print(f"캐시 초기화 중 오류 발생: {str(e)}")
       return 0
 
-  def cleanup_crawler(self):
-    """크롤러 리소스 정리"""
-    if self._crawler:
-      print("크롤러 리소스 정리 중...")
-      self._crawler.close_connection()
-      self._crawler = None
-
 # 싱글톤 인스턴스
-search_service = SearchService()
\ No newline at end of file
+search_service = SearchService()
+
+# 위키피디아 기업 정보 크롤링 작업 (워커당 브라우저 1개)
+crawl_job_service.register("company", CrawlJobKind(
+  create_crawler=CompanyCrawler,
+  crawl=lambda crawler, name: crawler.crawl_single_company_by_name(name),
+  workers=settings.crawl_company_workers,
+  close=lambda crawler: crawler.close_connection(),
+  on_finish=search_service._on_company_crawled
+))
\ No newline at end of file
@@ -0,0 +1,56 @@
+import hashlib
+import math
+from app.config import settings
+
+# 저장된 기사 article_key 블룸 필터 (Redis 문자열 비트맵)
+# 키 이름에 크기/해시 수를 넣어 설정이 바뀌면 새 필터를 만들도록 함
+ARTICLE_BLOOM_KEY_PREFIX = "article_bloom"
+
+class BloomFilter:
+  """비트 배열 블룸 필터
+
+  비트 순서는 Redis SETBIT/GETBIT와 같음 (오프셋 0 = 첫 바이트의 최상위 비트)
+  → Redis에서 GET으로 받은 값을 그대로 로컬 필터로 쓰고, 저장 시에는 positions()로 SETBIT
+  """
+  def __init__(self, size_bits, hash_count, data=None):
+    self.size_bits = size_bits
+    self.hash_count = hash_count
+    size_bytes = (size_bits + 7) // 8
+    # Redis 문자열은 마지막으로 설정된 비트까지만 저장되므로 부족한 부분은 0으로 채움
+    self.bits = bytearray(data or b"")[:size_bytes].ljust(size_bytes, b"\x00")
+
+  @classmethod
+  def for_capacity(cls, capacity, error_rate):
+    """예상 원소 수와 오탐률에 맞는 크기로 생성"""
+    size_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    hash_count = max(1, round(size_bits / capacity * math.log(2)))
+    return cls(size_bits, hash_count)
+
+  def positions(self, key):
+    """key의 비트 오프셋 목록 (이중 해싱)"""
+    digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "big")
+    h2 = int.from_bytes(digest[8:], "big") | 1
+    return [(h1 + i * h2) % self.size_bits for i in range(self.hash_count)]
+
+  def add(self, key):
+    for offset in self.positions(key):
+      self.bits[offset >> 3] |= 0x80 >> (offset & 7)
+
+  def __contains__(self, key):
+    return all(self.bits[offset >> 3] & (0x80 >> (offset & 7)) for offset in self.positions(key))
+
+  def to_bytes(self):
+    return bytes(self.bits)
+
+  def redis_key(self, prefix=ARTICLE_BLOOM_KEY_PREFIX):
+    """크기/해시 수를 포함한 Redis 키"""
+    return f"{prefix}:{self.size_bits}:{self.hash_count}"
+
+def article_bloom(data=None):
+  """설정(article_bloom_capacity/error_rate) 크기의 기사 블룸 필터"""
+  empty = BloomFilter.for_capacity(
+    settings.article_bloom_capacity, settings.article_bloom_error_rate)
+  if data is None:
+    return empty
+  return BloomFilter(empty.size_bits, empty.hash_count, data)
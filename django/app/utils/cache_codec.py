@@ -0,0 +1,158 @@
+import json
+import datetime
+import msgpack
+import numpy as np
+import pandas as pd
+import zstandard
+from app.config import settings
+
+# 코덱으로 인코딩한 값의 헤더: MAGIC + 포맷 버전(1바이트) + 압축 방식(1바이트)
+# 기존 JSON 값은 항상 ASCII 문자로 시작하므로 \x00으로 시작하는 값과 구분된다
+CODEC_MAGIC = b"\x00CC"
+CODEC_VERSION = 1
+HEADER_SIZE = len(CODEC_MAGIC) + 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZSTD = 1
+
+# msgpack 확장 타입 코드
+EXT_DATAFRAME = 1
+
+# 원시 버퍼로 그대로 저장하는 컬럼 dtype 종류 (bool, int, uint, float)
+_BUFFER_DTYPE_KINDS = "biuf"
+
+class JsonCodec:
+  """기존 형식: JSON 문자열 (DataFrame은 records 딕셔너리로 변환)"""
+  name = "json"
+
+  def encode(self, value):
+    return json.dumps(_to_legacy(value), ensure_ascii=False)
+
+  def decode(self, raw):
+    if isinstance(raw, bytes):
+      raw = raw.decode("utf-8")
+    return _from_legacy(json.loads(raw))
+
+class MsgpackZstdCodec:
+  """msgpack + zstd 형식: DataFrame은 컬럼 단위로 저장"""
+  name = "msgpack_zstd"
+
+  def __init__(self, level=3, min_compress_bytes=1024):
+    self.level = level
+    self.min_compress_bytes = min_compress_bytes
+    self._compressor = zstandard.ZstdCompressor(level=level)
+    self._decompressor = zstandard.ZstdDecompressor()
+
+  def encode(self, value):
+    payload = msgpack.packb(value, default=_pack_default, use_bin_type=True)
+    compression = COMPRESSION_NONE
+    # 작은 값은 압축 이득보다 비용이 커서 그대로 저장
+    if len(payload) >= self.min_compress_bytes:
+      payload = self._compressor.compress(payload)
+      compression = COMPRESSION_ZSTD
+    return CODEC_MAGIC + bytes([CODEC_VERSION, compression]) + payload
+
+  def decode(self, raw):
+    version, compression = raw[len(CODEC_MAGIC)], raw[len(CODEC_MAGIC) + 1]
+    if version != CODEC_VERSION:
+      raise ValueError(f"지원하지 않는 캐시 코덱 버전: {version}")
+    payload = memoryview(raw)[HEADER_SIZE:]
+    if compression == COMPRESSION_ZSTD:
+      payload = self._decompressor.decompress(payload)
+    elif compression != COMPRESSION_NONE:
+      raise ValueError(f"지원하지 않는 캐시 압축 방식: {compression}")
+    return msgpack.unpackb(
+      payload, ext_hook=_unpack_ext, raw=False, strict_map_key=False)
+
+CODECS = {
+  JsonCodec.name: JsonCodec(),
+  MsgpackZstdCodec.name: MsgpackZstdCodec(
+    level=settings.cache_codec_zstd_level,
+    min_compress_bytes=settings.cache_codec_min_compress_bytes
+  ),
+}
+
+def get_codec(name=None):
+  """이름으로 코덱 조회 (기본값: settings.cache_codec)"""
+  name = name or settings.cache_codec
+  if name not in CODECS:
+    raise ValueError(f"알 수 없는 캐시 코덱: {name}")
+  return CODECS[name]
+
+def is_encoded(raw):
+  """코덱 헤더가 붙은 값인지 확인"""
+  return isinstance(raw, (bytes, bytearray)) and raw[:len(CODEC_MAGIC)] == CODEC_MAGIC
+
+def encode(value, codec=None):
+  """설정된 코덱으로 값 인코딩"""
+  return get_codec(codec).encode(value)
+
+def decode(raw):
+  """헤더를 보고 알맞은 코덱으로 디코딩 (헤더가 없으면 기존 JSON 값)"""
+  if is_encoded(raw):
+    return CODECS[MsgpackZstdCodec.name].decode(raw)
+  return CODECS[JsonCodec.name].decode(raw)
+
+def _pack_default(obj):
+  """msgpack이 직접 처리하지 못하는 타입 변환"""
+  if isinstance(obj, pd.DataFrame):
+    return msgpack.ExtType(EXT_DATAFRAME, _pack_dataframe(obj))
+  if isinstance(obj, np.generic):
+    return obj.item()
+  if isinstance(obj, np.ndarray):
+    return obj.tolist()
+  if isinstance(obj, (datetime.datetime, datetime.date)):
+    return obj.isoformat()
+  raise TypeError(f"캐시 코덱에서 지원하지 않는 타입: {type(obj)}")
+
+def _pack_dataframe(df):
+  """DataFrame을 컬럼 단위로 직렬화 (숫자 컬럼은 원시 버퍼 그대로)"""
+  columns = []
+  for name in df.columns:
+    series = df[name]
+    if series.dtype.kind in _BUFFER_DTYPE_KINDS:
+      values = np.ascontiguousarray(series.to_numpy())
+      columns.append([str(name), values.dtype.str, values.tobytes()])
+    else:
+      columns.append([str(name), None, series.tolist()])
+  return msgpack.packb(
+    {"rows": len(df), "columns": columns}, default=_pack_default, use_bin_type=True)
+
+def _unpack_ext(code, data):
+  """msgpack 확장 타입 복원"""
+  if code == EXT_DATAFRAME:
+    frame = msgpack.unpackb(data, raw=False)
+    columns = {}
+    for name, dtype, values in frame["columns"]:
+      if dtype is not None:
+        # 버퍼는 읽기 전용이므로 복사해서 사용
+        columns[name] = np.frombuffer(values, dtype=np.dtype(dtype)).copy()
+      else:
+        columns[name] = values
+    return pd.DataFrame(columns, index=pd.RangeIndex(frame["rows"]))
+  return msgpack.ExtType(code, data)
+
+def _to_legacy(data):
+  """기존 JSON 형식으로 변환 (DataFrame은 records 딕셔너리)"""
+  if isinstance(data, pd.DataFrame):
+    return {
+      '_type': 'dataframe',
+      'data': data.to_dict('records'),
+      'columns': data.columns.tolist(),
+      'shape': data.shape
+    }
+  if isinstance(data, dict):
+    return {key: _to_legacy(value) for key, value in data.items()}
+  if isinstance(data, (list, tuple)):
+    return [_to_legacy(item) for item in data]
+  return data
+
+def _from_legacy(data):
+  """기존 JSON 형식에서 DataFrame 복원"""
+  if isinstance(data, dict) and data.get('_type') == 'dataframe':
+    return pd.DataFrame(data['data'], columns=data['columns'])
+  if isinstance(data, dict):
+    return {key: _from_legacy(value) for key, value in data.items()}
+  if isinstance(data, list):
+    return [_from_legacy(item) for item in data]
+  return data
@@ -0,0 +1,193 @@
+import time
+from contextlib import contextmanager
+
+# 캐시 채우기(미스 후 계산) 소요 시간 구간 (초)
+FILL_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# 저장 값 크기 구간 (bytes)
+VALUE_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+class Histogram:
+  """누적 구간 히스토그램 (Prometheus histogram 형식)"""
+  def __init__(self, buckets):
+    self.buckets = buckets
+    self.counts = [0] * len(buckets)
+    self.total = 0
+    self.sum = 0.0
+
+  def observe(self, value):
+    self.total += 1
+    self.sum += value
+    for i, bound in enumerate(self.buckets):
+      if value <= bound:
+        self.counts[i] += 1
+        break
+
+  def cumulative(self):
+    """구간 상한별 누적 개수"""
+    result = []
+    running = 0
+    for bound, count in zip(self.buckets, self.counts):
+      running += count
+      result.append((bound, running))
+    return result
+
+  def stats(self):
+    return {
+      "count": self.total,
+      "sum": round(self.sum, 4),
+      "avg": round(self.sum / self.total, 4) if self.total else 0.0,
+      "buckets": {str(bound): count for bound, count in self.cumulative()}
+    }
+
+class NamespaceMetrics:
+  """네임스페이스 하나의 캐시 지표"""
+  def __init__(self):
+    self.hits = 0
+    self.local_hits = 0  # hits 중 L1 캐시에서 처리된 수
+    self.misses = 0
+    self.sets = 0
+    self.errors = {}  # 작업명 -> 오류 수
+    self.fill_latency = Histogram(FILL_LATENCY_BUCKETS)
+    self.value_size = Histogram(VALUE_SIZE_BUCKETS)
+
+  def stats(self):
+    lookups = self.hits + self.misses
+    return {
+      "hits": self.hits,
+      "local_hits": self.local_hits,
+      "misses": self.misses,
+      "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+      "sets": self.sets,
+      "errors": dict(self.errors),
+      "fill_latency_seconds": self.fill_latency.stats(),
+      "value_size_bytes": self.value_size.stats()
+    }
+
+class CacheMetrics:
+  """네임스페이스별 캐시 적중/미스/채우기 시간/값 크기/오류 집계 (워커별)"""
+  def __init__(self):
+    self._namespaces = {}
+    self.started_at = time.time()
+
+  def _get(self, namespace):
+    metrics = self._namespaces.get(namespace)
+    if metrics is None:
+      metrics = self._namespaces[namespace] = NamespaceMetrics()
+    return metrics
+
+  def record_hit(self, namespace, local=False):
+    """캐시 적중 기록"""
+    if namespace is None:
+      return
+    metrics = self._get(namespace)
+    metrics.hits += 1
+    if local:
+      metrics.local_hits += 1
+
+  def record_miss(self, namespace):
+    """캐시 미스 기록"""
+    if namespace is None:
+      return
+    self._get(namespace).misses += 1
+
+  def record_lookup(self, namespace, hit, local=False):
+    """조회 결과에 따라 적중/미스 기록"""
+    if hit:
+      self.record_hit(namespace, local)
+    else:
+      self.record_miss(namespace)
+
+  def record_set(self, namespace, value):
+    """값 저장과 크기 기록"""
+    if namespace is None:
+      return
+    metrics = self._get(namespace)
+    metrics.sets += 1
+    if isinstance(value, str):
+      size = len(value.encode("utf-8"))
+    elif isinstance(value, (bytes, bytearray)):
+      size = len(value)
+    else:
+      size = len(str(value))
+    metrics.value_size.observe(size)
+
+  def record_error(self, namespace, operation):
+    """캐시 작업 오류 기록"""
+    if namespace is None:
+      return
+    errors = self._get(namespace).errors
+    errors[operation] = errors.get(operation, 0) + 1
+
+  def record_fill(self, namespace, seconds):
+    """캐시 미스 후 값을 계산해 채우는 데 걸린 시간 기록"""
+    if namespace is None:
+      return
+    self._get(namespace).fill_latency.observe(seconds)
+
+  @contextmanager
+  def fill_timer(self, namespace):
+    """with 블록 실행 시간을 채우기 시간으로 기록"""
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.record_fill(namespace, time.perf_counter() - start)
+
+  def stats(self):
+    """네임스페이스별 지표 반환"""
+    return {
+      "since": self.started_at,
+      "namespaces": {
+        namespace: metrics.stats()
+        for namespace, metrics in sorted(self._namespaces.items())
+      }
+    }
+
+  def render_prometheus(self, prefix="cache"):
+    """Prometheus 텍스트 형식으로 변환"""
+    lines = []
+
+    def counter(name, help_text, values):
+      lines.append(f"# HELP {prefix}_{name} {help_text}")
+      lines.append(f"# TYPE {prefix}_{name} counter")
+      for labels, value in values:
+        lines.append(f"{prefix}_{name}{{{labels}}} {value}")
+
+    items = sorted(self._namespaces.items())
+    counter("hits_total", "Cache hits", [
+      (f'namespace="{ns}",layer="l1"', m.local_hits) for ns, m in items
+    ] + [
+      (f'namespace="{ns}",layer="redis"', m.hits - m.local_hits) for ns, m in items
+    ])
+    counter("misses_total", "Cache misses",
+            [(f'namespace="{ns}"', m.misses) for ns, m in items])
+    counter("sets_total", "Cache writes",
+            [(f'namespace="{ns}"', m.sets) for ns, m in items])
+    counter("errors_total", "Cache operation errors", [
+      (f'namespace="{ns}",operation="{op}"', count)
+      for ns, m in items for op, count in sorted(m.errors.items())
+    ])
+
+    def histogram(name, help_text, attr):
+      lines.append(f"# HELP {prefix}_{name} {help_text}")
+      lines.append(f"# TYPE {prefix}_{name} histogram")
+      for ns, m in items:
+        hist = getattr(m, attr)
+        for bound, count in hist.cumulative():
+          lines.append(f'{prefix}_{name}_bucket{{namespace="{ns}",le="{bound}"}} {count}')
+        lines.append(f'{prefix}_{name}_bucket{{namespace="{ns}",le="+Inf"}} {hist.total}')
+        lines.append(f'{prefix}_{name}_sum{{namespace="{ns}"}} {hist.sum}')
+        lines.append(f'{prefix}_{name}_count{{namespace="{ns}"}} {hist.total}')
+
+    histogram("fill_latency_seconds", "Time to compute and store a missed entry", "fill_latency")
+    histogram("value_size_bytes", "Size of values written to the cache", "value_size")
+    return "\n".join(lines) + "\n"
+
+  def reset(self):
+    """지표 초기화"""
+    self._namespaces.clear()
+    self.started_at = time.time()
+
+# 전역 인스턴스
+cache_metrics = CacheMetrics()
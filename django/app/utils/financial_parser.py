@@ -0,0 +1,71 @@
+import re
+
+# 랭킹 대상 재무 필드 (저장 시 <필드>_amount, <필드>_year 숫자 필드를 함께 저장)
+FINANCIAL_FIELDS = ("매출액", "영업이익", "순이익")
+
+class FinancialDataParser:
+  @staticmethod
+  def parse_financial_amount(amount_str):
+    """재무 금액 문자열을 파싱하여 원 단위 금액과 연도를 반환"""
+    try:
+      # 연도 추출
+      year_match = re.search(r'\((\d{4})년?\)', amount_str)
+      year = int(year_match.group(1)) if year_match else None
+      
+      # 금액 부분 추출 (괄호 앞부분)
+      amount_part = amount_str.split('(')[0].strip()
+      
+      # 숫자와 단위 추출
+      amount = 0.0
+      
+      # 조 단위 처리
+      trillion_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*조', amount_part)
+      if trillion_match:
+        amount += float(trillion_match.group(1).replace(',', '')) * 1000000000000
+      
+      # 억 단위 처리
+      billion_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*억', amount_part)
+      if billion_match:
+        amount += float(billion_match.group(1).replace(',', '')) * 100000000
+      
+      # 만 단위 처리
+      million_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*만', amount_part)
+      if million_match:
+        amount += float(million_match.group(1).replace(',', '')) * 10000
+      
+      # 원 단위 처리 (단위가 없는 숫자)
+      if amount == 0.0:
+        # 단위가 없는 경우 원 단위로 처리
+        number_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?)', amount_part)
+        if number_match:
+          amount = float(number_match.group(1).replace(',', ''))
+      
+      return amount, year
+      
+    except (ValueError, AttributeError) as e:
+      print(f"재무 데이터 파싱 중 오류 발생: {str(e)}")
+      return 0.0, None
+
+def amount_field(field_name):
+  return f"{field_name}_amount"
+
+def year_field(field_name):
+  return f"{field_name}_year"
+
+def build_financial_fields(company, with_unparsable=False):
+  """재무 문자열 필드를 파싱한 숫자 필드 (랭킹 집계/인덱스용)
+
+  with_unparsable=True면 필드는 있지만 빈 문자열이거나 문자열이 아닌 값도 null 숫자 필드로 채운다.
+  """
+  fields = {}
+  for field_name in FINANCIAL_FIELDS:
+    value = company.get(field_name)
+    if not isinstance(value, str) or not value:
+      if with_unparsable and field_name in company:
+        fields[amount_field(field_name)] = None
+        fields[year_field(field_name)] = None
+      continue
+    amount, year = FinancialDataParser.parse_financial_amount(value)
+    fields[amount_field(field_name)] = amount
+    fields[year_field(field_name)] = year
+  return fields
@@ -0,0 +1,66 @@
+import threading
+from bisect import bisect_left, insort
+from .text_utils import decompose_jamo, extract_chosung, is_chosung_query
+
+class NameIndex:
+  """이름 접두어 검색용 메모리 인덱스 (입력 중 자동완성)
+
+  (키, 이름) 정렬 배열 두 개를 이분 탐색한다.
+  - 자모 키: decompose_jamo(이름) → "삼서", "삼ㅅ"처럼 입력 중인 글자도 접두어로 일치
+  - 초성 키: extract_chosung(이름) → "ㅅㅅㅈ" 같은 초성 검색
+  조회는 O(log n + limit), 추가는 배열 삽입(O(n) 메모리 이동)이다.
+  """
+  def __init__(self, names=()):
+    self._lock = threading.Lock()
+    self._names = set()
+    self._jamo = []
+    self._chosung = []
+    self.replace(names)
+
+  def replace(self, names):
+    """전체 이름 목록으로 다시 생성 (조회 중에도 이전 배열을 그대로 사용할 수 있도록 교체)"""
+    unique = {name for name in names if name}
+    jamo = sorted((decompose_jamo(name), name) for name in unique)
+    chosung = sorted((extract_chosung(name), name) for name in unique)
+    with self._lock:
+      self._names, self._jamo, self._chosung = unique, jamo, chosung
+
+  def add(self, name):
+    """이름 하나 추가 (이미 있으면 무시)"""
+    if not name:
+      return False
+    with self._lock:
+      if name in self._names:
+        return False
+      self._names.add(name)
+      insort(self._jamo, (decompose_jamo(name), name))
+      insort(self._chosung, (extract_chosung(name), name))
+      return True
+
+  def __len__(self):
+    return len(self._names)
+
+  def __contains__(self, name):
+    return name in self._names
+
+  @staticmethod
+  def _prefix_scan(entries, prefix, limit, seen, result):
+    for i in range(bisect_left(entries, (prefix,)), len(entries)):
+      key, name = entries[i]
+      if len(result) >= limit or not key.startswith(prefix):
+        break
+      if name not in seen:
+        seen.add(name)
+        result.append(name)
+
+  def search(self, query, limit=10):
+    """query로 시작하는 이름 최대 limit개 (자모 일치 우선, 초성 검색어면 초성 일치 추가)"""
+    prefix = decompose_jamo(query)
+    if not prefix or limit <= 0:
+      return []
+    jamo, chosung = self._jamo, self._chosung
+    result, seen = [], set()
+    self._prefix_scan(jamo, prefix, limit, seen, result)
+    if len(result) < limit and is_chosung_query(query):
+      self._prefix_scan(chosung, extract_chosung(query), limit, seen, result)
+    return result
@@ -1,13 +1,13 @@
 # app/utils/news_keywords_cache_utils.py
 from hashlib import md5
 from app.database.redis_client import redis_client
+from app.utils.cache_metrics import cache_metrics
 from datetime import datetime
-import json
 
-def make_redis_key(prefix: str, **kwargs) -> str:
-    """Redis 키 생성 (prefix + 쿼리 파라미터 해시)"""
+async def make_redis_key(prefix: str, **kwargs) -> str:
+    """Redis 키 생성 (prefix + 네임스페이스 세대 번호 + 쿼리 파라미터 해시)"""
     raw = "|".join(f"{k}={','.join(v) if isinstance(v, list) else v}" for k, v in sorted(kwargs.items()))
-    return f"{prefix}:{md5(raw.encode()).hexdigest()}"
+    return await redis_client.namespace_key(prefix, md5(raw.encode()).hexdigest())
 
 
 async def get_or_cache(prefix: str, fetch_func, ttl: int, **params):
@@ -18,17 +18,16 @@ async def get_or_cache(prefix: str, fetch_func, ttl: int, **params):
     - ttl: 캐시 유지 시간 (초)
     - params: 키 구성 및 Mongo 함수 인자로 사용됨
     """
-    redis_key = make_redis_key(prefix, **params)
+    redis_key = await make_redis_key(prefix, **params)
 
     # 1️⃣ 캐시 조회
     cached = await redis_client.get_json(redis_key)
     if cached:
-        print(f"📦 [Redis] 캐시 HIT → {prefix}")
         return cached
 
     # 2️⃣ 캐시 없으면 MongoDB 조회
-    print(f"🔍 [MongoDB] DB 조회 실행 → {prefix}")
-    result = await fetch_func(**params)
+    with cache_metrics.fill_timer(prefix):
+        result = await fetch_func(**params)
 
     # 3️⃣ 직렬화 함수
     def serialize(obj):
@@ -45,9 +44,9 @@ async def get_or_cache(prefix: str, fetch_func, ttl: int, **params):
         try:
             serialized_result = serialize(result)
             await redis_client.set_json(redis_key, serialized_result, expire=ttl)
-            print(f"🗓 Redis 저장 결과: {json.dumps(serialized_result, ensure_ascii=False)}")
         except Exception as e:
             print(f"⚠️ Redis 저장 오류 ({redis_key}): {e}")
+            cache_metrics.record_error(prefix, "set")
     else:
         print(f"⚠️ 결과가 비어 있어 Redis에 저장하지 않음: {redis_key}")
 
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+from app.config import settings
+from app.database.redis_client import redis_client
+
+LOCK_KEY_PREFIX = "single_flight"
+
+class SingleFlight:
+  """같은 키에 대한 동시 계산을 하나로 합치는 유틸리티
+
+  - 워커 내부: 키별 asyncio Future를 공유해 먼저 들어온 요청의 결과를 함께 사용
+  - 워커 간: Redis 락을 잡은 워커만 계산하고, 나머지는 캐시가 채워질 때까지 대기
+  """
+  def __init__(self):
+    self._inflight: Dict[str, asyncio.Future] = {}
+
+  def is_running(self, key: str) -> bool:
+    """현재 워커에서 해당 키의 계산이 진행 중인지 확인"""
+    return key in self._inflight
+
+  async def run(
+    self,
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    check_cache: Optional[Callable[[], Awaitable[Any]]] = None,
+    lock_ttl: Optional[float] = None,
+    wait_timeout: Optional[float] = None
+  ) -> Any:
+    """키 단위로 compute를 한 번만 실행하고 결과를 공유
+
+    check_cache는 다른 워커가 계산을 끝냈는지 확인할 때 사용하며,
+    값이 없으면 None을 반환해야 한다.
+    """
+    future = self._inflight.get(key)
+    if future is not None:
+      # 같은 워커에서 이미 계산 중이면 그 결과를 기다림
+      return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    # 기다리는 요청이 없을 때 예외 미확인 경고가 나지 않도록 처리
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    self._inflight[key] = future
+
+    try:
+      result = await self._run_with_lock(
+        key, compute, check_cache, lock_ttl, wait_timeout)
+      future.set_result(result)
+      return result
+    except asyncio.CancelledError:
+      future.cancel()
+      raise
+    except Exception as e:
+      future.set_exception(e)
+      raise
+    finally:
+      self._inflight.pop(key, None)
+
+  async def try_run(
+    self,
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    lock_ttl: Optional[float] = None
+  ) -> Any:
+    """이미 어느 워커에서든 계산 중이면 실행하지 않고 None 반환 (백그라운드 갱신용)"""
+    if key in self._inflight:
+      return None
+
+    future = asyncio.get_running_loop().create_future()
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    self._inflight[key] = future
+
+    lock_key = f"{LOCK_KEY_PREFIX}:{key}"
+    token = uuid.uuid4().hex
+    acquired = False
+    try:
+      if redis_client.is_connected:
+        acquired = await redis_client.acquire_lock(
+          lock_key, token, lock_ttl or settings.single_flight_lock_ttl_seconds)
+        if not acquired:
+          future.set_result(None)
+          return None
+      result = await compute()
+      future.set_result(result)
+      return result
+    except asyncio.CancelledError:
+      future.cancel()
+      raise
+    except Exception as e:
+      future.set_exception(e)
+      raise
+    finally:
+      if acquired:
+        await redis_client.release_lock(lock_key, token)
+      self._inflight.pop(key, None)
+
+  async def _run_with_lock(self, key, compute, check_cache, lock_ttl, wait_timeout):
+    """Redis 락으로 워커 간 중복 계산 방지"""
+    if not redis_client.is_connected:
+      return await compute()
+
+    lock_key = f"{LOCK_KEY_PREFIX}:{key}"
+    lock_ttl = lock_ttl or settings.single_flight_lock_ttl_seconds
+    token = uuid.uuid4().hex
+
+    if await redis_client.acquire_lock(lock_key, token, lock_ttl):
+      try:
+        return await compute()
+      finally:
+        await redis_client.release_lock(lock_key, token)
+
+    # 다른 워커가 계산 중 → 결과가 캐시에 들어올 때까지 대기
+    print(f"⏳ 다른 워커의 계산 결과 대기: {key}")
+    wait_timeout = wait_timeout or settings.single_flight_wait_timeout_seconds
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+      await asyncio.sleep(settings.single_flight_poll_interval_seconds)
+      if check_cache is not None:
+        cached = await check_cache()
+        if cached is not None:
+          return cached
+      if not await redis_client.exists(lock_key):
+        break
+
+    # 락이 풀렸는데 결과가 없거나 대기 시간 초과 → 직접 계산
+    if check_cache is not None:
+      cached = await check_cache()
+      if cached is not None:
+        return cached
+    return await compute()
+
+# 전역 인스턴스
+single_flight = SingleFlight()
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Set, Tuple
+from app.config import settings
+from app.database.redis_client import redis_client
+from app.utils.single_flight import single_flight
+
+SWR_MARKER = "_swr"
+FRESHNESS_CHECK_KEY_PREFIX = "swr_checked"
+
+class StaleWhileRevalidate:
+  """soft 만료(stale-while-revalidate) 캐시 항목 관리
+
+  캐시 값을 {"_swr": 1, "soft_expires_at": ..., "value": ...} 형태로 감싸 저장하고,
+  soft 만료가 지난 값은 즉시 반환한 뒤 백그라운드 작업 하나가 갱신한다.
+  hard TTL(= soft TTL + swr_stale_grace_seconds)이 지나면 Redis에서 삭제된다.
+  """
+  def __init__(self):
+    self._tasks: Set[asyncio.Task] = set()
+
+  def wrap(self, value: Any, soft_ttl: int) -> dict:
+    """soft 만료 시각과 함께 캐시 항목 생성"""
+    return {
+      SWR_MARKER: 1,
+      "soft_expires_at": time.time() + soft_ttl,
+      "value": value
+    }
+
+  def unwrap(self, entry: Any) -> Tuple[Any, bool]:
+    """캐시 항목에서 (값, soft 만료 여부) 반환 (이전 형식 값은 그대로 반환)"""
+    if isinstance(entry, dict) and entry.get(SWR_MARKER):
+      return entry.get("value"), time.time() >= entry.get("soft_expires_at", 0)
+    return entry, False
+
+  def hard_ttl(self, soft_ttl: int) -> int:
+    """Redis에 실제로 설정할 만료 시간"""
+    return soft_ttl + settings.swr_stale_grace_seconds
+
+  def _spawn(self, coro):
+    """백그라운드 작업 실행 (완료 전까지 참조 유지)"""
+    task = asyncio.create_task(coro)
+    self._tasks.add(task)
+    task.add_done_callback(self._tasks.discard)
+    return task
+
+  def schedule_refresh(self, key: str, refresh: Callable[[], Awaitable[Any]]):
+    """키 갱신 작업을 백그라운드로 예약 (이미 갱신 중이면 무시)"""
+    if single_flight.is_running(key):
+      return
+    self._spawn(self._refresh(key, refresh))
+
+  def schedule_freshness_check(
+    self,
+    key: str,
+    is_outdated: Callable[[], Awaitable[bool]],
+    refresh: Callable[[], Awaitable[Any]]
+  ):
+    """응답 이후 원본 변경 여부를 확인하고, 바뀌었으면 갱신 (키별 최소 간격 유지)"""
+    self._spawn(self._check_freshness(key, is_outdated, refresh))
+
+  async def _refresh(self, key, refresh):
+    """워커 전체에서 하나의 갱신만 실행"""
+    try:
+      await single_flight.try_run(key, refresh)
+    except Exception as e:
+      print(f"⚠️ 백그라운드 캐시 갱신 실패 ({key}): {e}")
+
+  async def _check_freshness(self, key, is_outdated, refresh):
+    """최근에 확인하지 않은 키만 원본 변경 여부 확인"""
+    try:
+      marker_key = f"{FRESHNESS_CHECK_KEY_PREFIX}:{key}"
+      if redis_client.is_connected:
+        checked = await redis_client.acquire_lock(
+          marker_key, "1", settings.swr_freshness_check_interval_seconds)
+        if not checked:
+          return
+      if await is_outdated():
+        print(f"🚨 원본 변경 감지 → 백그라운드 캐시 갱신: {key}")
+        await self._refresh(key, refresh)
+    except Exception as e:
+      print(f"⚠️ 캐시 최신 여부 확인 실패 ({key}): {e}")
+
+# 전역 인스턴스
+stale_cache = StaleWhileRevalidate()
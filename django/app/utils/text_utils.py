@@ -1,7 +1,130 @@
 import re
+import hashlib
 
 def is_summary_empty(summary: str) -> bool:
     if not isinstance(summary, str):
         return True
     # 한글, 영문, 숫자 포함 안되면 비어있는 것으로 판단
     return not bool(re.search(r"[가-힣a-zA-Z0-9]", summary))
+
+
+# ✅ 부분 문자열 검색용 n-gram 필드
+# - 저장 시: 공백 제거 + 소문자화한 문자열의 1-gram/2-gram을 <field>_ngrams 배열로 함께 저장
+# - 조회 시: 검색어의 n-gram을 {"$all": [...]}로 찾은 뒤(인덱스 사용) 실제 부분 문자열인지 다시 확인
+#   → 기존 {"$regex": 검색어, "$options": "i"}와 같은 결과
+NGRAM_SIZE = 2
+# 정규식 특수문자가 들어간 검색어는 기존처럼 $regex로 처리
+_REGEX_SPECIAL = re.compile(r"[\\^$.|?*+()\[\]{}]")
+
+_CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+
+# 자모 분해용 중성/종성 (겹모음/겹받침은 입력 순서대로 나눔: ㅘ → ㅗㅏ, ㄺ → ㄹㄱ)
+_JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+    "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"
+]
+_JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+# 단독으로 입력된 겹자모 (예: 검색어 끝의 ㄳ)
+_COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+    "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"
+}
+
+
+def normalize_search_text(text) -> str:
+    """공백 제거 + 소문자화"""
+    return re.sub(r"\s+", "", str(text or "")).lower()
+
+
+def extract_chosung(text) -> str:
+    """한글 음절은 초성으로 바꾸고 나머지 문자는 그대로 (예: 삼성전자 → ㅅㅅㅈㅈ)"""
+    result = []
+    for ch in normalize_search_text(text):
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(_CHOSUNG[code // 588])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def is_chosung_query(text) -> bool:
+    """초성 검색어인지 (한글 음절 없이 초성이 하나 이상 포함, 예: ㅅㅅㅈㅈ, lgㅈ)"""
+    normalized = normalize_search_text(text)
+    return any(ch in _CHOSUNG_SET for ch in normalized) and extract_chosung(normalized) == normalized
+
+
+def decompose_jamo(text) -> str:
+    """
+    한글 음절을 입력 순서의 자모로 분해 (예: 삼성 → ㅅㅏㅁㅅㅓㅇ)
+    - 입력 중인 검색어(삼서, 삼ㅅ)가 완성된 이름(삼성)의 접두어가 되도록 겹모음/겹받침도 나눔
+    """
+    result = []
+    for ch in normalize_search_text(text):
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            result.append(_CHOSUNG[code // 588])
+            result.append(_JUNGSEONG[(code % 588) // 28])
+            result.append(_JONGSEONG[code % 28])
+        else:
+            result.append(_COMPOUND_JAMO.get(ch, ch))
+    return "".join(result)
+
+
+def build_ngrams(text, n: int = NGRAM_SIZE) -> list:
+    """저장용 토큰: 정규화된 문자열의 1-gram ~ n-gram (한 글자 검색어도 인덱스로 찾을 수 있도록)"""
+    normalized = normalize_search_text(text)
+    grams = set()
+    for size in range(1, n + 1):
+        grams.update(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+    return sorted(grams)
+
+
+def query_ngrams(text, n: int = NGRAM_SIZE) -> list:
+    """검색어 토큰: 정규화된 검색어의 n-gram (n보다 짧으면 검색어 그대로)"""
+    normalized = normalize_search_text(text)
+    if len(normalized) < n:
+        return [normalized] if normalized else []
+    return sorted({normalized[i:i + n] for i in range(len(normalized) - n + 1)})
+
+
+def build_search_fields(field: str, text) -> dict:
+    """문서에 함께 저장할 검색 필드 ({field}_ngrams)"""
+    return {f"{field}_ngrams": build_ngrams(text)}
+
+
+def build_substring_query(field: str, text) -> dict:
+    """field에 text가 포함된 문서 조회 조건 (n-gram 인덱스 사용, 불가능하면 $regex)"""
+    grams = query_ngrams(text)
+    if not grams or _REGEX_SPECIAL.search(str(text)):
+        return {field: {"$regex": text, "$options": "i"}}
+    return {f"{field}_ngrams": {"$all": grams}}
+
+
+def contains_text(value, text) -> bool:
+    """n-gram 후보 문서가 실제로 text를 포함하는지 확인 (대소문자 무시, $regex 경로는 그대로 통과)"""
+    if not query_ngrams(text) or _REGEX_SPECIAL.search(str(text)):
+        return True
+    return str(text).lower() in str(value or "").lower()
+
+
+def make_article_key(title, date, press="") -> str:
+    """
+    ✅ 기사 고유 키 (정규화한 제목 + 날짜 + 언론사의 SHA-1)
+    - 공백/대소문자 차이만 있는 같은 기사는 같은 키
+    - 같은 날 같은 제목이라도 언론사가 다르면 다른 기사
+    """
+    raw = "|".join([
+        normalize_search_text(title),
+        str(date or "").strip(),
+        normalize_search_text(press),
+    ])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
@@ -17,8 +17,9 @@ from selenium.common.exceptions import (
 
 from .driver import undetected_driver  # ✅ 사용자 정의 우회 드라이버 (필수)
 
-from app.database.db.crawling_database import get_existing_keys, find_summary_any_model
-from app.database.db.crawling_database import find_existing_article
+from app.database.db.crawling_database import find_summary_any_model
+from app.database.db.crawling_database import load_article_bloom, filter_existing_keys
+from app.utils.text_utils import make_article_key
 
 
 
@@ -151,36 +152,64 @@ def click_apply(driver, wait):
     apply_btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "button.news-search-btn")))
     driver.execute_script("arguments[0].click();", apply_btn)
 
-def extract_article_content(driver, article_el, global_index, existing_keys=None, model=None):
+def read_article_meta(article_el):
+    """목록 요소에서 팝업을 열지 않고 메타데이터(title/press/link/date/writer)만 읽기"""
+    title = article_el.find_element(By.CSS_SELECTOR, ".title-elipsis").get_attribute("innerText").strip()
+
+    try:
+        press_el = article_el.find_element(By.CSS_SELECTOR, "a.provider")
+        press = press_el.get_attribute("innerText").strip()
+        link = press_el.get_attribute("href") or ""
+    except Exception:
+        press, link = "(언론사 없음)", ""
+
+    date, writer = "", ""
+    for el in article_el.find_elements(By.CSS_SELECTOR, "p.name"):
+        txt = (el.get_attribute("innerText") or "").strip()
+        if re.match(r"\d{4}/\d{2}/\d{2}", txt):
+            date = txt
+        elif "기자" in txt or "@" in txt:
+            writer = txt
+
+    return {"title": title, "press": press, "link": link, "date": date, "writer": writer}
+
+def read_page_metas(elements):
+    """✅ 페이지 목록 요소별 메타데이터 (요소와 같은 순서, 읽기 실패한 요소는 None)"""
+    metas = []
+    for el in elements:
+        try:
+            metas.append(read_article_meta(el))
+        except Exception:
+            metas.append(None)
+    return metas
+
+def find_page_existing_keys(metas, bloom):
+    """
+    ✅ 현재 페이지 기사 중 DB에 이미 저장된 article_key 집합
+    - metas: read_page_metas() 결과
+    - 블룸 필터(로컬)로 후보만 고른 뒤 후보만 DB에서 한 번에 확인
+    """
+    return filter_existing_keys([article_key(meta) for meta in metas if meta], bloom)
+
+def extract_article_content(driver, article_el, global_index, existing_keys=None, model=None, meta=None):
     """
     stale element 방지 버전.
     - 매번 fresh 요소로 다시 찾는다.
     - 팝업 열기 전 메타데이터(title/press/date 등) 먼저 뽑는다.
     - 팝업은 열고 내용만 뽑은 뒤 ESC로 닫는다.
+    - existing_keys: 이 페이지에서 DB에 이미 있는 article_key 집합 (find_page_existing_keys)
+    - meta: 페이지에서 미리 읽은 메타데이터 (read_page_metas, 없으면 여기서 읽음)
     """
     try:
         wait = WebDriverWait(driver, 10)
 
         # --- 팝업 열기 전에 필요한 정보 뽑기 (DOM 변경 전에 안전하게) ---
-        title = article_el.find_element(By.CSS_SELECTOR, ".title-elipsis").get_attribute("innerText").strip()
-
-        try:
-            press_el = article_el.find_element(By.CSS_SELECTOR, "a.provider")
-            press = press_el.get_attribute("innerText").strip()
-            link = press_el.get_attribute("href") or ""
-        except Exception:
-            press, link = "(언론사 없음)", ""
-
-        date, writer = "", ""
-        for el in article_el.find_elements(By.CSS_SELECTOR, "p.name"):
-            txt = (el.get_attribute("innerText") or "").strip()
-            if re.match(r"\d{4}/\d{2}/\d{2}", txt):
-                date = txt
-            elif "기자" in txt or "@" in txt:
-                writer = txt
+        meta = meta or read_article_meta(article_el)
+        title, press, link = meta["title"], meta["press"], meta["link"]
+        date, writer = meta["date"], meta["writer"]
 
         # ✅ 여기서 중복 여부 확인 → 중복이면 팝업 열지 않고 스킵
-        if existing_keys is not None and (title, date, press, link) in existing_keys:
+        if existing_keys is not None and article_key(meta) in existing_keys:
             print(f"⏭ 중복기사 스킵(본문 미수집): [{date}] {press} | {title[:40]}...")
 
             # ✅ DB에서 summary 보완 시도
@@ -416,14 +445,16 @@ def goto_page(driver, target_page: int, wait=None, logger_prefix=""):
 MAX_RETRY = 4  # 필요시 조절
 
 
-def crawl_page_range(proc_id, page_range, config, per_page, existing_keys=None):
+def crawl_page_range(proc_id, page_range, config, per_page, skip_existing=False):
     """
     각 프로세스에서 담당 페이지 범위를 크롤링
     - page_range: (start_page, end_page)
+    - skip_existing: DB에 있는 기사는 본문 수집 생략 (프로세스마다 Redis에서 블룸 필터를 한 번 로딩)
     """
     start_page, end_page = page_range
     driver = None
     results = []
+    bloom = load_article_bloom() if skip_existing else None
 
     try:
         driver = undetected_driver(headless=True)
@@ -450,6 +481,10 @@ def crawl_page_range(proc_id, page_range, config, per_page, existing_keys=None):
                 # ✅ 이 줄이 핵심: 실제 길이(len)를 기준으로 돔을 매번 새로 읽어온다
                 fresh_elements = driver.find_elements(By.CSS_SELECTOR, "div.news-inner")
 
+                # ✅ 메타데이터는 페이지당 한 번만 읽어 기존 기사 확인(블룸 필터 후보만 DB 조회 1회)과 본문 수집에 같이 사용
+                page_metas = read_page_metas(fresh_elements)
+                page_existing = find_page_existing_keys(page_metas, bloom) if bloom is not None else None
+
                 for idx in range(len(fresh_elements)):
                     attempt = 0
                     while attempt <= MAX_RETRY:
@@ -464,8 +499,9 @@ def crawl_page_range(proc_id, page_range, config, per_page, existing_keys=None):
                             # ✅ 기존: extract_article_content(driver, el, global_index + idx + 1)
                             item = extract_article_content(
                                 driver, el, global_index + idx + 1,
-                                existing_keys=existing_keys,
-                                model=config.get("model")  # config에 model 추가 필요
+                                existing_keys=page_existing,
+                                model=config.get("model"),  # config에 model 추가 필요
+                                meta=page_metas[idx] if idx < len(page_metas) else None
                             )
 
                             if item:
@@ -511,19 +547,21 @@ def crawl_page_range(proc_id, page_range, config, per_page, existing_keys=None):
             except:
                 pass
 
+def article_key(item):
+    """✅ 기사 고유 키 (DB의 article_key와 동일: 정규화 제목 + 날짜 + 언론사)"""
+    return make_article_key(item.get("title") or "", item.get("date") or "", item.get("press") or "")
+
 def deduplicate(items):
     seen = set()
     out = []
     for it in items:
-        title = it.get("title") or ""
-        date = it.get("date") or ""
-        key = f"{title}|{date}"
+        key = article_key(it)
         if key not in seen:
             out.append(it)
             seen.add(key)
     return out
 
-def count_duplicates(items, key_fn=lambda x: (x.get("title", ""), x.get("date", ""))):
+def count_duplicates(items, key_fn=article_key):
     """중복 기사 개수와 어떤 키가 중복됐는지를 반환"""
     keys = [key_fn(it) for it in items]
     c = Counter(keys)
@@ -556,13 +594,13 @@ def auto_parallel_crawl(config):
     apply_speed_up(driver)
 
 
-    # ✅ 크롤 시작 전에 DB에 저장된 메타 키셋을 한 번 로딩
-    try:
-        existing_keys = get_existing_keys()
-        print(f"🗂 기존 저장 기사 키 개수: {len(existing_keys)}")
-    except Exception as e:
-        print(f"⚠️ 기존 키 로딩 실패(스킵): {e}")
-        existing_keys = None
+    # ✅ 저장 기사 블룸 필터 확인 (없으면 여기서 한 번 생성, 워커는 Redis에서 각자 로딩)
+    bloom = load_article_bloom()
+    skip_existing = bloom is not None
+    if skip_existing:
+        print(f"🗂 기사 블룸 필터 사용 ({len(bloom.bits) // 1024}KB)")
+    else:
+        print("⚠️ 기사 블룸 필터 없음 → 기존 기사 확인 없이 크롤링")
 
     try:
         prepare_search(driver, config)
@@ -602,7 +640,7 @@ def auto_parallel_crawl(config):
         # 4) 병렬 실행
         args = []
         for i, pr in enumerate(page_ranges, start=1):
-            args.append((i, pr, config, per_page, existing_keys))
+            args.append((i, pr, config, per_page, skip_existing))
 
         t0 = time.time()
         with Pool(processes=processes) as pool:
@@ -615,11 +653,7 @@ def auto_parallel_crawl(config):
             merged_raw.extend(part)
 
         # 🔍 중복 개수 계산 (dedupe 이전)
-        total_dups, dup_map = count_duplicates(
-            merged_raw,
-            key_fn=lambda x: (x.get("title", ""), x.get("date", ""))  # 필요 시 press도 포함
-            # key_fn=lambda x: (x.get("title", ""), x.get("date", ""), x.get("press", ""))
-        )
+        total_dups, dup_map = count_duplicates(merged_raw, key_fn=article_key)
         print(f"\n🔍 중복 키 개수: {len(dup_map)}")
         print(f"📉 총 중복 기사 수: {total_dups}")
         print(f"🧾 dedupe 전 원본 수집: {len(merged_raw)}건")
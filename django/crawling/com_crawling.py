@@ -1,25 +1,49 @@
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
-import pymongo
 from datetime import datetime
+from app.config import settings
+from app.database.mongo_factory import get_sync_client
+import json
 import time
 import re
 import concurrent.futures
 import threading
 from .driver import company_crawler_driver
+from .wiki_infobox import (
+  WikipediaHttpFetcher, title_from_url, normalize_image_url, infobox_value, build_summary)
+from app.database.sync_redis import invalidate_namespace, publish_message
+from app.utils.text_utils import build_search_fields
+from app.utils.financial_parser import build_financial_fields
+
+# 기업 문서 수집 방식
+# - selenium: 브라우저로 문서를 열고 요소마다 WebDriver 호출
+# - http: MediaWiki parse API로 본문 HTML만 받아 lxml로 파싱 (브라우저 없음)
+COMPANY_CRAWL_ENGINES = ("selenium", "http")
 
 class CompanyCrawler:
-  def __init__(self, max_workers=4):
-    # MongoDB 연결 설정
-    self.client = pymongo.MongoClient('mongodb://localhost:27017/')
-    self.db = self.client['company_db']
+  def __init__(self, max_workers=4, engine=None):
+    # MongoDB 연결 설정 (프로세스 공용 커넥션 풀)
+    self.client = get_sync_client()
+    self.db = self.client[settings.mongodb_db]
     self.collection = self.db['companies']
     
     # 멀티스레딩 설정
     self.max_workers = max_workers
     
-    # 메인 드라이버 (기업 정보 수집용)
-    self.driver = company_crawler_driver()
+    self.engine = engine or settings.company_crawl_engine
+    if self.engine not in COMPANY_CRAWL_ENGINES:
+      raise ValueError(f"지원하지 않는 크롤링 방식입니다: {self.engine}")
+    self.fetcher = WikipediaHttpFetcher() if self.engine == "http" else None
+    
+    # 메인 드라이버 (분류 페이지 탐색 및 selenium 방식 기업 정보 수집용)
+    # http 방식은 분류 페이지를 탐색할 때 처음 생성
+    self._driver = company_crawler_driver() if self.engine == "selenium" else None
+
+  @property
+  def driver(self):
+    if self._driver is None:
+      self._driver = company_crawler_driver()
+    return self._driver
 
   def _crawl_single_company(self, company_data):
     """단일 기업 크롤링 (스레드에서 실행)"""
@@ -30,11 +54,8 @@ class CompanyCrawler:
         f"  {company_idx+1}/{total_companies}: {company_name} 정보 수집 중... "
         f"(스레드-{threading.current_thread().name})")
       
-      # 기업 페이지로 이동
-      self.driver.get(href)
-      
-      # infobox 정보 수집
-      company_info = self._extract_company_info(company_name)
+      # 기업 페이지의 infobox 정보 수집
+      company_info = self._fetch_company_info(company_name, href)
       
       if company_info:
         print(
@@ -50,6 +71,13 @@ class CompanyCrawler:
         f"❌ {company_idx+1}/{total_companies}: {company_name} 크롤링 오류 - {e}")
       return None
 
+  def _fetch_company_info(self, company_name, url):
+    """기업 문서에서 정보 수집 (http 방식은 API 요청 한 번, selenium 방식은 페이지 이동 후 추출)"""
+    if self.fetcher:
+      return self.fetcher.fetch_company_info(company_name, title_from_url(url))
+    self.driver.get(url)
+    return self._extract_company_info(company_name)
+
   def _extract_company_info(self, company_name):
     """기업 정보 추출"""  
     # infobox vcard 테이블이 있는지 확인
@@ -84,24 +112,16 @@ class CompanyCrawler:
           img_src = img_elements[0].get_attribute("src")
           if img_src:
             # 상대 경로를 절대 경로로 변환
-            if img_src.startswith('//'):
-              img_src = 'https:' + img_src
-            elif img_src.startswith('/'):
-              img_src = 'https://ko.wikipedia.org' + img_src
-            company_info['로고'] = img_src
+            company_info['로고'] = normalize_image_url(img_src)
       
       # 나머지 tr
       if th_elements and td_elements:
         # th 태그의 텍스트를 키로 사용
         key = th_elements[0].text.strip()
         
-        # td 태그의 텍스트를 값으로 사용 (img 태그 무시)
+        # td 태그의 텍스트를 값으로 사용 (img 태그 무시, "본문 참조"는 문서 링크로 대체)
         td_element = td_elements[0]
-        value = td_element.text.strip()
-        
-        # "본문 참조"인 경우 링크의 href 속성 가져오기
-        if value == "본문 참조":
-          value = "본문 참조 + https://ko.wikipedia.org/wiki/" + company_name
+        value = infobox_value(td_element.text.strip(), company_name)
         
         if key and value:
           company_info[key] = value
@@ -109,17 +129,8 @@ class CompanyCrawler:
     # 요약 정보
     summary_paragraphs = self.driver.find_elements(
       By.CSS_SELECTOR, "div.mw-parser-output > p")
-    if summary_paragraphs:
-      summary_text = ""
-      for p in summary_paragraphs[:3]:  # 첫 3개 문단만
-        text = p.text.strip()
-        if text:
-          # 참조 번호 [1], [2], ... 제거
-          text = re.sub(r'\[\d+\]', '', text)
-          summary_text += text + "\n\n"
-      company_info['summary'] = summary_text.strip()
-    else:
-      company_info['summary'] = ""
+    # 첫 3개 문단만 (참조 번호 제거)
+    company_info['summary'] = build_summary([p.text for p in summary_paragraphs[:3]])
 
     # 메타 정보 추가
     company_info['name'] = company_name
@@ -354,27 +365,49 @@ class CompanyCrawler:
       print(f"{category_name}에서 mw-category div를 찾을 수 없습니다.")
       return []
 
-  def save_to_mongodb(self, company_info):
-    try:
-      # 이름 중복 확인
-      existing = self.collection.find_one({
-        'name': company_info['name'],
-      })
-      
-      if existing:
-        print(f"'{company_info['name']}'의 정보가 이미 존재합니다.")
-        self.collection.update_one(
-          {'_id': existing['_id']},
-          {'$set': company_info}
-        )
-        print(f"{company_info['name']} 문서 수정 완료")
-      else:
-        self.collection.insert_one(company_info)
-        print("저장 완료")
-        
-    except Exception as e:
-      print(f"MongoDB 저장 중 오류 발생: {e}")
-  
+  def save_to_mongodb(self, company_info, notify=True):
+    """기업 정보 저장 (실패하면 예외를 올림)
+
+    notify=False면 캐시 무효화/저장 알림을 생략한다 (일괄 저장 후 notify_companies_saved로 한 번에).
+    """
+    # 기업명 부분 검색용 n-gram 필드와 랭킹용 재무 숫자 필드를 함께 저장
+    # (company_info 자체는 변경하지 않음)
+    document = {
+      **company_info,
+      **build_search_fields('name', company_info['name']),
+      **build_financial_fields(company_info)
+    }
+    
+    # 이름 중복 확인
+    existing = self.collection.find_one({
+      'name': company_info['name'],
+    })
+    
+    if existing:
+      print(f"'{company_info['name']}'의 정보가 이미 존재합니다.")
+      self.collection.update_one(
+        {'_id': existing['_id']},
+        {'$set': document}
+      )
+      print(f"{company_info['name']} 문서 수정 완료")
+    else:
+      self.collection.insert_one(document)
+      print("저장 완료")
+    
+    if notify:
+      self.notify_companies_saved([company_info['name']])
+
+  def notify_companies_saved(self, names):
+    """저장된 기업을 캐시/워커에 반영 (네임스페이스 무효화 1회씩 + 저장 알림 1건)"""
+    if not names:
+      return
+    # 이전에 '검색 결과 없음'으로 캐시된 검색어가 이 기업을 찾을 수 있도록 무효화
+    invalidate_namespace("company_search_negative")
+    # 갱신된 문서가 상세 조회에 바로 반영되도록 무효화
+    invalidate_namespace("company_detail")
+    # 각 워커의 기업명 자동완성 인덱스에 추가
+    publish_message("company_saved", names=list(names))
+
   def display_company_names(self, company_info_list):
     company_names = []
     for info in company_info_list:
@@ -388,45 +421,54 @@ class CompanyCrawler:
   def crawl_single_company_by_name(self, company_name: str):
     """
     단일 기업명으로 Wikipedia에서 직접 크롤링
-    search_service.py에서 사용하기 위한 메서드
+    search_service.py(크롤링 작업)에서 사용하기 위한 메서드
+
+    문서나 infobox가 없으면 None을 반환하고, 브라우저/네트워크/DB 오류는 예외를 그대로 올린다
+    (크롤링 작업이 실패로 기록되고 브라우저를 새로 만들도록).
     """
-    try:
-      # 1. 위키피디아에 접속해서 크롤링 진행
+    # 1. 위키피디아에서 기업 정보 수집
+    if self.fetcher:
+      company_info = self.fetcher.fetch_company_info(company_name)
+    else:
       wikipedia_url = f"https://ko.wikipedia.org/wiki/{company_name}"
       
       self.driver.get(wikipedia_url)
       time.sleep(1) 
       
-      company_info = self._extract_company_info(company_name)
-      
-      # 3. MongoDB에 저장
-      self.save_to_mongodb(company_info)
-      
-      # 4. JSON 직렬화
-      serializable_company = {}
-      for key, value in company_info.items():
-        if key != '_id':
-          try:
-            import json
-            json.dumps(value)
-            serializable_company[key] = value
-          except:
-            # 직렬화 불가능한 값은 문자열로 변환
-            serializable_company[key] = str(value)
-        
-      return serializable_company
-        
-    except Exception as e:
-      print(f"❌ '{company_name}' 크롤링 중 오류 발생: {e}")
+      try:
+        company_info = self._extract_company_info(company_name)
+      except NoSuchElementException:
+        # infobox 구조가 다른 문서 (tbody 없음 등)
+        print(f"'{company_name}' 페이지에서 기업 정보를 찾을 수 없습니다.")
+        return None
+    if not company_info:
       return None
+    
+    # 2. MongoDB에 저장
+    self.save_to_mongodb(company_info)
+    
+    # 3. JSON 직렬화
+    serializable_company = {}
+    for key, value in company_info.items():
+      if key != '_id':
+        try:
+          json.dumps(value)
+          serializable_company[key] = value
+        except (TypeError, ValueError):
+          # 직렬화 불가능한 값은 문자열로 변환
+          serializable_company[key] = str(value)
+      
+    return serializable_company
 
   def close_connection(self):
     # 메인 드라이버 종료
-    if self.driver:
-      self.driver.quit()
+    if self._driver:
+      self._driver.quit()
+      self._driver = None
+    if self.fetcher:
+      self.fetcher.close()
     
-    # MongoDB 연결 종료
-    self.client.close()
+    # MongoDB 클라이언트는 공용 풀이므로 닫지 않음 (앱 종료 시 close_sync_client)
 
 if __name__ == "__main__":
   # 멀티스레딩 크롤러 생성 (4개 스레드)
@@ -442,19 +484,23 @@ if __name__ == "__main__":
           f"  총 {len(company_info_list)}개 기업 정보 수집 완료")
     
     print(f"\n💾 MongoDB 저장 시작...")
-    saved_count = 0
+    saved_names = []
     failed_count = 0
     
     for i, company_info in enumerate(company_info_list, 1):
       try:
         print(f"  저장 중... ({i}/{len(company_info_list)})"
               f" {company_info.get('name')}")
-        crawler.save_to_mongodb(company_info)
-        saved_count += 1
+        # 캐시 무효화/저장 알림은 기업마다 하지 않고 끝난 뒤 한 번에
+        crawler.save_to_mongodb(company_info, notify=False)
+        saved_names.append(company_info['name'])
       except Exception as e:
         print(f"  ❌ '{company_info.get('name')}' 저장 실패: {e}")
         failed_count += 1
     
+    crawler.notify_companies_saved(saved_names)
+    saved_count = len(saved_names)
+    
     print(f"\n📊 MongoDB 저장 완료")
     print(f"  ✅ 성공: {saved_count}개")
     print(f"  ❌ 실패: {failed_count}개")
@@ -2,39 +2,40 @@ import re
 import time
 import random
 from selenium.webdriver.common.by import By
-import pymongo
+from selenium.common.exceptions import NoSuchElementException
 from datetime import datetime
+from app.config import settings
+from app.database.mongo_factory import get_sync_client
 from .driver import company_review_crawler_driver
 
 class CompanyReviewCrawler:
   def __init__(self):
-    # MongoDB 연결 설정
-    self.client = pymongo.MongoClient('mongodb://localhost:27017/')
-    self.db = self.client['company_db']
+    # MongoDB 연결 설정 (프로세스 공용 커넥션 풀)
+    self.client = get_sync_client()
+    self.db = self.client[settings.mongodb_db]
     self.collection = self.db['company_reviews']
 
     # 메인 드라이버 (리뷰 수집용)
     self.driver = company_review_crawler_driver()
 
   def crawl_single_company_reviews(self, company_name: str):
-    """TeamBlind 리뷰 크롤링"""
-    try:
-      # 1. 리뷰 페이지로 이동
-      review_url = f"https://www.teamblind.com/kr/company/{company_name}/reviews"
-      self.driver.get(review_url)
-      time.sleep(2)
-      
-      # 2. 리뷰 데이터 추출
-      reviews = self._extract_reviews(company_name)
-      
-      # 3. MongoDB 저장
-      self.save_reviews_to_db(reviews)
-      
-      return reviews
-        
-    except Exception as e:
-      print(f"❌ '{company_name}' 리뷰 크롤링 중 오류 발생: {e}")
-      return []
+    """TeamBlind 리뷰 크롤링 (크롤링 작업에서 사용)
+
+    리뷰가 없으면 빈 목록을 반환하고, 브라우저/DB 오류는 예외를 그대로 올린다
+    (크롤링 작업이 실패로 기록되고 브라우저를 새로 만들도록).
+    """
+    # 1. 리뷰 페이지로 이동
+    review_url = f"https://www.teamblind.com/kr/company/{company_name}/reviews"
+    self.driver.get(review_url)
+    time.sleep(2)
+    
+    # 2. 리뷰 데이터 추출
+    reviews = self._extract_reviews(company_name)
+    
+    # 3. MongoDB 저장
+    self.save_reviews_to_db(reviews)
+    
+    return reviews
 
   def _extract_reviews(self, company_name):
     """리뷰 데이터 추출"""
@@ -89,7 +90,8 @@ class CompanyReviewCrawler:
         }
         reviews.append(review_data)
             
-    except Exception as e:
+    except NoSuchElementException as e:
+      # 페이지 구조가 다름 (브라우저 오류는 호출한 쪽으로 올림)
       print(f"   리뷰 추출 중 오류: {e}")
     
     return reviews
@@ -275,40 +277,35 @@ class CompanyReviewCrawler:
     return all_reviews
 
   def save_reviews_to_db(self, reviews):
-    try:
-      if not reviews or len(reviews) == 0:
-        print("저장할 리뷰가 없습니다.")
-        return
-      
-      company_name = reviews[0].get('name')
-      
-      print("=== 리뷰 저장 시작 ===")
-      
-      # 기업별 리뷰 중복 확인
-      existing_reviews = self.collection.find_one({"name": company_name})
-      
-      if existing_reviews:
-        print(f"'{company_name}'의 리뷰가 이미 존재합니다.")
-        existing_count = self.collection.count_documents({"name": company_name})
-        print(f"기존 리뷰 개수: {existing_count}개")
-        print("💡 중복 방지를 위해 저장을 건너뜁니다.")
-        return
-      else:
-        # 새 리뷰 저장
-        result = self.collection.insert_many(reviews)
-        print(f"💾 '{company_name}' 리뷰 {len(result.inserted_ids)}개 저장 완료")
-
-    except Exception as e:
-      print(f"MongoDB 저장 중 오류 발생: {e}")
+    """리뷰 저장 (실패하면 예외를 올림)"""
+    if not reviews or len(reviews) == 0:
+      print("저장할 리뷰가 없습니다.")
+      return
+    
+    company_name = reviews[0].get('name')
+    
+    print("=== 리뷰 저장 시작 ===")
+    
+    # 기업별 리뷰 중복 확인
+    existing_reviews = self.collection.find_one({"name": company_name})
+    
+    if existing_reviews:
+      print(f"'{company_name}'의 리뷰가 이미 존재합니다.")
+      existing_count = self.collection.count_documents({"name": company_name})
+      print(f"기존 리뷰 개수: {existing_count}개")
+      print("💡 중복 방지를 위해 저장을 건너뜁니다.")
+      return
+    else:
+      # 새 리뷰 저장
+      result = self.collection.insert_many(reviews)
+      print(f"💾 '{company_name}' 리뷰 {len(result.inserted_ids)}개 저장 완료")
 
   def close_connection(self):
     # 리뷰 드라이버 종료
     if self.driver:
       self.driver.quit()
     
-    # MongoDB 연결 종료
-    if self.client:
-      self.client.close()
+    # MongoDB 클라이언트는 공용 풀이므로 닫지 않음 (앱 종료 시 close_sync_client)
 
 if __name__ == "__main__":
   crawler = CompanyReviewCrawler()
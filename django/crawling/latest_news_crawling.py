@@ -4,11 +4,12 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import time
 from .driver import undetected_driver  # 사용자 정의 우회 드라이버
-from app.database.db.crawling_database import get_existing_keys
+from app.database.db.crawling_database import load_article_bloom, filter_existing_keys
+from app.models.news_article import article_key_of
 
 
 
-def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = True) -> list:
+def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = True, skip_existing: bool = False) -> list:
     """
     ✅ 입력된 키워드에 대해 BigKinds 웹사이트에서 최신 뉴스 기사 정보를 크롤링하여 반환합니다.
 
@@ -16,6 +17,8 @@ def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = Tr
     - keyword (str): 검색할 키워드
     - max_articles (int): 수집할 최대 기사 수 (기본값: 5)
     - headless (bool): Chrome 브라우저를 화면에 띄우지 않고 백그라운드에서 실행할지 여부
+    - skip_existing (bool): DB에 이미 저장된 기사를 제외할지 여부
+      (블룸 필터로 후보를 거르고 후보만 DB에서 한 번에 확인)
 
     Returns:
     - results (list): 크롤링된 뉴스 기사 리스트 (딕셔너리 형태 포함)
@@ -27,13 +30,7 @@ def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = Tr
     wait = WebDriverWait(driver, 10)
     results = []
 
-    # ✅ 기존 DB에 저장된 (title, date) 키셋 로딩
-    try:
-        existing_keys = get_existing_keys()
-        print(f"🗂 기존 저장 기사 키 개수: {len(existing_keys)}")
-    except Exception as e:
-        print(f"⚠️ 기존 키 로딩 실패(스킵): {e}")
-        existing_keys = set()
+    candidates = []
 
 
     try:
@@ -61,11 +58,8 @@ def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = Tr
         soup = BeautifulSoup(driver.page_source, 'html.parser')
         news_items = soup.select('div.news-item')
 
-        # ✅ 기사 목록 순회 (단, 링크가 있는 기사만 최대 max_articles개 수집)
+        # ✅ 기사 목록 순회 (링크가 있는 기사만 후보로 수집)
         for item in news_items:
-            if len(results) >= max_articles:
-                break  # 원하는 기사 수만큼 수집하면 종료
-
             try:
                 # ✅ 링크 정보가 없는 기사는 제외
                 link_tag = item.select_one('a.provider')
@@ -81,13 +75,8 @@ def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = Tr
                 date = item.select('p.name')[0].get_text(strip=True) if len(item.select('p.name')) >= 1 else "N/A"
                 writer = item.select('p.name')[1].get_text(strip=True) if len(item.select('p.name')) >= 2 else "N/A"
 
-                key = (title, date)
-                if key in existing_keys:
-                    print(f"🚫 기존 기사 스킵: {title}")
-                    continue
-
-                # ✅ 결과 리스트에 추가
-                results.append({
+                # ✅ 후보 리스트에 추가
+                candidates.append({
                     "title": title,
                     "summary": summary,
                     "press": press,
@@ -106,5 +95,23 @@ def get_latest_articles(keyword: str, max_articles: int = 5, headless: bool = Tr
     finally:
         driver.quit()  # ✅ 크롬 드라이버 종료 (리소스 정리 필수)
 
+    # ✅ 기존 저장 기사 제외 (선택)
+    existing_keys = set()
+    if skip_existing and candidates:
+        try:
+            existing_keys = filter_existing_keys(
+                [article_key_of(a) for a in candidates], load_article_bloom()
+            )
+        except Exception as e:
+            print(f"⚠️ 기존 기사 확인 실패(스킵): {e}")
+
+    for article in candidates:
+        if len(results) >= max_articles:
+            break  # 원하는 기사 수만큼 수집하면 종료
+        if article_key_of(article) in existing_keys:
+            print(f"🚫 기존 기사 스킵: {article['title']}")
+            continue
+        results.append(article)
+
     return results
 
@@ -0,0 +1,184 @@
+import re
+from datetime import datetime
+from urllib.parse import unquote, urlparse
+import requests
+import lxml.html
+from app.config import settings
+
+WIKIPEDIA_BASE_URL = "https://ko.wikipedia.org"
+PARSE_API_URL = f"{WIKIPEDIA_BASE_URL}/w/api.php"
+
+# 요약으로 사용할 본문 첫 문단 수
+SUMMARY_PARAGRAPHS = 3
+
+# 브라우저의 element.text와 같게 보이지 않는 요소는 제외하고, 블록 요소는 줄을 나눔
+_SKIP_TAGS = {"style", "script", "link", "meta", "noscript"}
+_BLOCK_TAGS = {
+  "p", "div", "li", "ul", "ol", "dl", "dt", "dd", "table", "tr", "caption",
+  "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "center"
+}
+_REFERENCE_PATTERN = re.compile(r'\[\d+\]')
+_SPACE_PATTERN = re.compile(r'\s+')
+
+def _has_class(class_name):
+  """class 속성에 class_name이 포함된 요소 XPath 조건"""
+  return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+def normalize_image_url(src):
+  """이미지 src를 절대 URL로 변환 (//upload.wikimedia.org/..., /w/...)"""
+  if src.startswith('//'):
+    return 'https:' + src
+  if src.startswith('/'):
+    return WIKIPEDIA_BASE_URL + src
+  return src
+
+def infobox_value(value, company_name):
+  """infobox 값 정리 ("본문 참조"는 문서 링크로 대체)"""
+  if value == "본문 참조":
+    return "본문 참조 + https://ko.wikipedia.org/wiki/" + company_name
+  return value
+
+def build_summary(paragraph_texts):
+  """본문 첫 문단들로 요약 생성 (빈 문단 제외, 참조 번호 [1], [2], ... 제거)"""
+  summary_text = ""
+  for text in paragraph_texts[:SUMMARY_PARAGRAPHS]:
+    text = text.strip()
+    if text:
+      summary_text += _REFERENCE_PATTERN.sub('', text) + "\n\n"
+  return summary_text.strip()
+
+def title_from_url(url):
+  """위키피디아 문서 URL에서 문서 제목 추출 (https://ko.wikipedia.org/wiki/삼성전자 → 삼성전자)"""
+  path = urlparse(url).path
+  if '/wiki/' not in path:
+    return None
+  return unquote(path.split('/wiki/', 1)[1]).replace('_', ' ')
+
+def _is_hidden(element):
+  style = (element.get("style") or "").replace(" ", "").lower()
+  return "display:none" in style
+
+def _collect_text(element, parts):
+  if element.text:
+    parts.append(_SPACE_PATTERN.sub(" ", element.text))
+  for child in element:
+    # 주석/처리 명령은 tag가 문자열이 아님 (뒤따르는 tail만 사용)
+    if isinstance(child.tag, str) and child.tag not in _SKIP_TAGS and not _is_hidden(child):
+      if child.tag == "br":
+        parts.append("\n")
+      elif child.tag in _BLOCK_TAGS:
+        parts.append("\n")
+        _collect_text(child, parts)
+        parts.append("\n")
+      elif child.tag in ("td", "th"):
+        _collect_text(child, parts)
+        parts.append(" ")
+      else:
+        _collect_text(child, parts)
+    if child.tail:
+      parts.append(_SPACE_PATTERN.sub(" ", child.tail))
+
+def visible_text(element):
+  """Selenium element.text와 같은 형태의 텍스트 (줄 단위 공백 정리, 빈 줄 제거)
+
+  요소나 상위 요소가 display:none이면 브라우저처럼 빈 문자열을 반환한다.
+  """
+  if _is_hidden(element) or any(_is_hidden(parent) for parent in element.iterancestors()):
+    return ""
+  parts = []
+  _collect_text(element, parts)
+  lines = (line.strip() for line in "".join(parts).split("\n"))
+  return "\n".join(line for line in lines if line)
+
+def parse_company_page(html, company_name):
+  """위키피디아 문서 HTML에서 기업 정보 추출 (CompanyCrawler._extract_company_info와 같은 dict)
+
+  전체 문서 HTML과 MediaWiki parse API 본문(div.mw-parser-output) 모두 처리한다.
+  infobox가 없으면 None.
+  """
+  document = lxml.html.document_fromstring(html)
+
+  # infobox vcard 테이블이 있는지 확인
+  infobox_tables = document.xpath(f"//table[{_has_class('infobox')} and {_has_class('vcard')}]")
+  if not infobox_tables:
+    print(f"'{company_name}' 페이지에 없습니다.")
+    return None
+
+  # 브라우저 DOM과 같이 tbody 유무와 관계없이 모든 하위 tr 확인
+  tr_elements = infobox_tables[0].xpath(".//tr")
+  if not tr_elements:
+    print(f"'{company_name}' 페이지에 tr 태그가 없습니다.")
+    return None
+
+  company_info = {}
+  for i, tr in enumerate(tr_elements):
+    th_elements = tr.xpath(".//th")
+    td_elements = tr.xpath(".//td")
+
+    # 첫번째 tr에서는 img src만 가져오기 (로고)
+    if i == 0 and td_elements:
+      img_elements = td_elements[0].xpath(".//img")
+      if img_elements:
+        img_src = img_elements[0].get("src")
+        if img_src:
+          company_info['로고'] = normalize_image_url(img_src)
+
+    # 나머지 tr: th 텍스트를 키, td 텍스트를 값으로 사용
+    if th_elements and td_elements:
+      key = visible_text(th_elements[0])
+      value = infobox_value(visible_text(td_elements[0]), company_name)
+      if key and value:
+        company_info[key] = value
+
+  # 요약 정보
+  paragraphs = document.xpath(f"//div[{_has_class('mw-parser-output')}]/p")
+  company_info['summary'] = build_summary([visible_text(p) for p in paragraphs])
+
+  # 메타 정보 추가
+  company_info['name'] = company_name
+  company_info['crawled_at'] = datetime.now()
+
+  return company_info
+
+class WikipediaHttpFetcher:
+  """브라우저 없이 MediaWiki parse API로 문서 본문을 받아 infobox를 파싱
+
+  문서당 HTTP 요청 한 번(리다이렉트 포함)이며, 세션을 재사용해 연결을 유지한다.
+  requests.Session은 GET만 사용하면 여러 스레드에서 함께 써도 된다.
+  """
+  def __init__(self, session=None, timeout=None):
+    self.session = session or requests.Session()
+    self.session.headers["User-Agent"] = settings.wikipedia_user_agent
+    self.timeout = timeout or settings.wikipedia_http_timeout_seconds
+
+  def fetch_html(self, title):
+    """문서 본문 HTML (문서가 없으면 None)"""
+    response = self.session.get(PARSE_API_URL, params={
+      "action": "parse",
+      "page": title,
+      "prop": "text",
+      "redirects": 1,
+      "disableeditsection": 1,
+      "disabletoc": 1,
+      "format": "json",
+      "formatversion": 2
+    }, timeout=self.timeout)
+    response.raise_for_status()
+    data = response.json()
+
+    if "error" in data:
+      if data["error"].get("code") == "missingtitle":
+        return None
+      raise RuntimeError(f"위키피디아 API 오류 ({title}): {data['error'].get('info')}")
+    return data["parse"]["text"]
+
+  def fetch_company_info(self, company_name, title=None):
+    """기업 정보 수집 (title이 없으면 기업명을 문서 제목으로 사용)"""
+    html = self.fetch_html(title or company_name)
+    if html is None:
+      print(f"'{company_name}' 문서가 없습니다.")
+      return None
+    return parse_company_page(html, company_name)
+
+  def close(self):
+    self.session.close()
@@ -0,0 +1,70 @@
+import random
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+from app.utils import cache_codec
+
+SAMPLE_TEXTS = [
+  "워라밸이 좋고 복지가 잘 되어 있습니다. 연봉 인상률도 나쁘지 않아요",
+  "업무 강도가 높고 야근이 잦습니다. 의사결정 구조가 수직적입니다",
+  "동료들이 친절하고 배울 점이 많습니다. 교육 지원도 충분합니다",
+  "성과 평가 기준이 불투명하고 승진이 느린 편입니다",
+]
+
+def make_analysis_result(review_count):
+  """리뷰 분석 결과와 같은 구조의 샘플 데이터 생성"""
+  rows = []
+  for i in range(review_count):
+    pos = random.random()
+    rows.append({
+      'type': '장점' if i % 2 == 0 else '단점',
+      'text': random.choice(SAMPLE_TEXTS) + f" ({i})",
+      'positive_score': pos,
+      'negative_score': 1 - pos,
+      'satisfaction_score': round(pos * 5, 2)
+    })
+  scored_df = pd.DataFrame(rows)
+  summary = {'avg_score': 3.1, 'keywords': ['복지', '연봉', '워라밸'], 'sample_reviews': []}
+  return {'scored_df': scored_df, 'pros': summary, 'cons': summary}
+
+def measure(codec_name, value, repeat):
+  """인코딩/디코딩 평균 시간(ms)과 크기(bytes) 측정"""
+  codec = cache_codec.get_codec(codec_name)
+  start = time.perf_counter()
+  for _ in range(repeat):
+    encoded = codec.encode(value)
+  encode_ms = (time.perf_counter() - start) / repeat * 1000
+
+  start = time.perf_counter()
+  for _ in range(repeat):
+    decoded = cache_codec.decode(encoded)
+  decode_ms = (time.perf_counter() - start) / repeat * 1000
+
+  size = len(encoded.encode('utf-8')) if isinstance(encoded, str) else len(encoded)
+  assert decoded['scored_df'].shape == value['scored_df'].shape
+  return size, encode_ms, decode_ms
+
+def bench_cache_codec():
+  print("📦 리뷰 분석 캐시 코덱 벤치마크")
+  print("=" * 70)
+  print(f"{'리뷰 수':>8} {'코덱':>14} {'크기(KB)':>10} {'인코딩(ms)':>11} {'디코딩(ms)':>11}")
+  print("-" * 70)
+
+  for review_count in (100, 1000, 5000, 20000):
+    value = make_analysis_result(review_count)
+    repeat = 20 if review_count <= 1000 else 5
+    for codec_name in cache_codec.CODECS:
+      size, encode_ms, decode_ms = measure(codec_name, value, repeat)
+      print(f"{review_count:>8} {codec_name:>14} {size / 1024:>10.1f} "
+            f"{encode_ms:>11.2f} {decode_ms:>11.2f}")
+    print("-" * 70)
+
+if __name__ == "__main__":
+  try:
+    bench_cache_codec()
+  except KeyboardInterrupt:
+    print("\n프로그램을 종료합니다.")
@@ -0,0 +1,86 @@
+import time
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from crawling.wiki_infobox import parse_company_page
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'wikipedia')
+DEFAULT_COMPANIES = ["삼성전자", "LG전자", "현대자동차", "네이버", "카카오", "SK하이닉스"]
+
+def bench_parse(repeat=200):
+  """저장된 HTML로 lxml 파싱 시간만 측정 (네트워크 없음)"""
+  print("🧪 infobox 파싱 시간 (저장된 HTML, lxml)")
+  print("-" * 70)
+  for fixture in sorted(f for f in os.listdir(FIXTURE_DIR) if f.startswith("company_")):
+    with open(os.path.join(FIXTURE_DIR, fixture), encoding='utf-8') as f:
+      html = f.read()
+    start = time.perf_counter()
+    for _ in range(repeat):
+      parse_company_page(html, fixture)
+    elapsed_ms = (time.perf_counter() - start) / repeat * 1000
+    print(f"{fixture:>28} {len(html) / 1024:>8.1f}KB {elapsed_ms:>10.3f}ms")
+  print("-" * 70)
+
+def bench_engine(engine, companies):
+  """크롤러와 같은 경로로 기업 문서 수집 시간 측정 (MongoDB 저장 제외)"""
+  from crawling.com_crawling import CompanyCrawler
+
+  start = time.perf_counter()
+  crawler = CompanyCrawler(max_workers=1, engine=engine)
+  setup_ms = (time.perf_counter() - start) * 1000
+
+  results = {}
+  try:
+    for name in companies:
+      start = time.perf_counter()
+      info = crawler._fetch_company_info(name, f"https://ko.wikipedia.org/wiki/{name}")
+      results[name] = ((time.perf_counter() - start) * 1000, info)
+  finally:
+    crawler.close_connection()
+  return setup_ms, results
+
+def bench_company_crawler(companies, offline=False):
+  print("🕷️ 위키피디아 기업 정보 수집 벤치마크 (selenium vs http)")
+  print("=" * 70)
+  bench_parse()
+  if offline:
+    return
+
+  engines = {}
+  for engine in ("http", "selenium"):
+    try:
+      engines[engine] = bench_engine(engine, companies)
+    except Exception as e:
+      print(f"⚠️ {engine} 방식 실행 실패: {e}")
+
+  for engine, (setup_ms, results) in engines.items():
+    print(f"\n[{engine}] 준비(브라우저/세션 생성) {setup_ms:.0f}ms")
+    print(f"{'기업명':>14} {'시간(ms)':>10} {'항목 수':>8}")
+    for name, (elapsed_ms, info) in results.items():
+      print(f"{name:>14} {elapsed_ms:>10.0f} {len(info) if info else 0:>8}")
+    total = sum(elapsed_ms for elapsed_ms, _ in results.values())
+    print(f"{'기업당 평균':>14} {total / max(len(results), 1):>10.0f}")
+
+  # 두 방식의 결과가 같은지 확인 (수집 시각 제외)
+  if len(engines) == 2:
+    print("\n🔎 결과 비교 (crawled_at 제외)")
+    for name in companies:
+      http_info = engines["http"][1][name][1] or {}
+      selenium_info = engines["selenium"][1][name][1] or {}
+      diff = [
+        key for key in set(http_info) | set(selenium_info)
+        if key != 'crawled_at' and http_info.get(key) != selenium_info.get(key)
+      ]
+      print(f"{name:>14} {'일치' if not diff else '차이: ' + ', '.join(sorted(diff))}")
+
+if __name__ == "__main__":
+  # 사용법: python tests/bench_company_crawler.py [--offline] [기업명 ...]
+  args = sys.argv[1:]
+  offline = "--offline" in args
+  companies = [arg for arg in args if arg != "--offline"] or DEFAULT_COMPANIES
+  try:
+    bench_company_crawler(companies, offline)
+  except KeyboardInterrupt:
+    print("\n프로그램을 종료합니다.")
@@ -0,0 +1,119 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from crawling.wiki_infobox import (
+  WikipediaHttpFetcher, parse_company_page, title_from_url, normalize_image_url, build_summary)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'wikipedia')
+
+def load_fixture(name):
+  with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+    return f.read()
+
+class FakeResponse:
+  def __init__(self, data):
+    self.data = data
+
+  def raise_for_status(self):
+    pass
+
+  def json(self):
+    return self.data
+
+class FakeSession:
+  """requests.Session 대신 저장된 응답을 돌려주는 세션"""
+  def __init__(self, data):
+    self.data = data
+    self.headers = {}
+    self.requests = []
+
+  def get(self, url, params=None, timeout=None):
+    self.requests.append((url, params))
+    return FakeResponse(self.data)
+
+  def close(self):
+    pass
+
+def test_full_page_infobox():
+  info = parse_company_page(load_fixture('company_page.html'), '한빛전자')
+
+  assert info['name'] == '한빛전자'
+  assert info['로고'] == (
+    'https://upload.wikimedia.org/wikipedia/commons/thumb/a/ab/Hanbit_logo.svg/'
+    '220px-Hanbit_logo.svg.png')
+  assert info['형태'] == '주식회사'
+  assert info['산업 분야'] == '반도체, 가전'
+  # &nbsp;는 공백, 각주 번호는 infobox 값에 그대로 남음 (Selenium과 동일)
+  assert info['창립'] == '1969년 1월 13일[1]'
+  # <br>과 목록 항목은 줄바꿈
+  assert info['본사 소재지'] == '경기도 수원시\n영통구 삼성로 129'
+  assert info['핵심 인물'] == '홍길동 (대표이사)\n김철수 (이사회 의장)'
+  assert info['매출액'] == '▲ 300조 8,709억 원 (2024년)[2]'
+  assert info['자회사'] == '본문 참조 + https://ko.wikipedia.org/wiki/한빛전자'
+  assert info['웹사이트'] == 'www.hanbit.example'
+  # 화면에 보이지 않는 행은 제외
+  assert '숨김 항목' not in info
+
+def test_summary_uses_first_three_paragraphs():
+  info = parse_company_page(load_fixture('company_page.html'), '한빛전자')
+
+  # 첫 문단(빈 문단)을 포함한 3개 문단만, 각주 번호와 HTML 주석 제거
+  assert info['summary'] == (
+    '한빛전자(韓빛電子)는 대한민국의 전자 기업이다. 반도체와 가전을 주력으로 한다.\n\n'
+    '1969년 수원에서 설립되었으며, 1975년 한국거래소에 상장하였다.')
+
+def test_parse_api_fragment_without_tbody():
+  info = parse_company_page(load_fixture('company_parse_api.html'), '서린소프트')
+
+  assert info['로고'] == 'https://ko.wikipedia.org/w/extensions/Logos/seorin.png'
+  assert info['형태'] == '유한회사'
+  assert info['산업 분야'] == '소프트웨어'
+  # 키나 값이 비어 있는 행은 제외
+  assert '' not in info
+  assert '매출액' not in info
+  assert info['summary'] == '서린소프트는 대한민국의 소프트웨어 기업이다.'
+
+def test_page_without_company_infobox():
+  assert parse_company_page(load_fixture('disambiguation.html'), '한빛') is None
+
+@pytest.mark.parametrize('src, expected', [
+  ('//upload.wikimedia.org/a.png', 'https://upload.wikimedia.org/a.png'),
+  ('/static/images/a.png', 'https://ko.wikipedia.org/static/images/a.png'),
+  ('https://example.com/a.png', 'https://example.com/a.png'),
+])
+def test_normalize_image_url(src, expected):
+  assert normalize_image_url(src) == expected
+
+def test_title_from_url():
+  assert title_from_url(
+    'https://ko.wikipedia.org/wiki/%ED%95%9C%EB%B9%9B%EC%A0%84%EC%9E%90') == '한빛전자'
+  assert title_from_url('https://ko.wikipedia.org/wiki/LG_%EC%A0%84%EC%9E%90') == 'LG 전자'
+  assert title_from_url('https://ko.wikipedia.org/w/index.php?title=x') is None
+
+def test_build_summary_skips_empty_paragraphs():
+  assert build_summary(['', '첫 문단[1]', '  ', '넷째 문단']) == '첫 문단'
+
+def test_fetcher_parses_api_response():
+  session = FakeSession({'parse': {'title': '서린소프트', 'text': load_fixture('company_parse_api.html')}})
+  fetcher = WikipediaHttpFetcher(session=session)
+
+  info = fetcher.fetch_company_info('서린소프트')
+
+  assert info['형태'] == '유한회사'
+  assert session.headers['User-Agent']
+  url, params = session.requests[0]
+  assert url.endswith('/w/api.php')
+  assert params['page'] == '서린소프트'
+  assert params['redirects'] == 1
+
+def test_fetcher_missing_page():
+  session = FakeSession({'error': {'code': 'missingtitle', 'info': "The page you specified doesn't exist."}})
+  assert WikipediaHttpFetcher(session=session).fetch_company_info('없는기업') is None
+
+def test_fetcher_api_error():
+  session = FakeSession({'error': {'code': 'ratelimited', 'info': 'rate limited'}})
+  with pytest.raises(RuntimeError):
+    WikipediaHttpFetcher(session=session).fetch_company_info('한빛전자')